@@ -6,11 +6,11 @@
 
 from nicegui import ui
 import copy
-from typing import Callable, List, Dict, Any, Optional
+from typing import Callable, List, Dict, Any, Optional, Tuple
 # 修改点 1：修改导入路径，指向重构后的 config 目录
 from app.config.constants import (
     CARD_BASE_STYLE, THEME_CONFIG, COLOR_MAP,
-    PIE_CHART_TEMPLATE, BAR_CHART_TEMPLATE,
+    PIE_CHART_TEMPLATE, BAR_CHART_TEMPLATE, TREND_CHART_TEMPLATE,
     MODE_SETTINGS, CHART_UI, LAYOUT_CONFIG
 )
 # 修改点 2：引入 utils 里的跳转工具
@@ -115,6 +115,7 @@ def menu_card(mode_key: str, title: str, sub_title: str, icon: str, current_mode
     """渲染一级大卡片按钮 - 修改跳转逻辑"""
     is_active = (current_mode == mode_key)
     view_all_text = MODE_SETTINGS.get(mode_key, {}).get('view_all')
+    view_all_url = MODE_SETTINGS.get(mode_key, {}).get('view_all_url', '/details')
     cfg = THEME_CONFIG[mode_key]
     
     card_style = f'{CARD_BASE_STYLE} {cfg["active"] if is_active else THEME_CONFIG["default"]}'
@@ -131,7 +132,7 @@ def menu_card(mode_key: str, title: str, sub_title: str, icon: str, current_mode
                         if is_active and view_all_text:
                             ui.label('|').classes('opacity-30 text-xs')
                             # 修改点 3：使用 open_new_tab 工具函数，代替 ui.navigate
-                            ui.label(view_all_text).classes('text-[10px] font-bold underline cursor-pointer hover:text-white transition-colors').on('click.stop', lambda: open_new_tab('/details'))
+                            ui.label(view_all_text).classes('text-[10px] font-bold underline cursor-pointer hover:text-white transition-colors').on('click.stop', lambda: open_new_tab(view_all_url))
             
             ui.icon('expand_more' if not is_active else 'expand_less', size='32px')
 
@@ -151,9 +152,50 @@ def create_pie_chart(data: List[Dict], inner_radius: str = '35%', outer_radius:
     conf['series'][0].update({'radius': [inner_radius, outer_radius], 'roseType': 'area' if is_rose else False, 'data': data})
     return conf
 
+def _bar_series_data(raw_data: List[Dict]) -> List[Dict]:
+    return [{'value': item['value'], 'itemStyle': {'color': COLOR_MAP.get(item['name'], '#3b82f6'), 'borderRadius': CHART_UI['bar'].get('borderRadius', [6, 6, 0, 0])}} for item in raw_data]
+
 def create_bar_chart(raw_data: List[Dict]) -> Dict:
-    chart_data = [{'value': item['value'], 'itemStyle': {'color': COLOR_MAP.get(item['name'], '#3b82f6'), 'borderRadius': CHART_UI['bar'].get('borderRadius', [6, 6, 0, 0])}} for item in raw_data]
     conf = copy.deepcopy(BAR_CHART_TEMPLATE)
     conf['xAxis']['data'] = [item['name'] for item in raw_data]
-    conf['series'][0]['data'] = chart_data
-    return conf
\ No newline at end of file
+    conf['series'][0]['data'] = _bar_series_data(raw_data)
+    return conf
+
+def create_trend_chart(series: Dict[str, List[List[int]]]) -> Dict:
+    """
+    功能：生成趋势折线图配置（时间轴，按状态各一条折线）。
+    入参：series (Dict): {状态中文名: [[毫秒时间戳, 计数], ...]}，点数已在服务端降采样。
+    """
+    conf = copy.deepcopy(TREND_CHART_TEMPLATE)
+    conf['series'] = [
+        {
+            'name': name, 'type': 'line', 'showSymbol': False, 'data': points,
+            'itemStyle': {'color': COLOR_MAP.get(name, '#3b82f6')}, 'lineStyle': {'width': 2}
+        }
+        for name, points in series.items()
+    ]
+    return conf
+
+def _name_values(data: Optional[List[Dict]]) -> List[tuple]:
+    return [(item['name'], item['value']) for item in data or []]
+
+def create_chart_patches(data: List[Dict], shown: Optional[List[Dict]] = None) -> Tuple[Optional[Dict], Optional[Dict]]:
+    """
+    功能：对比客户端当前展示的数据与最新数据，生成只包含变化部分的 setOption 增量配置。
+    入参：
+        - data (List[Dict]): 最新统计数据 [{'name', 'value'}]。
+        - shown (List[Dict], 可选): 客户端当前展示的数据。
+    出参：(饼图增量, 柱状图增量)；数据未变化时均为 None。
+    """
+    if _name_values(data) == _name_values(shown):
+        return None, None
+
+    pie_data = copy.deepcopy(data)
+    for item in pie_data:
+        if item['name'] in COLOR_MAP:
+            item['itemStyle'] = {'color': COLOR_MAP[item['name']]}
+    bar_patch = {'series': [{'data': _bar_series_data(data)}]}
+    names = [item['name'] for item in data]
+    if names != [item['name'] for item in shown or []]:
+        bar_patch['xAxis'] = {'data': names}
+    return {'series': [{'data': pie_data}]}, bar_patch
\ No newline at end of file
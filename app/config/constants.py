@@ -1,3 +1,4 @@
+import os
 from typing import Dict, Any
 
 # --- 全局布局与样式 ---
@@ -8,7 +9,144 @@ LAYOUT_CONFIG = {
     'STAT_CARD_MARGIN': '-mt-25 -mr-16',
     'CHART_HEIGHT_MAIN': 'h-[300px]',
     'CHART_HEIGHT_BAR': 'h-[280px]',
-    'PAGE_SIZE': 15
+    'PAGE_SIZE': 15,
+    'VIRTUAL_TABLE_HEIGHT': 'h-[70vh]',
+    'VIRTUAL_ROW_HEIGHT': 48,      # 虚拟滚动行高（px），需与实际渲染行高一致
+    'VIRTUAL_WINDOW': 100,         # 虚拟滚动每次按需加载的行数
+    'VIRTUAL_MAX_ROWS': 1000,      # 单个客户端最多保留的行数，超出后滑动丢弃远端窗口
+    'SEARCH_DEBOUNCE_MS': 300,     # 检索输入防抖（毫秒）
+    'SEARCH_LIMIT': 50             # 单次检索最多展示的记录数
+}
+
+# --- 后端连接配置 ---
+BACKEND_CONFIG = {
+    'POOL_SIZE': 20,               # 进程级共享连接池大小（同一 host 的最大保活连接数）
+    'CONNECT_TIMEOUT': 3.05,       # 建连超时（秒）
+    'READ_TIMEOUT': 10,            # 读取超时（秒）
+    # 状态统计模式：'grouped' 单次分组计数 / 'per_status' 逐状态 limit=1 探测 / 'auto' 先探测分组接口，不可用时回退
+    'STATS_MODE': 'auto',
+    'COUNTS_PATH': 'counts',       # 分组计数接口相对 API_BASE 的路径
+    # 词条检索模式：'backend' 使用后端 search 参数 / 'local' 仅查本地索引 / 'auto' 后端不支持时自动回退本地
+    'SEARCH_MODE': 'auto',
+    'SEARCH_DEMOTE_AFTER': 3,          # auto 模式下连续多少次检测到后端不支持 search 参数后降级为只查本地索引
+    'SEARCH_DEMOTE_SECONDS': 600,      # 降级持续时长（秒），到期后重新尝试后端检索
+    'BREAKER_FAILURE_THRESHOLD': 5,    # 连续失败多少次后熔断，熔断期间直接回退缓存数据
+    'BREAKER_RECOVERY_TIMEOUT': 30,    # 熔断后多久（秒）放行一次探测请求
+    'HEDGE_ENABLED': False,            # 列表/统计等只读请求是否启用对冲请求
+    'HEDGE_DELAY': 0.5,                # 首个请求超过该时长（秒）未返回时发出对冲请求，建议取 p95 延迟
+    # 列表分页模式：'offset' 按 skip 偏移 / 'keyset' 已知上一页末行时按 (created_at, id) 游标翻页（需后端支持）
+    'PAGINATION_MODE': 'offset',
+    # 游标翻页参数名：请求“排在该 (created_at, id) 之后”的记录，后端需按 created_at、id 倒序稳定排序
+    'KEYSET_PARAMS': {
+        'created_at': 'after_created_at',
+        'id': 'after_id'
+    },
+    # 各调用点的耗时预算（秒），包含重试与退避，超出后直接放弃并回退缓存数据
+    'LATENCY_BUDGETS': {
+        'stats': 4,
+        'list': 6,
+        'search': 3,
+        'export': 30
+    }
+}
+
+# --- 缓存配置 ---
+CACHE_CONFIG = {
+    'STATS_TTL': 30,               # 状态统计新鲜期（秒），期内直接命中缓存
+    'STATS_STALE_TTL': 300,        # 过期后仍可先返回旧值、后台刷新的宽限期（秒）
+    'PAGE_TTL': 60,                # 详情页分页数据有效期（秒）
+    'PAGE_CACHE_SIZE': 200,        # 分页缓存最多保留的 (状态, 页码) 条目数
+    'PREFETCH_PAGES': True,        # 渲染第 N 页后是否后台预取 N+1 / N-1 页
+    'SEARCH_INDEX_SIZE': 50000,    # 本地检索索引最多保留的记录数
+    'CURSOR_CACHE_SIZE': 2000,     # 游标翻页时最多记住的 (状态, 页码) 起始游标数
+    'CURSOR_TTL': 1800             # 页面起始游标的保留时间（秒）
+}
+
+# --- 实时推送配置 ---
+LIVE_CONFIG = {
+    'POLL_INTERVAL': 15,           # 后台统一读取统计数据集的周期（秒），与在线客户端数量无关；状态统计经 TTL 缓存读取，上游请求频率由 STATS_TTL 决定
+    'MIN_PUSH_INTERVAL': 2         # 两轮拉取/推送之间的最小间隔（秒），期间的刷新请求会被合并
+}
+
+# --- 多进程部署配置（python multiworker.py）---
+MULTIWORKER_CONFIG = {
+    'HOST': '0.0.0.0',             # 对外监听地址（粘性会话代理）
+    'PORT': 8080,                  # 对外端口
+    'WORKERS': 0,                  # worker 进程数，0 表示等于可用 CPU 核数
+    'WORKER_BASE_PORT': 8100,      # worker i 监听 127.0.0.1:(WORKER_BASE_PORT + i)
+    'PIN_CORES': True,             # 是否把 worker i 绑定到第 i 个可用核（仅 Linux 支持）
+    'STICKY_COOKIE': 'dashboard_worker',  # 记录浏览器所属 worker 的 Cookie 名
+    'SHARED_CACHE_SIZE': 5000,     # 共享缓存最多保留的条目数
+    'SHARED_STATS_TTL': 10,        # 状态统计在共享缓存中的有效期（秒），应小于 LIVE_CONFIG['POLL_INTERVAL']
+    'SHARED_PAGE_TTL': 60,         # 分页数据在共享缓存中的有效期（秒）
+    'SHARED_SUMMARY_TTL': 120,     # 主导 worker（编号 0）发布的汇总统计与趋势的有效期（秒），至少每半个有效期重新发布一次
+    # 以下由 multiworker.py 经环境变量传给各 worker，单进程运行时为空
+    'WORKER_INDEX': os.environ.get('DASHBOARD_WORKER_INDEX', ''),
+    'WORKER_PORT': int(os.environ.get('DASHBOARD_WORKER_PORT', '') or 0),
+    'SHARED_CACHE_SOCKET': os.environ.get('DASHBOARD_SHARED_CACHE', '')
+}
+
+# --- 性能诊断配置 ---
+PROFILING_CONFIG = {
+    # 是否记录页面构建 / 等待数据 / 首次更新耗时与每次元素更新的 websocket 字节数（需额外序列化一次，默认关闭）
+    'ENABLED': os.environ.get('DASHBOARD_PROFILING', '') == '1',
+    'MAX_SAMPLES': 5000,           # 滚动保留的最近样本数
+    'ADMIN_TOKEN': os.environ.get('DASHBOARD_ADMIN_TOKEN', '')  # 诊断页与 /metrics 的访问口令（?token=... 或 Bearer 请求头），未配置时拒绝访问
+}
+
+# --- 系统日志（汇总）统计 ---
+SUMMARY_CONFIG = {
+    'CHUNK_SIZE': 1000,            # 全量重建时每次向后端拉取的记录数
+    'CATCH_UP_SIZE': 100,          # 增量追平时每次拉取的记录数（通常一次即可越过高水位）
+    'REBUILD_INTERVAL': 6 * 3600,  # 定期全量重建的周期（秒），用于纠正删除 / 改状态等增量无法感知的变化
+    'DRIFT_REBUILD_DELAY': 300,    # 记录数或各状态计数与上游不一致时，距上次重建至少间隔该时间（秒）再重建
+    'TOP_CREATORS': 10,            # 系统日志卡片按创建人展示的人数，其余合并为一项
+    'OTHER_CREATORS_NAME': '其他'  # 合并项的展示名称
+}
+
+# --- 本地 SQLite 镜像配置 ---
+MIRROR_CONFIG = {
+    'ENABLED': os.environ.get('DASHBOARD_MIRROR', '') == '1',  # 是否启用本地镜像（默认关闭，所有读取直连上游）
+    'PATH': os.environ.get('DASHBOARD_MIRROR_PATH', 'data/mirror.sqlite3'),  # 镜像文件路径，':memory:' 为内存库
+    'SERVE_READS': True,           # 镜像完成过全量同步后，分页 / 统计 / 检索 / 导出是否直接读镜像
+    'SYNC_INTERVAL': 30,           # 增量同步周期（秒），即镜像相对上游的最大延迟
+    'MAX_LAG': 180,                # 距最近一次成功同步超过该秒数时读取回到上游（上游熔断时仍读镜像兜底）
+    'FULL_SYNC_INTERVAL': 3600,    # 全量同步周期（秒），用于同步原地修改与删除
+    'DRIFT_SYNC_DELAY': 120,       # 各状态计数与上游持续不一致时，距上次全量满该秒数即提前全量同步
+    'CHUNK_SIZE': 1000,            # 全量同步时每次向后端拉取的记录数
+    'CATCH_UP_SIZE': 100           # 增量同步时每次拉取的记录数
+}
+
+# --- 列式内存记录缓存配置 ---
+COLUMNAR_CONFIG = {
+    # 是否在汇总统计的全量遍历 / 增量追平中同时维护全部记录的列式缓存（每条约 20 字节 + id，默认关闭）
+    'ENABLED': os.environ.get('DASHBOARD_COLUMNAR', '') == '1',
+    # 缓存完成全量装载后，分页 / 窗口 / 导出是否直接读缓存（自动刷新仍向上游确认当前页并写回状态，
+    # 其余记录的改状态在漂移检测触发的全量重建后可见）
+    'SERVE_READS': True,
+    'FILTER_CREATOR_OPTIONS': 200  # 详情页筛选面板中创建人下拉的最多选项数（按记录数降序）
+}
+
+# --- 趋势分析配置 ---
+TREND_CONFIG = {
+    'EVENT_FIELDS': {'created': 'created_at', 'reviewed': 'reviewed_at'},  # 事件 -> 原始记录中的时间字段
+    'EVENTS': {'created': '新增', 'reviewed': '审核'},                     # 事件 -> 展示名称
+    'GRANULARITIES': {'hour': '按小时', 'day': '按天', 'week': '按周'},
+    'RANGES': {'7天': 7, '30天': 30, '90天': 90, '全部': 0},              # 时间范围 -> 天数（0 表示全部）
+    'DEFAULT_GRANULARITY': 'day',
+    'DEFAULT_RANGE': '全部',
+    'MAX_POINTS': 300              # 每条折线最多输出的点数（LTTB 降采样），与时间跨度无关
+}
+
+# --- 详情页自动刷新配置 ---
+AUTO_REFRESH_CONFIG = {
+    'INTERVALS': [0, 15, 30, 60, 300],  # 可选的自动刷新周期（秒），0 表示关闭（默认关闭，需用户手动开启）
+    # 变化探测：'etag' 带 If-None-Match 重新请求当前页 / 'total' 先以 limit=1 探测总数 / 'auto' 后端返回过 ETag 时用条件请求，否则探测总数
+    'PROBE_MODE': 'auto',
+    'HIDDEN_BACKOFF': 2,           # 标签页处于后台时，每轮刷新后周期乘以该系数
+    'MAX_HIDDEN_INTERVAL': 600,    # 后台标签页的最长刷新周期（秒）
+    'SHARED_WINDOW': 5,            # 同一页在该时间（秒）内已被任一标签页确认过时，直接复用缓存，不访问上游
+    'ETAG_CACHE_SIZE': 500         # 最多记住的列表查询 ETag 数
 }
 
 BODY_STYLE = '''
@@ -38,6 +176,24 @@ CARD_BASE_STYLE = (
     'hover:scale-[1.02] cursor-pointer border-none transition-all duration-300'
 )
 
+# --- 导出配置 ---
+EXPORT_CONFIG = {
+    'CHUNK_SIZE': 1000,            # 每次向后端拉取的记录数
+    'CONCURRENCY': 4,              # 同时在途的分块请求数上限
+    'FILE_TTL': 600                # 导出文件在服务器上的保留时间（秒）
+}
+
+# 导出文件列定义：(清洗后字段名, 表头)
+EXPORT_COLUMNS = [
+    ('id', 'ID'),
+    ('word', '汉字'),
+    ('pinyin', '拼音'),
+    ('status', '状态'),
+    ('creator_id', '创建人'),
+    ('created_at', '创建时间'),
+    ('review_comment', '审核意见'),
+]
+
 # --- 数据映射 ---
 # 统一中文状态到后端 Key 的映射
 STATUS_MAP = {
@@ -160,6 +316,28 @@ BAR_CHART_TEMPLATE = {
     }]
 }
 
+TREND_CHART_TEMPLATE = {
+    'animationDuration': CHART_UI['bar']['animationDuration'],
+    'useUTC': True,
+    'tooltip': {'trigger': 'axis'},
+    'legend': {'top': 0, 'textStyle': {'color': CHART_UI['bar']['labelColor'], 'fontWeight': 'bold'}},
+    'grid': {'top': '12%', 'bottom': '15%', 'left': '6%', 'right': '4%'},
+    'xAxis': {
+        'type': 'time',
+        'axisLine': {'lineStyle': {'color': CHART_UI['bar']['axisLineColor']}},
+        'axisLabel': {'color': CHART_UI['bar']['labelColor']}
+    },
+    'yAxis': {
+        'type': 'value',
+        'name': CHART_UI['bar']['yAxisName'],
+        'nameTextStyle': {'color': '#94a3b8', 'fontSize': 11},
+        'splitLine': {'lineStyle': {'type': 'dashed', 'color': CHART_UI['bar']['splitLineColor']}},
+        'axisLabel': {'color': '#94a3b8'}
+    },
+    'dataZoom': [{'type': 'inside'}, {'type': 'slider', 'height': 18, 'bottom': 8}],
+    'series': []
+}
+
 PLACEHOLDER_OPTION = {
     'series': [{
         'type': 'pie', 
@@ -183,6 +361,8 @@ MODE_SETTINGS = {
     },
     'summary': {
         'label': '系统日志',
+        'view_all': '查看趋势分析>',
+        'view_all_url': '/trends',
         'sub_items': [
             ('汉字等级说明', 'description', None), 
         ]
@@ -0,0 +1,68 @@
+"""
+文件职责：
+    性能诊断页 (diagnostics_page.py)。
+    仅管理员可访问（/admin/diagnostics?token=...，口令为 PROFILING_CONFIG['ADMIN_TOKEN']），
+    汇总展示 profiler 滚动样本库中的页面耗时与 websocket 推送字节数，用于定位多客户端时占用带宽最多的元素更新。
+"""
+
+import secrets
+from nicegui import ui
+from app.config.constants import BODY_STYLE, PROFILING_CONFIG
+from app.services.profiler import profiler
+
+SUMMARY_COLUMNS = [
+    {'name': 'page', 'label': '页面', 'field': 'page', 'align': 'left'},
+    {'name': 'detail', 'label': '明细', 'field': 'detail', 'align': 'left'},
+    {'name': 'count', 'label': '次数', 'field': 'count', 'align': 'right'},
+    {'name': 'avg', 'label': '均值', 'field': 'avg', 'align': 'right'},
+    {'name': 'p95', 'label': 'P95', 'field': 'p95', 'align': 'right'},
+    {'name': 'max', 'label': '最大', 'field': 'max', 'align': 'right'},
+    {'name': 'total', 'label': '总量', 'field': 'total', 'align': 'right'},
+]
+
+# 指标 -> 分区标题（ws_bytes 单位为字节，其余为毫秒）
+SECTIONS = {
+    'ws_bytes': 'WEBSOCKET 推送字节（按元素类型）',
+    'build_ms': '页面构建耗时 (ms)',
+    'data_wait_ms': '等待数据耗时 (ms)',
+    'first_update_ms': '首次图表 / 表格更新耗时 (ms)',
+}
+
+
+def is_admin_token(token: str) -> bool:
+    """诊断页与 /metrics 共用的管理员口令校验；未配置口令时一律拒绝，避免在生产环境被意外公开"""
+    expected = PROFILING_CONFIG.get('ADMIN_TOKEN', '')
+    return bool(expected) and secrets.compare_digest(token or '', expected)
+
+
+async def render_diagnostics_content(token: str = '') -> None:
+    """渲染诊断页：按指标分区展示汇总表，支持手动刷新与清空样本"""
+    ui.query('body').style(BODY_STYLE)
+
+    with ui.column().classes('w-full p-8 gap-6 items-center'):
+        if not is_admin_token(token):
+            ui.label('无权访问诊断页').classes('text-xl font-bold text-slate-500 mt-20')
+            return
+
+        with ui.card().classes('w-full max-w-7xl p-8 rounded-[30px] shadow-2xl bg-white border-none'):
+            with ui.row().classes('w-full items-center justify-between mb-4'):
+                with ui.column().classes('gap-1'):
+                    ui.label('性能诊断').classes('text-3xl font-black text-slate-800')
+                    status_label = ui.label('').classes('text-[11px] text-blue-500/70 font-bold tracking-widest')
+                with ui.row().classes('gap-3'):
+                    ui.button('刷新', icon='refresh', on_click=lambda: refresh()).props('flat').classes('text-blue-600')
+                    ui.button('清空样本', icon='delete_sweep', on_click=lambda: (profiler.clear(), refresh())).props('flat').classes('text-red-500')
+
+            tables = {}
+            for metric, title in SECTIONS.items():
+                ui.label(title).classes('text-sm font-bold text-slate-600 mt-4')
+                tables[metric] = ui.table(columns=SUMMARY_COLUMNS, rows=[]).classes('w-full').props('flat dense no-data-label="暂无样本"')
+
+    def refresh() -> None:
+        rows = profiler.summary()
+        for metric, table in tables.items():
+            table.rows = [dict(row, id=i) for i, row in enumerate(r for r in rows if r['metric'] == metric)]
+        state = 'ENABLED' if profiler.enabled else 'DISABLED (DASHBOARD_PROFILING=1 开启)'
+        status_label.text = f'PROFILING: {state} · SAMPLES: {len(profiler.samples)}'
+
+    refresh()
@@ -1,19 +1,23 @@
 from nicegui import ui
-import asyncio
+import copy
 import logging
 from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
 from app.config.constants import BODY_STYLE, PLACEHOLDER_OPTION, MODE_SETTINGS, ACTION_LABELS
 from app.components.ui_components import (
     create_header, render_side_menu, create_pie_chart, 
-    create_bar_chart, create_statistics_card
+    create_bar_chart, create_statistics_card, create_chart_patches
 )
-from app.services.data_service import get_status_statistics, get_summary_statistics
+from app.services.live_stats import stats_hub
+from app.services.profiler import profiler
+from app.utils.page_utils import patch_chart_options
 
 @dataclass
 class ViewState:
     """管理首页的交互状态"""
     mode: str = 'home'
     active_view: str = 'home'
+    shown: Optional[List[Dict[str, Any]]] = None  # 图表当前展示的统计数据，用于实时推送时计算增量
 
 async def render_main_content():
     """渲染主页内容，保持原有的布局、装饰和逻辑完全不变"""
@@ -40,6 +44,7 @@ async def render_main_content():
             # 首页重置逻辑
             if new_mode == 'home':
                 state.mode, state.active_view = 'home', 'home'
+                state.shown = None
                 refs['chart'].options.update(PLACEHOLDER_OPTION)
                 refs['bar_container'].set_visibility(False)
                 refs['icon_overlay'].set_visibility(True)
@@ -54,10 +59,14 @@ async def render_main_content():
             refs['status_text'].text = ACTION_LABELS['sync'].format(display_name)
             
             try:
-                loop = asyncio.get_event_loop()
-                # 异步执行耗时查询
-                func = lambda: get_status_statistics(status) if new_mode == 'status' else get_summary_statistics()
-                raw_data = await loop.run_in_executor(None, func)
+                # 从应用级聚合器读取内存中的最新数据集，不再为每个客户端单独访问上游
+                with profiler.waiting('stats_hub', client):
+                    raw_data = await stats_hub.get(new_mode)
+                if raw_data is None:
+                    raise RuntimeError(f"统计数据集【{new_mode}】尚未就绪")
+                state.shown = copy.deepcopy(raw_data)
+                # 进入视图时请聚合器重新确认一次该数据集（经 TTL 缓存读取，与其他客户端的请求合并），有变化时经订阅推送
+                stats_hub.request_refresh(new_mode)
                 
                 # 更新图表配置
                 refs['chart'].options.update(create_pie_chart(
@@ -77,8 +86,24 @@ async def render_main_content():
             
             refs['chart'].update()
             refs['bar_chart'].update()
+            if state.shown is not None:
+                profiler.first_update('echart', client)
             left_panel.refresh()
 
+    def on_live_stats(name: str, data: List[Dict[str, Any]]) -> None:
+        """聚合器推送回调：仅当推送的数据集正在展示、且与当前展示不同时，向浏览器发送变化的 series"""
+        if state.mode != name or state.shown is None:
+            return
+        pie_patch, bar_patch = create_chart_patches(data, state.shown)
+        if pie_patch is None:
+            return
+        state.shown = copy.deepcopy(data)
+        patch_chart_options(refs['chart'], pie_patch)
+        patch_chart_options(refs['bar_chart'], bar_patch)
+
+    # 订阅应用级统计推送（以 client.id 为键）；客户端销毁时取消订阅，聚合器不再持有该页面的任何引用
+    client.on_delete(stats_hub.subscribe(client.id, on_live_stats))
+
     # --- 布局编排 (保持原 class 样式字符串不动) ---
     create_header(on_home_click=lambda: update_view('home'))
     
@@ -0,0 +1,59 @@
+"""
+文件职责：
+    趋势分析页 (trends_page.py)。
+    按状态展示记录的新增 / 审核趋势，可切换 小时 / 天 / 周 粒度与时间范围。
+    数据来自汇总统计聚合器的预分桶汇总，折线点数经服务端 LTTB 降采样，长时间范围也能快速打开。
+"""
+
+from nicegui import ui
+from app.config.constants import BODY_STYLE, TREND_CONFIG
+from app.components.ui_components import create_trend_chart
+from app.services.data_service import get_trend_series_async
+from app.services.profiler import profiler
+
+
+async def render_trends_content() -> None:
+    """渲染趋势分析页：切换事件 / 粒度 / 范围时重新生成折线配置"""
+    ui.query('body').style(BODY_STYLE)
+    client = ui.context.client
+
+    with ui.column().classes('w-full p-8 gap-6 items-center'):
+        with ui.card().classes('w-full max-w-7xl p-8 rounded-[30px] shadow-2xl bg-white border-none'):
+            with ui.row().classes('w-full items-center justify-between mb-4'):
+                with ui.column().classes('gap-1'):
+                    ui.label('趋势分析').classes('text-3xl font-black text-slate-800')
+                    status_label = ui.label('').classes('text-[11px] text-blue-500/70 font-bold tracking-widest')
+                with ui.row().classes('gap-3 items-center'):
+                    event_toggle = ui.toggle(TREND_CONFIG['EVENTS'], value='created').props('rounded unelevated toggle-color=blue-6')
+                    granularity_toggle = ui.toggle(
+                        TREND_CONFIG['GRANULARITIES'], value=TREND_CONFIG.get('DEFAULT_GRANULARITY', 'day')
+                    ).props('rounded unelevated toggle-color=blue-6')
+                    range_toggle = ui.toggle(
+                        list(TREND_CONFIG['RANGES']), value=TREND_CONFIG.get('DEFAULT_RANGE', '全部')
+                    ).props('rounded unelevated toggle-color=blue-6')
+
+            chart = ui.echart(options=create_trend_chart({})).classes('w-full h-[520px]')
+
+    async def load() -> None:
+        with profiler.waiting('trend_data', client):
+            result = await get_trend_series_async(
+                event=event_toggle.value,
+                granularity=granularity_toggle.value,
+                days=TREND_CONFIG['RANGES'].get(range_toggle.value, 0)
+            )
+        if not result['ready']:
+            # 首轮全量统计尚未完成：稍后自动重试一次
+            status_label.text = '统计中，稍后自动刷新…'
+            ui.timer(3, load, once=True)
+            return
+        points = max((len(points) for points in result['series'].values()), default=0)
+        status_label.text = f'SERIES: {len(result["series"])} · POINTS: {points}' if points else '所选范围内暂无数据'
+        chart.options.clear()
+        chart.options.update(create_trend_chart(result['series']))
+        chart.update()
+        profiler.first_update('echart', client)
+
+    for toggle in (event_toggle, granularity_toggle, range_toggle):
+        toggle.on_value_change(load)
+
+    await load()
@@ -1,16 +1,46 @@
-from nicegui import ui
+from fastapi import Request
+from fastapi.responses import PlainTextResponse
+from nicegui import app, ui
 from app.pages.main_page import render_main_content
 from app.pages.details_page import render_details_content
+from app.pages.diagnostics_page import is_admin_token, render_diagnostics_content
+from app.pages.trends_page import render_trends_content
+from app.services.metrics import render_prometheus
+from app.services.profiler import profiler
 
 def init_routes():
     @ui.page('/')
     async def index():
-        await render_main_content()
+        with profiler.page('index'):
+            await render_main_content()
 
+    # view 查询参数：?view=virtual 切换为虚拟滚动模式，默认分页模式
     @ui.page('/details')
-    async def details_all():
-        await render_details_content()
+    async def details_all(view: str = 'paged'):
+        with profiler.page('details_all'):
+            await render_details_content(view=view)
 
     @ui.page('/details/{status}')
-    async def details_filter(status: str):
-        await render_details_content(status)
\ No newline at end of file
+    async def details_filter(status: str, view: str = 'paged'):
+        with profiler.page('details_filter'):
+            await render_details_content(status, view=view)
+
+    # 趋势分析页：按 小时 / 天 / 周 的新增与审核趋势
+    @ui.page('/trends')
+    async def trends():
+        with profiler.page('trends'):
+            await render_trends_content()
+
+    # 管理员诊断页：页面耗时与 websocket 推送字节汇总（需 PROFILING_CONFIG['ADMIN_TOKEN']）
+    @ui.page('/admin/diagnostics')
+    async def diagnostics(token: str = ''):
+        await render_diagnostics_content(token)
+
+    # Prometheus 抓取接口：后端调用耗时 / 重试 / 错误、缓存命中率、页面推送字节数
+    # 与诊断页共用管理员口令：抓取端配置 bearer token（Authorization: Bearer ...）或 ?token=...
+    @app.get('/metrics', include_in_schema=False)
+    def prometheus_metrics(request: Request, token: str = ''):
+        scheme, _, credentials = request.headers.get('authorization', '').partition(' ')
+        if not is_admin_token(credentials if scheme.lower() == 'bearer' else token):
+            return PlainTextResponse('forbidden\n', status_code=403)
+        return PlainTextResponse(render_prometheus(), media_type='text/plain; version=0.0.4; charset=utf-8')
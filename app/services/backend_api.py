@@ -1,11 +1,29 @@
+import asyncio
+import json
 import logging
-from typing import List, Dict, Any, Final
+import threading
+import time
+from typing import List, Dict, Any, Final, Optional, Tuple
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
+import httpx
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+from app.config.constants import AUTO_REFRESH_CONFIG, BACKEND_CONFIG
+from app.services.cache import LRUTTLCache
+from app.services.metrics import metrics
+from app.services.resilience import (
+    BackendUnavailableError, CircuitBreaker, CircuitOpenError, LatencyBudgetExceeded, hedged
+)
+
+try:
+    # orjson 随 nicegui 一并安装，解析速度约为标准库的数倍；缺失时回退 json
+    import orjson
+except ImportError:
+    orjson = None
+
 # --- 基础配置与常量 ---
 # 确保 API_BASE 路径完整，指向具体的 resolutions 资源
 API_BASE: Final[str] = "http://47.109.134.91:6001/api/v1/admin/dashboard/resolutions"
@@ -17,20 +35,50 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# 统计饼图所需的状态映射，顺序即前端图例顺序
+STATUS_NAME_MAP: Final[Dict[str, str]] = {
+    'published': '已发布',
+    'draft': '草稿箱',
+    'pending_review': '待审核',
+    'rejected': '已拒绝'
+}
+
+# 重试策略：与 urllib3 Retry 保持一致，同步/异步客户端共用
+RETRY_TOTAL: Final[int] = 3
+RETRY_BACKOFF_FACTOR: Final[float] = 1
+RETRY_STATUS_FORCELIST: Final[tuple] = (429, 500, 502, 503, 504)
+
 # --- 核心网络层配置 ---
 
+# 进程级共享 Session：连接池与 Keep-Alive 在所有请求间复用
+_session_lock = threading.Lock()
+_shared_session: Optional[requests.Session] = None
+# 事件循环内共享的异步客户端（NiceGUI 单事件循环，无需加锁）
+_async_client: Optional[httpx.AsyncClient] = None
+# 分组计数接口能力探测结果：None 未探测 / True 可用 / False 不可用（回退逐状态统计）
+_grouped_counts_supported: Optional[bool] = None
+# 同步 / 异步客户端共用的熔断器：上游持续失败时快速失败，避免重试风暴拖住页面
+_breaker = CircuitBreaker(
+    failure_threshold=BACKEND_CONFIG.get('BREAKER_FAILURE_THRESHOLD', 5),
+    recovery_timeout=BACKEND_CONFIG.get('BREAKER_RECOVERY_TIMEOUT', 30)
+)
+# 列表查询的条件请求：key 为排序后的查询参数，值为最近一次响应的 ETag（ETag 本身不过期，仅按容量淘汰）
+_list_etags = LRUTTLCache(max_entries=AUTO_REFRESH_CONFIG.get('ETAG_CACHE_SIZE', 500), ttl=float('inf'), name='etag')
+# 列表接口是否返回 ETag：None 未知 / True 支持 / False 不支持（自动刷新回退为总数探测）
+_etag_supported: Optional[bool] = None
+
 def create_http_session(pool_size: int = 10) -> requests.Session:
     """
-    创建并配置线程安全的 Session。
-    在多线程环境下，每个任务创建独立的 Session 以确保彻底的线程安全。
+    创建并配置带重试策略与连接池的 Session。
+    业务代码请通过 get_http_session() 获取共享实例，不要每次请求都新建。
     """
     session = requests.Session()
     
     # 定义自动重试策略 (仅针对 GET 等幂等方法)
     retry_strategy = Retry(
-        total=3,                # 最多重试 3 次
-        backoff_factor=1,       # 等待时间 1s, 2s, 4s
-        status_forcelist=[429, 500, 502, 503, 504], 
+        total=RETRY_TOTAL,                      # 最多重试 3 次
+        backoff_factor=RETRY_BACKOFF_FACTOR,    # 等待时间 1s, 2s, 4s
+        status_forcelist=list(RETRY_STATUS_FORCELIST), 
         allowed_methods=["GET", "HEAD", "OPTIONS"] 
     )
     
@@ -44,81 +92,344 @@ def create_http_session(pool_size: int = 10) -> requests.Session:
     session.mount("https://", adapter)
     
     # 统一注入 Token
-    session.headers.update({
+    session.headers.update(_default_headers())
+    
+    return session
+
+def _default_headers() -> Dict[str, str]:
+    """同步 Session 与异步客户端共用的请求头"""
+    return {
         'accept': 'application/json',
+        'Connection': 'keep-alive',
         'Authorization': f'Bearer {TOKEN.strip()}'
-    })
+    }
+
+def get_http_session() -> requests.Session:
+    """
+    获取进程级共享 Session（懒加载）。
+    urllib3 连接池本身是线程安全的，多个线程可并发复用同一个 Session 的保活连接；
+    此处加锁仅为保证初始化只发生一次。
+    """
+    global _shared_session
+    if _shared_session is None:
+        with _session_lock:
+            if _shared_session is None:
+                pool_size = BACKEND_CONFIG.get('POOL_SIZE', 10)
+                _shared_session = create_http_session(pool_size)
+                logger.info(f"已创建共享 HTTP 连接池，大小: {pool_size}")
+    return _shared_session
+
+def close_http_session() -> None:
+    """关闭共享 Session 并释放全部连接，供 app.on_shutdown 调用。"""
+    global _shared_session
+    with _session_lock:
+        if _shared_session is not None:
+            _shared_session.close()
+            _shared_session = None
+            logger.info("共享 HTTP 连接池已关闭")
+
+def get_async_client() -> httpx.AsyncClient:
+    """
+    获取共享的 httpx.AsyncClient（懒加载）。
+    页面处理函数直接 await 网络 I/O，不再占用默认线程池的工作线程。
+    """
+    global _async_client
+    if _async_client is None or _async_client.is_closed:
+        pool_size = BACKEND_CONFIG.get('POOL_SIZE', 10)
+        _async_client = httpx.AsyncClient(
+            headers=_default_headers(),
+            timeout=httpx.Timeout(BACKEND_CONFIG['READ_TIMEOUT'], connect=BACKEND_CONFIG['CONNECT_TIMEOUT']),
+            limits=httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size)
+        )
+        logger.info(f"已创建共享异步 HTTP 客户端，连接上限: {pool_size}")
+    return _async_client
+
+async def close_async_client() -> None:
+    """关闭共享异步客户端，供 app.on_shutdown 调用。"""
+    global _async_client
+    if _async_client is not None:
+        await _async_client.aclose()
+        _async_client = None
+        logger.info("共享异步 HTTP 客户端已关闭")
+
+def _is_backend_failure(status_code: int) -> bool:
+    """429/5xx 计入熔断失败；401/403/404 等业务性 4xx 说明上游可用，不计入"""
+    return status_code in RETRY_STATUS_FORCELIST or status_code >= 500
+
+def _record_outcome(status_code: int) -> None:
+    if _is_backend_failure(status_code):
+        _breaker.record_failure()
+    else:
+        _breaker.record_success()
+
+def _check_breaker() -> None:
+    if not _breaker.allow():
+        raise CircuitOpenError("后端熔断中，请求未发出")
+
+def _endpoint_name(url: Optional[str]) -> str:
+    """指标中的接口名：分组计数接口为 'counts'，其余为列表接口 'resolutions'"""
+    return 'counts' if url == _counts_url() else 'resolutions'
+
+def _record_call(endpoint: str, site: str, outcome: Any, started: float) -> None:
+    """
+    记录一次后端调用（含重试与退避）的耗时与结果。
+    :param outcome: 最终 HTTP 状态码，或失败类型 'timeout' / 'circuit_open' / 'transport_error' / 'error'
+    """
+    labels = {'endpoint': endpoint, 'site': site, 'status': outcome}
+    metrics.histogram('backend_request_duration_seconds', time.perf_counter() - started, **labels)
+    # 4xx/5xx（含 401/403/404）与未拿到响应的调用都计入错误数，按 status 区分
+    if not isinstance(outcome, int) or outcome >= 400:
+        metrics.inc('backend_errors_total', **labels)
+
+def _sync_get(url: str, params: Dict[str, Any] = None, timeout: tuple = None, site: str = 'list') -> requests.Response:
+    """同步 GET：同样受熔断器保护，重试由 Session 上的 urllib3 Retry 负责"""
+    started, outcome = time.perf_counter(), 'error'
+    try:
+        _check_breaker()
+        try:
+            response = get_http_session().get(url, params=params, timeout=timeout)
+        except requests.exceptions.RequestException:
+            _breaker.record_failure()
+            outcome = 'transport_error'
+            raise
+        outcome = response.status_code
+        _record_outcome(response.status_code)
+        # urllib3 在 Session 内部完成的重试记录在 raw.retries.history 中
+        retries = getattr(getattr(response.raw, 'retries', None), 'history', ())
+        if retries:
+            metrics.inc('backend_retries_total', len(retries), endpoint=_endpoint_name(url), site=site)
+        return response
+    except CircuitOpenError:
+        outcome = 'circuit_open'
+        raise
+    finally:
+        _record_call(_endpoint_name(url), site, outcome, started)
+
+def _latency_budget(site: str) -> Optional[float]:
+    return BACKEND_CONFIG.get('LATENCY_BUDGETS', {}).get(site)
+
+async def _async_get(params: Dict[str, Any], timeout: tuple = None, url: str = None, site: str = 'list',
+                     headers: Dict[str, str] = None) -> httpx.Response:
+    """
+    异步 GET，按 RETRY_* 配置对 429/5xx 与连接错误做指数退避重试（1s, 2s, 4s）。
+    - 每次尝试前检查熔断器，熔断期间直接抛出 CircuitOpenError；
+    - 整个调用（含重试与退避）受 LATENCY_BUDGETS[site] 约束，超出抛出 LatencyBudgetExceeded；
+    - HEDGE_ENABLED 时除导出外的只读请求启用对冲请求；
+    - headers 为本次请求的附加请求头（如 If-None-Match）。
+    最后一次仍失败时原样返回响应（或抛出异常），由调用方统一处理。
+    """
+    budget = _latency_budget(site)
+    started, outcome = time.perf_counter(), 'error'
+    try:
+        response = await asyncio.wait_for(_async_get_with_retry(params, timeout, url, site, headers), timeout=budget)
+        outcome = response.status_code
+        return response
+    except asyncio.TimeoutError:
+        outcome = 'timeout'
+        _breaker.record_failure()
+        raise LatencyBudgetExceeded(f"请求超出耗时预算 {budget}s ({site})") from None
+    except CircuitOpenError:
+        outcome = 'circuit_open'
+        raise
+    except httpx.TransportError:
+        outcome = 'transport_error'
+        raise
+    finally:
+        _record_call(_endpoint_name(url), site, outcome, started)
+
+async def _async_get_with_retry(params: Dict[str, Any], timeout: tuple, url: str, site: str,
+                                headers: Dict[str, str] = None) -> httpx.Response:
+    client = get_async_client()
+    request_timeout = httpx.Timeout(timeout[1], connect=timeout[0]) if timeout else None
+    kwargs = {'params': params}
+    if request_timeout:
+        kwargs['timeout'] = request_timeout
+    if headers:
+        kwargs['headers'] = headers
+    hedge_delay = BACKEND_CONFIG.get('HEDGE_DELAY') if BACKEND_CONFIG.get('HEDGE_ENABLED') and site != 'export' else None
+
+    _check_breaker()
+    for attempt in range(RETRY_TOTAL + 1):
+        is_last = attempt == RETRY_TOTAL
+        try:
+            response = await hedged(lambda: client.get(url or API_BASE, **kwargs), hedge_delay)
+            _record_outcome(response.status_code)
+            if response.status_code not in RETRY_STATUS_FORCELIST or is_last:
+                return response
+        except httpx.TransportError:
+            _breaker.record_failure()
+            if is_last:
+                raise
+        # 本次失败已触发熔断时不再退避重试，立即失败
+        _check_breaker()
+        metrics.inc('backend_retries_total', endpoint=_endpoint_name(url), site=site)
+        await asyncio.sleep(RETRY_BACKOFF_FACTOR * (2 ** attempt))
+
+def _decode_json(content: bytes) -> Any:
+    """
+    直接从响应原始字节解码 JSON。
+    绕开 response.json() 先按编码探测转为 str 再解析的过程，大列表响应可省去一次完整拷贝。
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+def _extract_count(data: Any) -> int:
+    """从列表接口响应中提取总数：兼容列表和带有 total 字段的字典"""
+    if isinstance(data, list):
+        count = len(data)
+    elif isinstance(data, dict):
+        count = data.get('total', len(data.get('items', data.get('data', []))))
+    else:
+        count = 0
     
-    return session
+    # 强制转换为 int，确保前端图表渲染不报错
+    return int(count) if isinstance(count, (int, float)) else 0
 
-def fetch_single_status(status_key: str, status_name: str, timeout: tuple = (3.05, 10)) -> Dict[str, Any]:
+def _counts_url() -> str:
+    return f"{API_BASE.rstrip('/')}/{BACKEND_CONFIG.get('COUNTS_PATH', 'counts')}"
+
+def _grouped_counts_enabled() -> bool:
+    """根据 STATS_MODE 配置与探测结果决定是否走分组计数接口"""
+    mode = BACKEND_CONFIG.get('STATS_MODE', 'auto')
+    if mode == 'grouped':
+        return True
+    if mode == 'per_status':
+        return False
+    return _grouped_counts_supported is not False
+
+def _record_grouped_probe(status_code: int) -> None:
+    """
+    记录 auto 模式下的能力探测结果：501 与鉴权 / 限流以外的 4xx 视为后端不支持分组计数。
+    （后端存在 /resolutions/{id} 路由时，counts 会被当作 id 解析，返回 400/422 而不是 404）
+    """
+    global _grouped_counts_supported
+    if status_code == 501 or (400 <= status_code < 500 and status_code not in (401, 403, 408, 429)):
+        if _grouped_counts_supported is not False:
+            logger.warning(f"分组计数接口不可用 ({status_code})，回退为逐状态统计")
+        _grouped_counts_supported = False
+    elif 200 <= status_code < 300:
+        _grouped_counts_supported = True
+
+def _extract_grouped_counts(data: Any) -> Dict[str, int]:
+    """
+    解析分组计数响应，兼容以下结构：
+    {'published': 1, ...} / {'counts': {...}} / [{'status': 'published', 'count': 1}, ...]
+    """
+    if isinstance(data, dict):
+        data = data.get('counts', data.get('items', data.get('data', data)))
+    if isinstance(data, list):
+        data = {row.get('status'): row.get('count', row.get('total', 0)) for row in data if isinstance(row, dict)}
+    if not isinstance(data, dict):
+        raise ValueError(f"无法识别的分组计数响应: {type(data).__name__}")
+    return {key: int(value) for key, value in data.items() if isinstance(value, (int, float))}
+
+def _grouped_stats(counts: Dict[str, int], status_map: Dict[str, str]) -> Dict[str, Dict[str, Any]]:
+    return {key: {'name': name, 'value': counts.get(key, 0)} for key, name in status_map.items()}
+
+def _select_statuses(status: str = None) -> Dict[str, str]:
+    """按中文名称过滤需要统计的状态，未指定时返回全部"""
+    if not status:
+        return dict(STATUS_NAME_MAP)
+    return {key: name for key, name in STATUS_NAME_MAP.items() if name in status or key == status}
+
+def _finalize_stats(temp_results: Dict[str, Dict[str, Any]], status_map: Dict[str, str]) -> List[Dict[str, Any]]:
+    """按照业务定义的 key 顺序重组列表，确保前端图例顺序固定"""
+    processed_data = [temp_results[key] for key in status_map.keys() if key in temp_results]
+
+    # 兜底：如果全部数据都为 0，返回暂无数据提示
+    if not processed_data or sum(item['value'] for item in processed_data) == 0:
+        return [{'name': '暂无数据', 'value': 0}]
+        
+    return processed_data
+
+def stats_from_counts(counts: Dict[str, int], status: str = None) -> List[Dict[str, Any]]:
+    """
+    将 {后端状态: 数量} 组装为与 fetch_resolutions_stats 相同的统计结构（供本地镜像等非 HTTP 数据源复用）。
+    :param status: 可选，仅统计名称匹配的状态
+    """
+    status_map = _select_statuses(status)
+    return _finalize_stats(_grouped_stats(counts, status_map), status_map)
+
+def fetch_single_status(status_key: str, status_name: str, timeout: tuple = None) -> Dict[str, Any]:
     """
     核心函数：获取单个状态的数据数量。
-    :param timeout: (连接超时, 读取超时)
+    :param timeout: (连接超时, 读取超时)，默认取 BACKEND_CONFIG
     :return: 格式化后的字典 {'name': str, 'value': int}
     """
-    # 修复点：每个线程使用专属的独立 Session，解决并发冲突
-    with create_http_session() as http_session:
-        try:
-            # 仅需统计数量，limit 设为 1 减轻后端压力
-            params = {'skip': 0, 'limit': 1, 'status': status_key}
-            
-            response = http_session.get(API_BASE, params=params, timeout=timeout)
-            
-            # 鉴权状态专门处理
-            if response.status_code in (401, 403):
-                logger.error(f"鉴权失败 (401/403)！请检查 TOKEN 有效性。状态: {status_name}")
-                return {'name': status_name, 'value': 0}
-            
-            # 若返回 404，通常代表该路径下无数据，视作 0
-            if response.status_code == 404:
-                logger.warning(f"路径未找到 (404): {status_name}，已设为 0")
-                return {'name': status_name, 'value': 0}
+    timeout = timeout or (BACKEND_CONFIG['CONNECT_TIMEOUT'], BACKEND_CONFIG['READ_TIMEOUT'])
+    try:
+        # 仅需统计数量，limit 设为 1 减轻后端压力
+        params = {'skip': 0, 'limit': 1, 'status': status_key}
+        
+        # 复用进程级共享连接池，避免每次统计都重新握手
+        response = _sync_get(API_BASE, params=params, timeout=timeout, site='stats')
+        
+        # 鉴权状态专门处理
+        if response.status_code in (401, 403):
+            logger.error(f"鉴权失败 (401/403)！请检查 TOKEN 有效性。状态: {status_name}")
+            return {'name': status_name, 'value': 0}
+        
+        # 若返回 404，通常代表该路径下无数据，视作 0
+        if response.status_code == 404:
+            logger.warning(f"路径未找到 (404): {status_name}，已设为 0")
+            return {'name': status_name, 'value': 0}
 
-            response.raise_for_status() # 抛出其他 4xx/5xx 错误
-            
-            data = response.json()
-            
-            # 兼容列表和带有 total 字段的字典
-            if isinstance(data, list):
-                count = len(data)
-            elif isinstance(data, dict):
-                count = data.get('total', len(data.get('items', data.get('data', []))))
-            else:
-                count = 0
-            
-            # 强制转换为 int，确保前端图表渲染不报错
-            final_value = int(count) if isinstance(count, (int, float)) else 0
-            
-            logger.info(f"状态【{status_name}】获取成功，数量: {final_value}")
-            return {'name': status_name, 'value': final_value}
-
-        except requests.exceptions.RequestException as re:
-            logger.error(f"网络请求异常 ({status_name}): {re}")
-        except Exception:
-            # 记录完整错误堆栈信息，排障神技
-            logger.exception(f"处理【{status_name}】数据时发生未知异常")
-            
-        return {'name': status_name, 'value': 0}
+        response.raise_for_status() # 抛出其他 4xx/5xx 错误
+        
+        final_value = _extract_count(_decode_json(response.content))
+        
+        logger.info(f"状态【{status_name}】获取成功，数量: {final_value}")
+        return {'name': status_name, 'value': final_value}
 
-def fetch_resolutions_stats() -> List[Dict[str, Any]]:
+    except BackendUnavailableError as be:
+        logger.warning(f"后端暂不可用 ({status_name}): {be}")
+    except requests.exceptions.RequestException as re:
+        logger.error(f"网络请求异常 ({status_name}): {re}")
+    except Exception:
+        # 记录完整错误堆栈信息，排障神技
+        logger.exception(f"处理【{status_name}】数据时发生未知异常")
+        
+    return {'name': status_name, 'value': 0}
+
+def fetch_grouped_counts(timeout: tuple = None) -> Optional[Dict[str, int]]:
+    """
+    一次请求获取所有状态的数量（分组计数模式）。
+    :return: {'published': int, ...}；接口不可用或请求失败时返回 None，由调用方回退逐状态统计
+    """
+    timeout = timeout or (BACKEND_CONFIG['CONNECT_TIMEOUT'], BACKEND_CONFIG['READ_TIMEOUT'])
+    try:
+        response = _sync_get(_counts_url(), timeout=timeout, site='stats')
+        _record_grouped_probe(response.status_code)
+        if _grouped_counts_supported is False:
+            return None
+        response.raise_for_status()
+        counts = _extract_grouped_counts(_decode_json(response.content))
+        logger.info(f"分组统计获取成功: {counts}")
+        return counts
+    except Exception as e:
+        logger.error(f"分组统计获取失败，回退逐状态统计: {e}")
+        return None
+
+def fetch_resolutions_stats(status: str = None) -> List[Dict[str, Any]]:
     """
     业务主管：并发抓取所有状态并重组结果。
+    :param status: 可选，仅统计名称匹配的状态
     """
-    # 定义前端需要的映射顺序
-    status_map: Final[Dict[str, str]] = {
-        'published': '已发布',
-        'draft': '草稿箱',
-        'pending_review': '待审核',
-        'rejected': '已拒绝'
-    }
+    status_map = _select_statuses(status)
+
+    # 优先走分组计数：1 次请求代替 4 次 limit=1 探测
+    if _grouped_counts_enabled():
+        counts = fetch_grouped_counts()
+        if counts is not None:
+            return _finalize_stats(_grouped_stats(counts, status_map), status_map)
     
     # 结果暂存器
     temp_results: Dict[str, Dict[str, Any]] = {}
 
     try:
         # 限制最大工作线程，避免资源浪费
-        with ThreadPoolExecutor(max_workers=min(len(status_map), 4)) as executor:
+        with ThreadPoolExecutor(max_workers=max(1, min(len(status_map), 4))) as executor:
             # 提交所有统计任务
             future_to_key = {
                 executor.submit(fetch_single_status, key, name): key 
@@ -130,32 +441,205 @@ def fetch_resolutions_stats() -> List[Dict[str, Any]]:
                 key = future_to_key[future]
                 temp_results[key] = future.result()
 
-        # 按照业务定义的 key 顺序重组列表，确保前端图例顺序固定
-        processed_data = [temp_results[key] for key in status_map.keys() if key in temp_results]
-
-        # 兜底：如果全部数据都为 0，返回暂无数据提示
-        if not processed_data or sum(item['value'] for item in processed_data) == 0:
-            return [{'name': '暂无数据', 'value': 0}]
-            
-        return processed_data
+        return _finalize_stats(temp_results, status_map)
 
     except Exception:
         logger.exception("fetch_resolutions_stats 执行过程中发生致命错误")
         return [{'name': '系统异常', 'value': 0}]
-def fetch_resolutions_list(skip: int = 0, limit: int = 15, status: str = None):
-    """获取分页列表数据"""
-    with create_http_session() as http_session:
-        try:
-            params = {'skip': skip, 'limit': limit}
-            if status:
-                params['status'] = status
-            
-            response = http_session.get(API_BASE, params=params, timeout=10)
-            response.raise_for_status()
-            return response.json()  # 返回后端原始 JSON
-        except Exception as e:
-            logger.error(f"列表抓取失败: {e}")
-            return {"items": [], "total": 0}
+
+def _list_params(skip: int, limit: int, status: str = None, search: str = None,
+                 cursor: Optional[Tuple[str, str]] = None) -> Dict[str, Any]:
+    """
+    组装列表查询参数。
+    cursor 为上一页末行的 (created_at, id)：给定时按游标翻页（skip 固定为 0），
+    后端只需从索引定位继续扫描，不再随页码增大做偏移扫描。
+    """
+    params = {'skip': 0 if cursor else skip, 'limit': limit}
+    if status:
+        params['status'] = status
+    if search:
+        params['search'] = search
+    if cursor:
+        names = BACKEND_CONFIG.get('KEYSET_PARAMS', {})
+        params[names.get('created_at', 'after_created_at')] = cursor[0]
+        params[names.get('id', 'after_id')] = cursor[1]
+    return params
+
+def fetch_resolutions_list(skip: int = 0, limit: int = 15, status: str = None, search: str = None,
+                           cursor: Optional[Tuple[str, str]] = None):
+    """获取分页列表数据，search 为可选的后端检索关键字，cursor 为可选的游标翻页起点 (created_at, id)"""
+    try:
+        params = _list_params(skip, limit, status, search, cursor)
+        
+        timeout = (BACKEND_CONFIG['CONNECT_TIMEOUT'], BACKEND_CONFIG['READ_TIMEOUT'])
+        response = _sync_get(API_BASE, params=params, timeout=timeout, site='search' if search else 'list')
+        response.raise_for_status()
+        return _decode_json(response.content)  # 返回后端原始 JSON
+    except Exception as e:
+        logger.error(f"列表抓取失败: {e}")
+        return {"items": [], "total": 0}
+
+# --- 异步版本：供 NiceGUI 页面处理函数直接 await ---
+
+async def fetch_single_status_async(status_key: str, status_name: str, timeout: tuple = None) -> Dict[str, Any]:
+    """fetch_single_status 的异步版本，基于共享 httpx.AsyncClient"""
+    timeout = timeout or (BACKEND_CONFIG['CONNECT_TIMEOUT'], BACKEND_CONFIG['READ_TIMEOUT'])
+    try:
+        # 仅需统计数量，limit 设为 1 减轻后端压力
+        params = {'skip': 0, 'limit': 1, 'status': status_key}
+        response = await _async_get(params, timeout=timeout, site='stats')
+        
+        # 鉴权状态专门处理
+        if response.status_code in (401, 403):
+            logger.error(f"鉴权失败 (401/403)！请检查 TOKEN 有效性。状态: {status_name}")
+            return {'name': status_name, 'value': 0}
+        
+        # 若返回 404，通常代表该路径下无数据，视作 0
+        if response.status_code == 404:
+            logger.warning(f"路径未找到 (404): {status_name}，已设为 0")
+            return {'name': status_name, 'value': 0}
+
+        response.raise_for_status() # 抛出其他 4xx/5xx 错误
+        
+        final_value = _extract_count(_decode_json(response.content))
+        
+        logger.info(f"状态【{status_name}】获取成功，数量: {final_value}")
+        return {'name': status_name, 'value': final_value}
+
+    except BackendUnavailableError as be:
+        logger.warning(f"后端暂不可用 ({status_name}): {be}")
+    except httpx.HTTPError as he:
+        logger.error(f"网络请求异常 ({status_name}): {he}")
+    except Exception:
+        logger.exception(f"处理【{status_name}】数据时发生未知异常")
+        
+    return {'name': status_name, 'value': 0}
+
+async def fetch_grouped_counts_async(timeout: tuple = None) -> Optional[Dict[str, int]]:
+    """fetch_grouped_counts 的异步版本"""
+    timeout = timeout or (BACKEND_CONFIG['CONNECT_TIMEOUT'], BACKEND_CONFIG['READ_TIMEOUT'])
+    try:
+        response = await _async_get({}, timeout=timeout, url=_counts_url(), site='stats')
+        _record_grouped_probe(response.status_code)
+        if _grouped_counts_supported is False:
+            return None
+        response.raise_for_status()
+        counts = _extract_grouped_counts(_decode_json(response.content))
+        logger.info(f"分组统计获取成功: {counts}")
+        return counts
+    except Exception as e:
+        logger.error(f"分组统计获取失败，回退逐状态统计: {e}")
+        return None
+
+async def fetch_resolutions_stats_async(status: str = None) -> List[Dict[str, Any]]:
+    """fetch_resolutions_stats 的异步版本：用 asyncio.gather 并发抓取，替代线程池"""
+    status_map = _select_statuses(status)
+
+    if _grouped_counts_enabled():
+        counts = await fetch_grouped_counts_async()
+        if counts is not None:
+            return _finalize_stats(_grouped_stats(counts, status_map), status_map)
+
+    try:
+        results = await asyncio.gather(*(
+            fetch_single_status_async(key, name) for key, name in status_map.items()
+        ))
+        return _finalize_stats(dict(zip(status_map.keys(), results)), status_map)
+    except Exception:
+        logger.exception("fetch_resolutions_stats_async 执行过程中发生致命错误")
+        return [{'name': '系统异常', 'value': 0}]
+
+async def fetch_resolutions_list_async(skip: int = 0, limit: int = 15, status: str = None,
+                                       strict: bool = False, search: str = None, site: str = None,
+                                       cursor: Optional[Tuple[str, str]] = None):
+    """
+    fetch_resolutions_list 的异步版本
+    :param strict: True 时请求失败直接抛出异常，而不是返回空列表（用于导出等不允许静默丢数据的场景）
+    :param search: 可选的后端检索关键字
+    :param site: 调用点（'list' / 'search' / 'export'），决定耗时预算与是否对冲，默认按 search 推断
+    :param cursor: 可选的游标翻页起点 (created_at, id)，给定时忽略 skip
+    """
+    try:
+        params = _list_params(skip, limit, status, search, cursor)
+        
+        response = await _async_get(params, site=site or ('search' if search else 'list'))
+        response.raise_for_status()
+        _remember_etag(params, response)
+        return _decode_json(response.content)  # 返回后端原始 JSON
+    except Exception as e:
+        logger.error(f"列表抓取失败: {e}")
+        if strict:
+            raise
+        return {"items": [], "total": 0}
+
+def _etag_key(params: Dict[str, Any]) -> tuple:
+    return tuple(sorted(params.items()))
+
+def _remember_etag(params: Dict[str, Any], response: httpx.Response) -> None:
+    """记录列表响应的 ETag，并据此判断后端是否支持条件请求"""
+    global _etag_supported
+    etag = response.headers.get('etag')
+    if etag:
+        _etag_supported = True
+        _list_etags.set(_etag_key(params), etag)
+    elif _etag_supported is None:
+        logger.info("列表接口未返回 ETag，自动刷新将使用总数探测")
+        _etag_supported = False
+
+def conditional_requests_supported() -> Optional[bool]:
+    """列表接口是否支持 ETag 条件请求：None 表示尚未收到过列表响应"""
+    return _etag_supported
+
+async def fetch_resolutions_list_if_changed_async(skip: int = 0, limit: int = 15, status: str = None,
+                                                  cursor: Optional[Tuple[str, str]] = None):
+    """
+    条件请求版本的列表抓取，供详情页自动刷新使用。
+    已知该查询的 ETag 时携带 If-None-Match，后端返回 304 说明数据未变化，只消耗一个空响应。
+    :return: 数据未变化时返回 None，否则返回后端原始 JSON；请求失败时抛出异常
+    """
+    params = _list_params(skip, limit, status, cursor=cursor)
+    etag = _list_etags.get(_etag_key(params))
+    response = await _async_get(params, site='list', headers={'If-None-Match': etag} if etag else None)
+    if response.status_code == 304:
+        return None
+    response.raise_for_status()
+    _remember_etag(params, response)
+    return _decode_json(response.content)
+
+async def fetch_list_total_async(status: str = None) -> Optional[int]:
+    """
+    以 limit=1 探测列表总数，供不支持 ETag 的后端判断数据是否有增删。
+    :return: 总数；请求失败时返回 None（调用方应视为“未知”，而不是 0）
+    """
+    try:
+        response = await _async_get(_list_params(0, 1, status), site='stats')
+        response.raise_for_status()
+        return _extract_count(_decode_json(response.content))
+    except BackendUnavailableError as be:
+        logger.warning(f"后端暂不可用，跳过总数探测: {be}")
+    except Exception as e:
+        logger.error(f"总数探测失败: {e}")
+    return None
+
+async def fetch_status_counts_async() -> Optional[Dict[str, int]]:
+    """
+    各后端状态的记录数 {status: count}，供本地镜像核对数据是否漂移。
+    分组计数接口可用时一次请求，否则逐状态以 limit=1 探测总数。
+    :return: 任一状态获取失败时返回 None
+    """
+    if _grouped_counts_enabled():
+        counts = await fetch_grouped_counts_async()
+        if counts is not None:
+            return {status: counts.get(status, 0) for status in STATUS_NAME_MAP}
+    totals = await asyncio.gather(*(fetch_list_total_async(status) for status in STATUS_NAME_MAP))
+    if any(total is None for total in totals):
+        return None
+    return dict(zip(STATUS_NAME_MAP, totals))
+
+def backend_circuit_open() -> bool:
+    """上游是否处于熔断（快速失败）状态；本地镜像据此决定数据落后时是否仍以本地数据兜底"""
+    return _breaker.state == CircuitBreaker.OPEN
+
 # --- 测试运行入口 ---
 # if __name__ == "__main__":
 #     print("--- 正在执行后端 API 统计测试 ---")
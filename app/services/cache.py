@@ -0,0 +1,193 @@
+"""
+文件职责：
+    进程内缓存工具 (cache.py)。
+    为数据服务层提供与具体业务无关的缓存原语，所有实现都运行在 NiceGUI 的单一事件循环内，无需加锁。
+核心功能：
+    - SingleFlight：同一 key 的并发请求共享一次上游调用（请求合并）。
+    - AsyncTTLCache：TTL 缓存，过期后先返回旧值并在后台刷新（stale-while-revalidate）。
+    - LRUTTLCache：容量受限的 LRU + TTL 缓存，用于分页数据等 key 数量不可控的场景。
+    - 命名缓存的查询结果计入 cache_requests_total{cache, result}，用于计算命中率。
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+from app.services.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+Loader = Callable[[], Awaitable[Any]]
+
+
+def _count(cache_name: Optional[str], result: str) -> None:
+    if cache_name:
+        metrics.inc('cache_requests_total', cache=cache_name, result=result)
+
+
+class SingleFlight:
+    """同一 key 同时只允许一个上游调用在途，其余调用方等待并共享其结果（或异常）。"""
+
+    def __init__(self):
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+
+    def in_flight(self, key: Hashable) -> bool:
+        return key in self._inflight
+
+    async def do(self, key: Hashable, loader: Loader) -> Any:
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(loader())
+            self._inflight[key] = future
+            future.add_done_callback(lambda f, k=key: self._on_done(k, f))
+        # shield：某个调用方被取消（如客户端断开）时，不影响其他等待者
+        return await asyncio.shield(future)
+
+    def _on_done(self, key: Hashable, future: asyncio.Future) -> None:
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+        # 标记异常已被读取，避免所有等待者都已取消时出现 "exception was never retrieved"
+        if not future.cancelled():
+            future.exception()
+
+
+class AsyncTTLCache:
+    """
+    异步 TTL 缓存（stale-while-revalidate + single-flight）。
+    - 命中且未过期：直接返回。
+    - 已过期但仍在 stale_ttl 宽限期内：立即返回旧值，同时在后台刷新。
+    - 未命中或超出宽限期：等待上游加载，并发未命中只触发一次加载。
+    :param ttl: 数据新鲜期（秒）
+    :param stale_ttl: 过期后允许继续返回旧值的宽限期（秒），None 表示始终允许
+    :param validator: 判断结果是否可写入缓存（如排除降级占位数据），None 表示全部缓存
+    :param name: 指标中的缓存名称，None 表示不记录命中率
+    on_refresh：可选的 (key) 回调，后台刷新成功完成后调用，供调用方把新值及时推送出去。
+    """
+
+    def __init__(self, ttl: float, stale_ttl: Optional[float] = None,
+                 validator: Optional[Callable[[Any], bool]] = None, name: Optional[str] = None):
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.validator = validator
+        self.name = name
+        self.on_refresh: Optional[Callable[[Hashable], None]] = None
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+        self._flight = SingleFlight()
+
+    async def get(self, key: Hashable, loader: Loader) -> Any:
+        entry = self._entries.get(key)
+        if entry is not None:
+            stored_at, value = entry
+            age = time.monotonic() - stored_at
+            if age < self.ttl:
+                _count(self.name, 'hit')
+                return value
+            if self.stale_ttl is None or age < self.ttl + self.stale_ttl:
+                _count(self.name, 'stale')
+                self._refresh_in_background(key, loader)
+                return value
+        _count(self.name, 'miss')
+        return await self._flight.do(key, lambda: self._load(key, loader))
+
+    async def refresh(self, key: Hashable, loader: Loader) -> Any:
+        """忽略新鲜期强制重新加载（仍与并发加载合并），结果按 validator 写回缓存"""
+        return await self._flight.do(key, lambda: self._load(key, loader))
+
+    def peek(self, key: Hashable) -> Optional[Any]:
+        """不触发加载，仅返回当前缓存值（可能已过期）"""
+        entry = self._entries.get(key)
+        return entry[1] if entry else None
+
+    def set(self, key: Hashable, value: Any) -> None:
+        self._entries[key] = (time.monotonic(), value)
+
+    def invalidate(self, key: Hashable = None) -> None:
+        """清除指定 key，未指定时清空全部"""
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+
+    async def _load(self, key: Hashable, loader: Loader) -> Any:
+        value = await loader()
+        if self.validator is None or self.validator(value):
+            self.set(key, value)
+        return value
+
+    def _refresh_in_background(self, key: Hashable, loader: Loader) -> None:
+        if self._flight.in_flight(key):
+            return
+        task = asyncio.ensure_future(self._flight.do(key, lambda: self._load(key, loader)))
+        task.add_done_callback(lambda t, k=key: self._on_background_refresh(k, t))
+
+    def _on_background_refresh(self, key: Hashable, task: asyncio.Future) -> None:
+        if task.cancelled():
+            return
+        if task.exception() is not None:
+            logger.error(f"缓存后台刷新失败: {task.exception()}")
+        elif self.on_refresh is not None:
+            self.on_refresh(key)
+
+
+class LRUTTLCache:
+    """
+    LRU + TTL 缓存：超出 max_entries 时淘汰最久未使用的条目，超过 ttl 的条目视为未命中。
+    :param max_entries: 最大条目数
+    :param ttl: 条目有效期（秒）
+    :param name: 指标中的缓存名称，None 表示不记录命中率
+    """
+
+    def __init__(self, max_entries: int, ttl: float, name: Optional[str] = None):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.name = name
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+
+    def __contains__(self, key: Hashable) -> bool:
+        # 成员判断（如预取前检查）不计入命中率
+        return self._lookup(key) is not None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        value = self._lookup(key)
+        _count(self.name, 'miss' if value is None else 'hit')
+        return value
+
+    def _lookup(self, key: Hashable) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, value = entry
+        # 过期条目视为未命中，但保留到被 LRU 淘汰或覆盖，供上游不可用时 peek 兜底
+        if time.monotonic() - stored_at >= self.ttl:
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def peek(self, key: Hashable) -> Optional[Any]:
+        """不检查有效期、不调整 LRU 顺序，返回最近一次写入的值（可能已过期）"""
+        entry = self._entries.get(key)
+        return entry[1] if entry else None
+
+    def age(self, key: Hashable) -> Optional[float]:
+        """条目写入至今的秒数（不检查有效期），不存在时返回 None"""
+        entry = self._entries.get(key)
+        return time.monotonic() - entry[0] if entry else None
+
+    def set(self, key: Hashable, value: Any) -> None:
+        self._entries[key] = (time.monotonic(), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, predicate: Callable[[Hashable], bool] = None) -> None:
+        """清除满足 predicate(key) 的条目，未指定时清空全部"""
+        if predicate is None:
+            self._entries.clear()
+            return
+        for key in [k for k in self._entries if predicate(k)]:
+            del self._entries[key]
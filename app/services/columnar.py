@@ -0,0 +1,267 @@
+"""
+文件职责：
+    列式内存记录缓存 (columnar.py)。
+    以列而非逐行字典保存全部解析记录：状态为 1 字节编码，创建时间为 int64 秒（UTC）+ int16 时区偏移（分钟），
+    汉字 / 拼音 / 创建人 / 审核意见经字符串池字典编码为 int32；按状态、日期范围、创建人过滤时
+    只在列上运算，仅把当前可见的一页还原为与 _format_data_items 一致的行字典。
+核心功能：
+    - ColumnarRecords.add：追加一条原始记录；seal：全量装载（按新到旧顺序）完成后翻转为按时间升序。
+    - ColumnarRecords.page：过滤 + 倒序分页，出参与清洗后的分页结构一致。
+    - ColumnarRecords.set_status：把上游新读到的状态写回单条记录（经 id -> 下标索引定位）。
+说明：
+    - 存储始终使用标准库 array（每条记录约 22 字节 + id 字符串与索引项），numpy 可用时以零拷贝视图做向量化过滤，
+      否则退化为逐条比较；仅按状态过滤时总数取自计数器，分页扫描到够一页即停止。
+    - 创建时间按 datetime.fromisoformat 换算到 UTC（不带时区的按 UTC 解释，与趋势分桶一致），日期范围按 UTC 比较；
+      展示时加回原始偏移，与清洗后的分页显示同一墙上时间。
+"""
+
+import sys
+from array import array
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # numpy 为可选依赖
+    np = None
+
+from app.config.constants import STATUS_DISPLAY_MAP
+
+# 后端状态 -> 1 字节编码；未知状态编码为 -1（展示为“待审核”，与 _format_data_items 一致）
+STATUS_KEYS: Tuple[str, ...] = tuple(STATUS_DISPLAY_MAP)
+STATUS_CODES: Dict[str, int] = {key: code for code, key in enumerate(STATUS_KEYS)}
+# 创建时间缺失或无法解析时的占位值，任何日期范围过滤都不会命中
+MISSING_TS = -(2 ** 63)
+
+_EMPTY_COMMENTS = ("string", None, "")
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _parse_created(value: Any) -> Tuple[int, int]:
+    """ISO 时间字符串 -> (UTC 秒级时间戳, 时区偏移分钟数)；不带时区的按 UTC 解释，缺失或无法解析时为 (MISSING_TS, 0)"""
+    if not value or not isinstance(value, str):
+        return MISSING_TS, 0
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return MISSING_TS, 0
+    offset = parsed.utcoffset()
+    if offset is None:
+        return int((parsed - _EPOCH).total_seconds()), 0
+    return int(parsed.timestamp()), int(offset.total_seconds()) // 60
+
+
+def parse_timestamp(value: Any) -> int:
+    """ISO 时间或日期字符串 -> UTC 秒级时间戳（带时区偏移的按偏移换算）；缺失或无法解析时为 MISSING_TS"""
+    return _parse_created(value)[0]
+
+
+def _format_ts(ts: int, offset: int = 0) -> str:
+    if ts == MISSING_TS:
+        return ''
+    return datetime.fromtimestamp(ts + offset * 60, tz=timezone.utc).strftime('%Y-%m-%d %H:%M')
+
+
+class StringPool:
+    """字符串字典编码：相同取值只保存一份，列中只存 int32 编码"""
+
+    def __init__(self):
+        self.values: List[Any] = []
+        self._codes: Dict[Any, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def encode(self, value: Any) -> int:
+        code = self._codes.get(value)
+        if code is None:
+            code = self._codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def lookup(self, value: Any) -> Optional[int]:
+        return self._codes.get(value)
+
+
+class ColumnarRecords:
+    """
+    按时间升序保存的列式记录集。
+    全量装载时按上游顺序（新到旧）追加，结束后调用 seal 翻转；此后增量记录比已有记录都新，直接追加即可保持有序。
+    """
+
+    def __init__(self):
+        self.ids: List[Any] = []
+        self.status = array('b')
+        self.created = array('q')
+        self.offset = array('h')
+        self.creator = array('i')
+        self.word = array('i')
+        self.pinyin = array('i')
+        self.comment = array('i')
+        self.creators = StringPool()
+        self.words = StringPool()
+        self.pinyins = StringPool()
+        self.comments = StringPool()
+        self.status_counts: Counter = Counter()
+        # id -> 下标；全量装载时为装载顺序，seal 翻转后重建
+        self._positions: Dict[Any, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def add(self, item: Dict[str, Any]) -> None:
+        get = item.get
+        pinyin_data = get('pronunciation')
+        comment = get('review_comment')
+        code = STATUS_CODES.get(get('status'), -1)
+        created, offset = _parse_created(get('created_at'))
+        record_id = get('id') or get('_id', '-')
+        self._positions[record_id] = len(self.ids)
+        self.ids.append(record_id)
+        self.status.append(code)
+        self.created.append(created)
+        self.offset.append(offset)
+        self.creator.append(self.creators.encode(get('creator_id') or None))
+        self.word.append(self.words.encode(get('word', '-')))
+        self.pinyin.append(self.pinyins.encode(
+            pinyin_data.get('pinyin', '-') if pinyin_data and isinstance(pinyin_data, dict) else '-'
+        ))
+        self.comment.append(self.comments.encode(comment if comment not in _EMPTY_COMMENTS else "无"))
+        self.status_counts[code] += 1
+
+    def seal(self) -> None:
+        """全量装载完成：把新到旧的装载顺序翻转为时间升序"""
+        for column in (self.ids, self.status, self.created, self.offset, self.creator, self.word, self.pinyin,
+                       self.comment):
+            column.reverse()
+        self._positions = {record_id: i for i, record_id in enumerate(self.ids)}
+
+    def set_status(self, record_id: Any, status: Optional[str]) -> bool:
+        """
+        功能：把一条已装载记录的状态改为 status（后端状态）。
+        说明：按 id 索引定位，与创建时间是否缺失、是否有序无关；记录尚未计入时不做修改，留给下一轮增量或全量重建。
+        出参：状态是否发生变化。
+        """
+        i = self._positions.get(record_id)
+        if i is None:
+            return False
+        code = STATUS_CODES.get(status, -1)
+        old = self.status[i]
+        if old == code:
+            return False
+        self.status[i] = code
+        self.status_counts[old] -= 1
+        self.status_counts[code] += 1
+        return True
+
+    def memory_bytes(self) -> int:
+        """列、id 引用与 id 索引的大致字节数（不含字符串对象本身）"""
+        columns = (self.status, self.created, self.offset, self.creator, self.word, self.pinyin, self.comment)
+        return (sum(column.itemsize * len(column) for column in columns) + 8 * len(self.ids)
+                + sys.getsizeof(self._positions))
+
+    def page(self, skip: int, limit: int, status: Optional[str] = None, start: Optional[int] = None,
+             end: Optional[int] = None, creator: Optional[str] = None) -> Dict[str, Any]:
+        """
+        功能：过滤后按创建时间倒序分页。
+        入参：
+            - status: 后端状态；start / end: 创建时间范围 [start, end)，秒级时间戳；creator: 完整创建人 id。
+        出参：{'rows': 当前页的行字典, 'total': 命中总数}
+        """
+        indices, total = self._select(skip, limit, status, start, end, creator)
+        return {'rows': self.rows(indices), 'total': total}
+
+    def rows(self, indices: Iterable[int]) -> List[Dict[str, Any]]:
+        """把指定下标还原为与 _format_data_items 输出一致的行字典"""
+        display_status = STATUS_DISPLAY_MAP.get
+        creators, words, pinyins, comments = (self.creators.values, self.words.values,
+                                              self.pinyins.values, self.comments.values)
+        result = []
+        for i in indices:
+            code = self.status[i]
+            creator_id = creators[self.creator[i]]
+            result.append({
+                'id': self.ids[i],
+                'word': words[self.word[i]],
+                'pinyin': pinyins[self.pinyin[i]],
+                'status': display_status(STATUS_KEYS[code], '待审核') if code >= 0 else '待审核',
+                'creator_id': str(creator_id)[:8] if creator_id else 'system',
+                'created_at': _format_ts(self.created[i], self.offset[i]),
+                'review_comment': comments[self.comment[i]]
+            })
+        return result
+
+    def _criteria(self, status: Optional[str], start: Optional[int], end: Optional[int],
+                  creator: Optional[str]) -> Optional[Tuple[Optional[int], Optional[int], Optional[int], Optional[int]]]:
+        """把过滤条件换算为列编码；条件不可能命中时返回 None"""
+        status_code = creator_code = None
+        if status:
+            status_code = STATUS_CODES.get(status)
+            if status_code is None:
+                return None
+        if creator:
+            creator_code = self.creators.lookup(creator)
+            if creator_code is None:
+                return None
+        return status_code, start, end, creator_code
+
+    def _select(self, skip: int, limit: int, status: Optional[str], start: Optional[int], end: Optional[int],
+                creator: Optional[str]) -> Tuple[Sequence[int], int]:
+        n = len(self)
+        criteria = self._criteria(status, start, end, creator)
+        if criteria is None or not n:
+            return [], 0
+        status_code, start, end, creator_code = criteria
+
+        # 无过滤：下标直接由倒序位置换算
+        if status_code is None and start is None and end is None and creator_code is None:
+            first = n - 1 - skip
+            return range(first, max(first - limit, -1), -1), n
+
+        if np is not None:
+            return self._select_numpy(skip, limit, status_code, start, end, creator_code)
+        return self._select_scan(skip, limit, status_code, start, end, creator_code)
+
+    def _select_numpy(self, skip: int, limit: int, status_code: Optional[int], start: Optional[int],
+                      end: Optional[int], creator_code: Optional[int]) -> Tuple[Sequence[int], int]:
+        # frombuffer 是零拷贝视图；视图存活期间 array 不能扩容，因此只在本函数内持有
+        mask = None
+        if status_code is not None:
+            mask = np.frombuffer(self.status, dtype=np.int8) == status_code
+        if start is not None or end is not None:
+            created = np.frombuffer(self.created, dtype=np.int64)
+            if start is not None:
+                mask = created >= start if mask is None else mask & (created >= start)
+            if end is not None:
+                mask = (created < end) & (created != MISSING_TS) if mask is None else mask & (created < end) & (created != MISSING_TS)
+        if creator_code is not None:
+            hit = np.frombuffer(self.creator, dtype=np.int32) == creator_code
+            mask = hit if mask is None else mask & hit
+        matched = np.flatnonzero(mask)[::-1]
+        return matched[skip:skip + limit].tolist(), int(matched.size)
+
+    def _select_scan(self, skip: int, limit: int, status_code: Optional[int], start: Optional[int],
+                     end: Optional[int], creator_code: Optional[int]) -> Tuple[Sequence[int], int]:
+        # 只按状态过滤时总数取自计数器，扫描到够一页即可停止
+        status_only = start is None and end is None and creator_code is None
+        wanted = skip + limit
+        status_col, created_col, creator_col = self.status, self.created, self.creator
+        matched: List[int] = []
+        count = 0
+        for i in range(len(self) - 1, -1, -1):
+            if status_code is not None and status_col[i] != status_code:
+                continue
+            if start is not None and created_col[i] < start:
+                continue
+            if end is not None and (created_col[i] >= end or created_col[i] == MISSING_TS):
+                continue
+            if creator_code is not None and creator_col[i] != creator_code:
+                continue
+            if count >= skip and count < wanted:
+                matched.append(i)
+            count += 1
+            if status_only and count >= wanted:
+                break
+        total = self.status_counts.get(status_code, 0) if status_only else count
+        return matched, total
@@ -3,27 +3,55 @@
     数据服务与清洗模块 (services.py)。
     作为前端 UI 层与后端 API 层之间的适配器，负责业务逻辑处理、数据格式标准化及异常降级。
 核心功能：
-    - 统计聚合：获取状态分布、等级分布等图表所需数据。
+    - 统计聚合：获取状态分布、按创建人分布等图表所需数据。
+    - 汇总统计：按创建人的计数由增量聚合器维护，首轮全量遍历后只拉取高水位之后的新记录。
+    - 趋势统计：同一聚合器按 小时 / 天 / 周 预分桶新增与审核时间，输出经 LTTB 降采样的折线数据。
     - 分页列表：对接解析记录列表，支持按状态过滤、分页偏移计算。
     - 数据清洗（ETL）：统一处理空值兜底、时间格式化、ID 截断及状态码映射，确保前端展示的一致性。
+    - 统计缓存：状态分布统计经进程内共享缓存返回，所有客户端复用同一份上游结果。
+    - 跨进程缓存：多进程部署时，进程内缓存未命中先查询主进程的共享缓存服务，再访问上游；
+      汇总统计、列式缓存与镜像同步只由主导 worker 运行，其余 worker 从共享缓存读取汇总与趋势结果。
+    - 分页缓存：按 (状态, 页码) 缓存清洗后的分页数据，支持相邻页后台预取。
+    - 游标翻页：可选按 (created_at, id) 游标翻页，记住已访问页面的边界，上一页 / 下一页开销与页码无关。
+    - 自动刷新：以 ETag 条件请求或 limit=1 总数探测确认当前页是否变化，未变化时不重新拉取整页。
+    - 请求合并：相同 (skip, limit, 状态) 的并发列表请求共享一次上游调用与清洗结果。
+    - 全量遍历：按块并发拉取并清洗全部记录，供导出等批处理场景流式消费。
+    - 词条检索：优先使用后端 search 参数，并以本地增量索引兜底/补全。
+    - 本地镜像：可选把全部记录同步到 SQLite，完成全量同步且同步未落后时，分页、统计、检索、导出在线程池中以 SQL 读取本地。
+    - 列式缓存：可选以列式结构常驻全部记录，按状态 / 日期范围 / 创建人过滤，仅把可见页还原为行字典；
+      自动刷新仍向上游确认当前页，并把读到的状态写回缓存。
 """
 
+import asyncio
+import copy
 import logging
-from typing import List, Dict, Any
-from app.config.constants import STATUS_MAP, STATUS_DISPLAY_MAP, LAYOUT_CONFIG
+import time
+from collections import deque
+from typing import List, Dict, Any, AsyncIterator, Callable, Optional, Tuple
+from app.config.constants import (
+    STATUS_MAP, STATUS_DISPLAY_MAP, LAYOUT_CONFIG, CACHE_CONFIG, BACKEND_CONFIG, AUTO_REFRESH_CONFIG,
+    SUMMARY_CONFIG, TREND_CONFIG, MIRROR_CONFIG, COLUMNAR_CONFIG, MULTIWORKER_CONFIG
+)
+from app.services.cache import AsyncTTLCache, LRUTTLCache, SingleFlight
+from app.services.columnar import ColumnarRecords, parse_timestamp
+from app.services.mirror import MirrorSync, RecordMirror
+from app.services.search_index import RecordSearchIndex
+from app.services.shared_cache import SharedCacheClient, shared_load
+from app.services.summary_stats import SummaryAggregator
 
-# --- 修改这里：导入你真正的 API 函数 ---
+# --- 导入真正的 API 函数（同步版本供脚本使用，异步版本供页面直接 await） ---
 try:
-    from .backend_api import fetch_resolutions_stats, fetch_resolutions_list
+    from .backend_api import (
+        fetch_resolutions_stats, fetch_resolutions_list,
+        fetch_resolutions_stats_async, fetch_resolutions_list_async,
+        fetch_resolutions_list_if_changed_async, fetch_list_total_async, conditional_requests_supported,
+        stats_from_counts, fetch_status_counts_async, backend_circuit_open
+    )
     logging.info("成功连接到后端 API 模块")
 except ImportError:
+    # 异常处理注释：当后端模块不可用时启用 Mock 降级方案，确保前端演示流程不中断
     logging.warning("未找到后端 API 模块，启用 Mock 降级数据")
 
-try:
-    # 尝试从业务后端模块导入 API 函数
-    from backend_test.manager_api import fetch_resolutions_stats, fetch_resolutions_list
-except ImportError:
-    # 异常处理注释：当后端模块不可用时启用 Mock 降级方案，确保前端演示流程不中断
     def fetch_resolutions_stats(status=None):
         mock_data = [
             {"name": "草稿箱", "value": 120}, 
@@ -32,7 +60,34 @@ except ImportError:
             {"name": "已发布", "value": 850}
         ]
         return [d for d in mock_data if d['name'] in status] if status else mock_data
-        
+
+    def fetch_resolutions_list(skip=0, limit=15, status=None, search=None, cursor=None):
+        return {"items": [], "total": 0}
+
+    async def fetch_resolutions_stats_async(status=None):
+        return fetch_resolutions_stats(status=status)
+
+    async def fetch_resolutions_list_async(skip=0, limit=15, status=None, strict=False, search=None, site=None, cursor=None):
+        return fetch_resolutions_list(skip=skip, limit=limit, status=status, search=search)
+
+    async def fetch_resolutions_list_if_changed_async(skip=0, limit=15, status=None, cursor=None):
+        return fetch_resolutions_list(skip=skip, limit=limit, status=status)
+
+    async def fetch_list_total_async(status=None):
+        return None
+
+    def conditional_requests_supported():
+        return False
+
+    def stats_from_counts(counts, status=None):
+        data = [{"name": STATUS_DISPLAY_MAP.get(key, key), "value": value} for key, value in counts.items()]
+        return data or [{"name": "暂无数据", "value": 0}]
+
+    async def fetch_status_counts_async():
+        return None
+
+    def backend_circuit_open():
+        return False
 
 
 def get_status_statistics(status: str = None) -> List[Dict[str, Any]]:
@@ -41,6 +96,8 @@ def get_status_statistics(status: str = None) -> List[Dict[str, Any]]:
     入参：status (str, 可选): 指定过滤的状态名称。
     出参：包含 'name' 和 'value' 的字典列表。
     """
+    if _mirror_serving():
+        return stats_from_counts(_mirror.counts, status)
     try:
         data = fetch_resolutions_stats(status=status)
         return data if data else [{'value': 0, 'name': '暂无数据'}]
@@ -49,16 +106,148 @@ def get_status_statistics(status: str = None) -> List[Dict[str, Any]]:
         logging.error(f"统计数据加载异常: {e}")
         return [{'value': 0, 'name': '数据加载异常'}]
 
+# 降级占位项：不写入缓存，避免一次故障被缓存整个 TTL
+_STATS_FALLBACK_NAMES = {'数据加载异常', '系统异常'}
+
+def _is_cacheable_stats(data: List[Dict[str, Any]]) -> bool:
+    return bool(data) and not any(item.get('name') in _STATS_FALLBACK_NAMES for item in data)
+
+# 多进程部署时的跨进程共享缓存客户端（multiworker.py 经环境变量传入 socket 路径）；单进程运行时为 None
+_shared_cache: Optional[SharedCacheClient] = (
+    SharedCacheClient(MULTIWORKER_CONFIG['SHARED_CACHE_SOCKET']) if MULTIWORKER_CONFIG.get('SHARED_CACHE_SOCKET') else None
+)
+# 多进程部署时只有编号 0 的 worker（主导 worker）运行汇总统计、列式缓存与镜像同步，汇总与趋势结果经共享缓存
+# 发布给其余 worker；单进程运行时本进程即主导 worker
+_background_leader = _shared_cache is None or MULTIWORKER_CONFIG.get('WORKER_INDEX', '') in ('', '0')
+
+# 所有客户端共享的状态统计缓存（TTL + stale-while-revalidate + single-flight）
+_stats_cache = AsyncTTLCache(
+    ttl=CACHE_CONFIG.get('STATS_TTL', 30),
+    stale_ttl=CACHE_CONFIG.get('STATS_STALE_TTL', 300),
+    validator=_is_cacheable_stats,
+    name='stats'
+)
+
+async def _load_status_statistics(status: str = None) -> List[Dict[str, Any]]:
+    """进程内缓存的加载函数：多进程部署时先查共享缓存，其他 worker 刚拉取过的结果直接复用"""
+    return await shared_load(_shared_cache, 'stats', status or '', lambda: _load_status_statistics_upstream(status),
+                             ttl=MULTIWORKER_CONFIG.get('SHARED_STATS_TTL', 10), validator=_is_cacheable_stats)
+
+async def _load_status_statistics_upstream(status: str = None) -> List[Dict[str, Any]]:
+    if _mirror_serving():
+        return stats_from_counts(_mirror.counts, status)
+    try:
+        data = await fetch_resolutions_stats_async(status=status)
+        return data if data else [{'value': 0, 'name': '暂无数据'}]
+    except Exception as e:
+        logging.error(f"统计数据加载异常: {e}")
+        return [{'value': 0, 'name': '数据加载异常'}]
+
+def _last_good_stats(key: str, data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """上游失败或熔断时得到的是降级占位数据，此时改用缓存中最近一次成功的结果（即使已过期）"""
+    if _is_cacheable_stats(data):
+        return data
+    return _stats_cache.peek(key) or data
+
+async def get_status_statistics_async(status: str = None) -> List[Dict[str, Any]]:
+    """
+    功能：get_status_statistics 的异步版本，由页面处理函数直接 await。
+    说明：结果经进程内共享缓存返回；过期后先返回旧值并后台刷新，并发未命中只请求一次上游；
+          上游失败或熔断时回退到最近一次成功的结果。
+    入参/出参：同 get_status_statistics（返回副本，调用方可自由修改）。
+    """
+    key = status or ''
+    data = await _stats_cache.get(key, lambda: _load_status_statistics(status))
+    return copy.deepcopy(_last_good_stats(key, data))
+
+def on_status_statistics_refreshed(callback: Callable[[], None]) -> None:
+    """
+    功能：注册状态统计后台刷新完成的回调（无参数）。
+    说明：缓存过期后读取方先拿到旧值、上游结果稍后才写回缓存，回调用于让推送方及时重新读取。
+    """
+    _stats_cache.on_refresh = lambda key: callback()
+
 def get_summary_statistics() -> List[Dict[str, Any]]:
     """
-    功能：获取系统概览或等级分布的统计数据。
-    出参：固定格式的等级分布列表（当前为静态数据，后期可对接接口）。
+    功能：获取系统日志卡片的按创建人分布（用于玫瑰图与柱状图），名称与详情表的创建人列一致。
+    说明：只读取增量聚合器的当前结果，不访问上游；聚合器由 get_summary_statistics_async 推进，
+          首轮全量统计完成前（以及非主导 worker 上）返回“统计中”占位项。
+    出参：包含 'name' 和 'value' 的字典列表。
+    """
+    return _summary_aggregator.creator_distribution()
+
+async def get_summary_statistics_async() -> List[Dict[str, Any]]:
+    """
+    功能：推进汇总统计聚合器并返回最新的按创建人分布，供应用级统计聚合器 (live_stats) 周期调度。
+    说明：首次调用在后台启动全量统计；此后每轮只拉取高水位之后的新记录（通常一次请求）。
+          多进程部署时只有主导 worker 推进聚合器并发布结果，其余 worker 读取共享缓存。
     """
-    return [
-        {'value': 50, 'name': '等级一'}, 
-        {'value': 40, 'name': '等级二'}, 
-        {'value': 30, 'name': '等级三'}
-    ]
+    if not _background_leader:
+        return await _read_shared_summary('creators') or get_summary_statistics()
+    fresh = await _summary_aggregator.refresh()
+    await _publish_summary(fresh)
+    return get_summary_statistics()
+
+async def get_trend_series_async(event: str = 'created', granularity: str = 'day', days: int = 0) -> Dict[str, Any]:
+    """
+    功能：获取按状态拆分的新增 / 审核趋势（用于趋势折线图）。
+    说明：数据来自汇总统计聚合器的预分桶汇总，不逐条扫描记录；每条折线经 LTTB 降采样到
+          至多 TREND_CONFIG['MAX_POINTS'] 个点，时间跨度再长，推送给浏览器的数据量也有上限；
+          多进程部署时非主导 worker 读取主导 worker 发布的同一组合结果，尚未发布时 ready 为 False。
+    入参：
+        - event (str): 'created'（按 created_at）或 'reviewed'（按 reviewed_at）。
+        - granularity (str): 'hour' / 'day' / 'week'。
+        - days (int): 只保留最近 days 天，0 表示全部。
+    出参：{'ready': 首轮全量统计是否完成, 'series': {状态中文名: [[毫秒时间戳, 计数], ...]}}
+    """
+    if not _background_leader:
+        return await _read_shared_summary(_trend_key(event, granularity, days)) or {'ready': False, 'series': {}}
+    await _summary_aggregator.refresh()
+    return _trend_series(event, granularity, days)
+
+def _trend_key(event: str, granularity: str, days: int) -> str:
+    return f'trend|{event}|{granularity}|{int(days)}'
+
+def _trend_series(event: str, granularity: str, days: int) -> Dict[str, Any]:
+    """功能：【内部工具】由聚合器的当前结果计算一条趋势，出参同 get_trend_series_async。"""
+    since_ms = int((time.time() - days * 86400) * 1000) if days else None
+    series = _summary_aggregator.trend_series(event, granularity, since_ms, TREND_CONFIG.get('MAX_POINTS', 300))
+    return {
+        'ready': _summary_aggregator.ready,
+        'series': {STATUS_DISPLAY_MAP.get(status, status): points for status, points in series.items()}
+    }
+
+# 主导 worker 最近一次发布时的 (聚合器 built_at, time.monotonic())
+_summary_published: Tuple[Optional[float], float] = (None, 0.0)
+# 非主导 worker 最近一次从共享缓存读到的汇总结果（共享缓存暂不可用或条目被淘汰时沿用）
+_shared_summary: Dict[str, Any] = {}
+
+async def _publish_summary(fresh: bool) -> None:
+    """
+    功能：【内部工具】主导 worker 把按创建人分布与全部 事件 × 粒度 × 时间范围 的趋势发布到共享缓存（仅多进程部署）。
+    说明：有新记录计入、全量重建完成或距上次发布超过半个有效期时才重新发布。
+    """
+    global _summary_published
+    if _shared_cache is None or not _summary_aggregator.ready:
+        return
+    ttl = MULTIWORKER_CONFIG.get('SHARED_SUMMARY_TTL', 120)
+    built_at, published_at = _summary_published
+    if not fresh and built_at == _summary_aggregator.built_at and time.monotonic() - published_at < ttl / 2:
+        return
+    _summary_published = (_summary_aggregator.built_at, time.monotonic())
+    await _shared_cache.set('summary', 'creators', get_summary_statistics(), ttl)
+    for event in TREND_CONFIG['EVENTS']:
+        for granularity in TREND_CONFIG['GRANULARITIES']:
+            for days in set(TREND_CONFIG['RANGES'].values()):
+                await _shared_cache.set('summary', _trend_key(event, granularity, days),
+                                        _trend_series(event, granularity, days), ttl)
+
+async def _read_shared_summary(key: str) -> Optional[Any]:
+    """功能：【内部工具】非主导 worker 读取主导 worker 发布的汇总结果，读不到时返回本进程上次读到的值（或 None）。"""
+    value = await _shared_cache.get('summary', key)
+    if value is not None:
+        _shared_summary[key] = value
+    return _shared_summary.get(key)
 
 def _format_data_item(item: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -82,43 +271,571 @@ def _format_data_item(item: Dict[str, Any]) -> Dict[str, Any]:
         'review_comment': item.get('review_comment') if item.get('review_comment') not in ["string", None, ""] else "无"
     }
 
+# 审核意见的无效占位值（后端 Swagger 默认值 "string" 也视为空）
+_EMPTY_COMMENTS = ("string", None, "")
+
+def _format_data_items(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    功能：【内部工具】_format_data_item 的批量版本，一次遍历格式化整批原始记录。
+    说明：输出与逐条调用 _format_data_item 完全一致；通过预绑定状态查表函数、
+          每条记录只读取一次各字段、先截取后替换时间分隔符（等长替换，结果不变）等方式
+          减少导出与大分页场景下的逐行开销（对比见 benchmarks/bench_formatter.py）。
+    入参：items (List[Dict]): 后端返回的原始字典列表。
+    出参：清洗后的字典列表。
+    """
+    display_status = STATUS_DISPLAY_MAP.get
+    empty_comments = _EMPTY_COMMENTS
+    rows = []
+    append = rows.append
+    for item in items:
+        get = item.get
+        pinyin_data = get('pronunciation')
+        creator_id = get('creator_id')
+        created_at = get('created_at')
+        comment = get('review_comment')
+        append({
+            'id': get('id') or get('_id', '-'),
+            'word': get('word', '-'),
+            'pinyin': pinyin_data.get('pinyin', '-') if pinyin_data and isinstance(pinyin_data, dict) else '-',
+            'status': display_status(get('status'), '待审核'),
+            'creator_id': str(creator_id)[:8] if creator_id else 'system',
+            'created_at': created_at[:16].replace('T', ' ') if created_at else '',
+            'review_comment': comment if comment not in empty_comments else "无"
+        })
+    return rows
+
+def _resolve_page_query(page: int, status: str = None) -> tuple:
+    """
+    功能：【内部工具】将页码与前端状态标签转换为后端查询参数。
+    出参：(skip, limit, backend_status)
+    """
+    # 复杂逻辑（分页计算）：根据全局配置计算跳过的记录数 (Skip)
+    page_size = LAYOUT_CONFIG.get('PAGE_SIZE', 15)
+    skip = (page - 1) * page_size
+    return skip, page_size, _resolve_backend_status(status)
+
+def _resolve_backend_status(status: str = None) -> str:
+    """
+    功能：【内部工具】状态映射处理：将前端的“友好标签”转换为后端 API 识别的“业务编码”。
+    """
+    if status and status != "EXCLUDE_DRAFT":
+        return STATUS_MAP.get(status, status)
+    return None
+
+def _boundary_key(item: Dict[str, Any]) -> Optional[Tuple[str, str]]:
+    """
+    功能：【内部工具】取原始记录的游标键 (created_at, id)，任一字段缺失时返回 None。
+    说明：必须使用原始值，清洗后的 created_at 已截断到分钟，不能唯一定位记录。
+    """
+    created_at, record_id = item.get('created_at'), item.get('id')
+    return (created_at, record_id) if created_at and record_id else None
+
+def _extract_list_items(raw: Any) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    功能：【内部工具】兼容多种列表响应结构，取出原始记录列表与总数。
+    出参：(items, total)
+    """
+    # ✅ 增加更多兼容性判断
+    if isinstance(raw, list):
+        return raw, len(raw)
+    if isinstance(raw, dict):
+        # 尝试所有可能的键名：items, data, 或直接是列表
+        items = raw.get('items') or raw.get('data') or []
+        return items, raw.get('total') or len(items)
+    return [], 0
+
+def _clean_list_payload(raw: Any, index: bool = True) -> Dict[str, Any]:
+    """
+    功能：【内部工具】兼容多种列表响应结构，并执行批量数据清洗。
+    入参：index (bool): 是否顺带写入本地检索索引；导出等批量遍历传 False，避免整表数据挤掉用户浏览过的记录。
+    出参：包含 'rows'、'total' 和 'last_key'（末行游标键，供游标翻页使用）的字典。
+    """
+    items, total = _extract_list_items(raw)
+    
+    # 批量数据清洗：一次遍历格式化整批记录
+    processed = _format_data_items(items)
+
+    # 顺带写入本地检索索引，页面浏览过的记录都可被检索
+    if index:
+        _search_index.add_rows(processed)
+    
+    return {'rows': processed, 'total': total, 'last_key': _boundary_key(items[-1]) if items else None}
+
+async def _fetch_upstream_chunk(skip: int, limit: int) -> Tuple[List[Dict[str, Any]], int]:
+    """功能：【内部工具】从上游拉取一块原始记录（不清洗），失败时抛出异常；供镜像同步使用。"""
+    raw = await fetch_resolutions_list_async(skip=skip, limit=limit, strict=True, site='export')
+    return _extract_list_items(raw)
+
+async def _fetch_summary_chunk(skip: int, limit: int) -> Tuple[List[Dict[str, Any]], int]:
+    """功能：【内部工具】为汇总统计聚合器拉取一块原始记录（聚合需要原始的创建人与时间字段）；镜像可用时读本地。"""
+    if _mirror_serving():
+        return await asyncio.to_thread(_mirror.page, skip, limit)
+    return await _fetch_upstream_chunk(skip, limit)
+
+# 本地 SQLite 镜像（MIRROR_CONFIG['ENABLED']）：由后台任务同步，完成过一次全量同步后接管读取路径
+_mirror: Optional[RecordMirror] = RecordMirror(MIRROR_CONFIG.get('PATH', 'data/mirror.sqlite3')) if MIRROR_CONFIG.get('ENABLED') else None
+_mirror_sync: Optional[MirrorSync] = (
+    MirrorSync(_mirror, _fetch_upstream_chunk, MIRROR_CONFIG, fetch_status_counts_async, leader=_background_leader)
+    if _mirror else None
+)
+
+def _mirror_serving() -> bool:
+    """
+    镜像可以接管读取：完成过全量同步，且最近一次成功同步在 MAX_LAG 秒内。
+    同步长时间失败或重启后尚未同步时回到上游；上游熔断时才以落后的本地数据兜底（离线模式）。
+    """
+    if _mirror is None or not _mirror.ready or not MIRROR_CONFIG.get('SERVE_READS', True):
+        return False
+    return _mirror.lag() <= MIRROR_CONFIG.get('MAX_LAG', 180) or backend_circuit_open()
+
+def _mirror_page(skip: int, limit: int, backend_status: Optional[str] = None) -> Dict[str, Any]:
+    """功能：【内部工具】从本地镜像读取并清洗一段记录，结构同 _clean_list_payload。"""
+    items, total = _mirror.page(skip, limit, backend_status)
+    return _clean_list_payload({'items': items, 'total': total})
+
+def _columnar_records() -> Optional[ColumnarRecords]:
+    """列式缓存已完成全量装载、且允许接管读取时返回它，否则返回 None"""
+    if not COLUMNAR_CONFIG.get('SERVE_READS', True) or not _summary_aggregator.ready:
+        return None
+    return _summary_aggregator.tables.records
+
+def _local_page(skip: int, limit: int, backend_status: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """
+    功能：【内部工具】本地数据源可用时直接返回清洗后的一段记录，否则返回 None（调用方继续访问上游）。
+    说明：列式内存缓存优先，其次 SQLite 镜像。
+    """
+    records = _columnar_records()
+    if records is not None:
+        return records.page(skip, limit, backend_status)
+    if _mirror_serving():
+        return _mirror_page(skip, limit, backend_status)
+    return None
+
+async def _local_page_async(skip: int, limit: int, backend_status: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """功能：【内部工具】_local_page 的异步版本：SQLite 镜像的查询放到线程池执行，不阻塞事件循环。"""
+    records = _columnar_records()
+    if records is not None:
+        return records.page(skip, limit, backend_status)
+    if _mirror_serving():
+        items, total = await asyncio.to_thread(_mirror.page, skip, limit, backend_status)
+        return _clean_list_payload({'items': items, 'total': total})
+    return None
+
+def filter_records(page: int = 1, status: str = None, start: str = None, end: str = None,
+                   creator: str = None) -> Dict[str, Any]:
+    """
+    功能：在列式内存缓存上按状态、创建日期范围与创建人过滤，按创建时间倒序分页。
+    入参：
+        - page / status：同 get_cleaned_data。
+        - start / end (str, 可选): 创建时间范围 [start, end)，ISO 日期或时间字符串（如 '2025-01-01'）。
+        - creator (str, 可选): 完整的创建人 id。
+    出参：包含 'rows'、'total' 和 'available'（列式缓存是否可用）的字典；缓存不可用时返回空结果。
+    """
+    records = _columnar_records()
+    if records is None:
+        return {'rows': [], 'total': 0, 'available': False}
+    skip, page_size, backend_status = _resolve_page_query(page, status)
+    result = records.page(
+        skip, page_size, backend_status,
+        start=parse_timestamp(start) if start else None,
+        end=parse_timestamp(end) if end else None,
+        creator=creator
+    )
+    return {**result, 'available': True}
+
+def get_filter_options() -> Dict[str, Any]:
+    """
+    功能：详情页筛选面板的选项。
+    出参：{'available': 列式缓存是否可用, 'creators': {完整创建人 id: 展示名（id 前 8 位）}}，
+          创建人按记录数降序，至多 COLUMNAR_CONFIG['FILTER_CREATOR_OPTIONS'] 个。
+    """
+    if _columnar_records() is None:
+        return {'available': False, 'creators': {}}
+    limit = COLUMNAR_CONFIG.get('FILTER_CREATOR_OPTIONS', 200)
+    return {'available': True, 'creators': {creator: creator[:8] for creator in _summary_aggregator.creator_ids()[:limit]}}
+
+def _apply_statuses_to_columnar(rows: List[Dict[str, Any]]) -> None:
+    """功能：【内部工具】把上游新读到的一页记录的状态写回列式缓存，此后的本地分页 / 导出立即反映改状态。"""
+    records = _columnar_records()
+    if records is None:
+        return
+    for row in rows:
+        records.set_status(row['id'], STATUS_MAP.get(row['status']))
+
+def start_mirror_sync() -> None:
+    """功能：启动本地镜像的后台同步任务（未启用镜像时为空操作；非主导 worker 只跟随读取同步状态），供 app.on_startup 调用。"""
+    if _mirror_sync is not None:
+        _mirror_sync.start()
+
+async def stop_mirror_sync() -> None:
+    """功能：停止本地镜像的后台同步任务，供 app.on_shutdown 调用。"""
+    if _mirror_sync is not None:
+        await _mirror_sync.stop()
+
+async def close_shared_cache() -> None:
+    """功能：关闭到共享缓存服务的连接（仅多进程部署时存在），供 app.on_shutdown 调用。"""
+    if _shared_cache is not None:
+        await _shared_cache.close()
+
+async def _cached_status_counts() -> Optional[Dict[str, int]]:
+    """功能：【内部工具】由状态统计缓存换算出 {后端状态: 记录数}，供聚合器发现改状态，不额外请求上游；统计不可用时返回 None。"""
+    data = await get_status_statistics_async()
+    if not _is_cacheable_stats(data) or any(item['name'] not in STATUS_MAP for item in data):
+        return None
+    return {STATUS_MAP[item['name']]: item['value'] for item in data}
+
+# 按创建人计数与趋势预分桶的增量聚合器：首轮全量，此后只拉取高水位之后的新记录（只在主导 worker 上推进）
+_summary_aggregator = SummaryAggregator(_fetch_summary_chunk, SUMMARY_CONFIG, TREND_CONFIG.get('EVENT_FIELDS'),
+                                        columnar=COLUMNAR_CONFIG.get('ENABLED', False) and _background_leader,
+                                        fetch_counts=_cached_status_counts)
+
+# 本地检索索引：由 _clean_list_payload 增量维护（导出遍历的分块不写入）
+_search_index = RecordSearchIndex(max_records=CACHE_CONFIG.get('SEARCH_INDEX_SIZE', 50000))
+# 后端 search 参数降级状态（auto 模式）：连续出现 SEARCH_DEMOTE_AFTER 次“不支持”迹象后，
+# SEARCH_DEMOTE_SECONDS 秒内只查本地索引，到期后重新尝试后端
+_backend_search_strikes = 0
+_backend_search_demoted_until = 0.0
+
 def get_cleaned_data(page: int = 1, status: str = None) -> Dict[str, Any]:
     """
     功能：分页获取解析记录并执行全量数据清洗。
     入参：
         - page (int): 当前请求的页码。
         - status (str, 可选): 前端传入的状态过滤标识。
+    说明：BACKEND_CONFIG['PAGINATION_MODE'] 为 'keyset' 且已访问过上一页时，按游标翻页，否则按偏移分页。
     出参：包含 'rows' (清洗后的数据列表) 和 'total' (总记录数) 的字典。
     """
-    # 复杂逻辑（分页计算）：根据全局配置计算跳过的记录数 (Skip)
-    page_size = LAYOUT_CONFIG.get('PAGE_SIZE', 15)
-    skip = (page - 1) * page_size
-    
-    # 1. 状态映射处理：将前端的“友好标签”转换为后端 API 识别的“业务编码”
-    backend_status = None
-    if status and status != "EXCLUDE_DRAFT":
-        backend_status = STATUS_MAP.get(status, status)
+    skip, page_size, backend_status = _resolve_page_query(page, status)
+    local = _local_page(skip, page_size, backend_status)
+    if local is not None:
+        return local
 
     try:
-        # 2. 调用后端异步/线程安全接口
-        raw = fetch_resolutions_list(skip=skip, limit=page_size, status=backend_status)
-       # ✅ 增加更多兼容性判断
-        if isinstance(raw, list):
-            items = raw
-            total = len(raw)
-        elif isinstance(raw, dict):
-            # 尝试所有可能的键名：items, data, 或直接是列表
-            items = raw.get('items') or raw.get('data') or []
-            total = raw.get('total') or len(items)
-        else:
-            items, total = [], 0
-        
-        # 4. 批量数据清洗：应用标准化格式化函数
-        processed = [_format_data_item(item) for item in items]
-        
-        return {'rows': processed, 'total': total}
+        raw = fetch_resolutions_list(skip=skip, limit=page_size, status=backend_status,
+                                     cursor=_page_cursor(backend_status, page))
+        result = _clean_list_payload(raw)
+        _remember_cursor(backend_status, page, result)
+        return result
         
     except Exception as e:
         # 异常处理注释：接口调用失败时返回空列表及 0 总数，防止前端表格加载无限 Loading 或崩溃
         logging.error(f"解析记录列表加载失败: {e}")
-        return {'rows': [], 'total': 0}
\ No newline at end of file
+        return {'rows': [], 'total': 0}
+
+# 分页缓存：key 为 (前端状态标签, 页码)，值为清洗后的 {'rows', 'total'}
+_page_cache = LRUTTLCache(
+    max_entries=CACHE_CONFIG.get('PAGE_CACHE_SIZE', 200),
+    ttl=CACHE_CONFIG.get('PAGE_TTL', 60),
+    name='page'
+)
+# 各状态最近一次获取到的总数，总数变化说明数据有增删，需作废该状态的全部分页
+_page_totals: Dict[str, int] = {}
+_page_flight = SingleFlight()
+# 游标翻页：key 为 (后端状态, 页码)，值为该页的起始游标（即上一页末行的 (created_at, id)）
+_page_cursors = LRUTTLCache(
+    max_entries=CACHE_CONFIG.get('CURSOR_CACHE_SIZE', 2000),
+    ttl=CACHE_CONFIG.get('CURSOR_TTL', 1800),
+    name='page_cursor'
+)
+
+def _keyset_enabled() -> bool:
+    return BACKEND_CONFIG.get('PAGINATION_MODE', 'offset') == 'keyset'
+
+def _page_cursor(backend_status: Optional[str], page: int) -> Optional[Tuple[str, str]]:
+    """
+    功能：【内部工具】返回第 page 页的起始游标。
+    说明：第 1 页、未启用游标模式或尚未访问过上一页时返回 None，此时回退为偏移分页。
+    """
+    if page <= 1 or not _keyset_enabled():
+        return None
+    return _page_cursors.get((backend_status or None, page))
+
+def _remember_cursor(backend_status: Optional[str], page: int, result: Dict[str, Any]) -> None:
+    """功能：【内部工具】记住第 page + 1 页的起始游标（即本页末行），此后“下一页”和返回“上一页”都无需偏移扫描。"""
+    if _keyset_enabled() and result.get('last_key'):
+        _page_cursors.set((backend_status or None, page + 1), result['last_key'])
+
+def _copy_page(result: Dict[str, Any]) -> Dict[str, Any]:
+    """缓存中的行会被页面追加 index_id 等字段，对外一律返回浅拷贝"""
+    return {**result, 'rows': [dict(row) for row in result['rows']]}
+
+# 列表请求合并：key 为归一化后的 (skip, limit, 后端状态)，分页、虚拟滚动、导出等入口共享
+_list_flight = SingleFlight()
+
+async def _load_cleaned_list(skip: int, limit: int, backend_status: Optional[str], site: Optional[str],
+                             cursor: Optional[Tuple[str, str]]) -> Dict[str, Any]:
+    raw = await fetch_resolutions_list_async(skip=skip, limit=limit, status=backend_status,
+                                             strict=True, site=site, cursor=cursor)
+    return _clean_list_payload(raw, index=site != 'export')
+
+async def _fetch_cleaned_list(skip: int, limit: int, backend_status: Optional[str] = None,
+                              site: Optional[str] = None, cursor: Optional[Tuple[str, str]] = None) -> Dict[str, Any]:
+    """
+    功能：拉取并清洗一段记录，失败时直接抛出异常。
+    说明：相同 (skip, limit, 后端状态, 游标) 的并发请求共享同一次上游调用与清洗结果
+          （“待审核”与 pending_review 归一化后视为同一请求），每个调用方拿到各自的行副本。
+    """
+    key = (0 if cursor else skip, limit, backend_status or None, cursor)
+    result = await _list_flight.do(key, lambda: _load_cleaned_list(skip, limit, backend_status, site, cursor))
+    return _copy_page(result)
+
+def _store_page(status_key: str, page: int, result: Dict[str, Any]) -> None:
+    # 空结果可能是接口降级返回，不写缓存也不参与总数比较
+    if not result['rows'] and not result['total']:
+        return
+    known_total = _page_totals.get(status_key)
+    if known_total is not None and known_total != result['total']:
+        logging.info(f"状态【{status_key or '全部'}】总数变化 {known_total} -> {result['total']}，作废分页缓存")
+        _page_cache.invalidate(lambda key: key[0] == status_key)
+    _page_totals[status_key] = result['total']
+    _page_cache.set((status_key, page), result)
+
+async def _fetch_page(page: int, status: str = None, use_cursor: bool = True,
+                      refresh_shared: bool = False) -> Dict[str, Any]:
+    """refresh_shared：已知数据可能变化（强制刷新、自动刷新探测到变化）时不读取跨进程共享缓存"""
+    skip, page_size, backend_status = _resolve_page_query(page, status)
+    cursor = _page_cursor(backend_status, page) if use_cursor else None
+
+    try:
+        result = await shared_load(
+            _shared_cache, 'page', f'{status or ""}|{page}',
+            lambda: _fetch_cleaned_list(skip, page_size, backend_status, cursor=cursor),
+            ttl=MULTIWORKER_CONFIG.get('SHARED_PAGE_TTL', 60),
+            validator=lambda page_result: bool(page_result['rows']), refresh=refresh_shared
+        )
+        if result.get('last_key'):
+            result['last_key'] = tuple(result['last_key'])  # 经共享缓存 JSON 往返后元组变为列表
+    except Exception as e:
+        # 上游失败或熔断：有该页的历史缓存（即使已过期）时优先展示，否则返回空页
+        stale = _page_cache.peek((status or '', page))
+        if stale is not None:
+            logging.warning(f"第 {page} 页加载失败，回退到最近一次成功的缓存数据: {e}")
+            return stale
+        logging.error(f"解析记录列表加载失败: {e}")
+        return {'rows': [], 'total': 0}
+
+    _store_page(status or '', page, result)
+    _remember_cursor(backend_status, page, result)
+    return result
+
+async def get_cleaned_data_async(page: int = 1, status: str = None, use_cache: bool = True,
+                                 use_cursor: bool = True) -> Dict[str, Any]:
+    """
+    功能：get_cleaned_data 的异步版本，由详情页 load_data 直接 await。
+    入参：
+        - page / status：同 get_cleaned_data。
+        - use_cache (bool): 是否优先读取分页缓存，False 时强制访问上游并刷新缓存。
+        - use_cursor (bool): 游标模式下是否使用已记住的页面起始游标；页码跳转传 False，固定走偏移分页。
+    出参：同 get_cleaned_data（返回副本，调用方可自由修改）。
+    """
+    local = await _local_page_async(*_resolve_page_query(page, status))
+    if local is not None:
+        return local
+
+    key = (status or '', page)
+    if use_cache:
+        cached = _page_cache.get(key)
+        if cached is not None:
+            # 缓存命中同样刷新下一页的起始游标（游标表的有效期可能短于浏览时长）
+            _remember_cursor(_resolve_backend_status(status), page, cached)
+            return _copy_page(cached)
+
+    # 同一页的预取与用户点击可能同时发生，合并为一次上游请求
+    result = await _page_flight.do(key, lambda: _fetch_page(page, status, use_cursor=use_cursor,
+                                                            refresh_shared=not use_cache))
+    return _copy_page(result)
+
+def _refresh_probe_mode() -> str:
+    """按 PROBE_MODE 与后端能力决定自动刷新的变化探测方式：'etag' 或 'total'"""
+    mode = AUTO_REFRESH_CONFIG.get('PROBE_MODE', 'auto')
+    if mode == 'auto':
+        return 'total' if conditional_requests_supported() is False else 'etag'
+    return mode
+
+async def _revalidate_page(page: int, status: str = None) -> Dict[str, Any]:
+    key = (status or '', page)
+    cached = _page_cache.peek(key)
+    if cached is None:
+        return await _fetch_page(page, status)
+
+    skip, page_size, backend_status = _resolve_page_query(page, status)
+    try:
+        if _refresh_probe_mode() == 'total':
+            total = await fetch_list_total_async(backend_status)
+            # 探测失败（None）时继续展示缓存；总数变化时重新拉取整页，_store_page 会作废该状态的其他分页
+            if total is not None and total != cached['total']:
+                return await _fetch_page(page, status, refresh_shared=True)
+        else:
+            raw = await fetch_resolutions_list_if_changed_async(
+                skip=skip, limit=page_size, status=backend_status, cursor=_page_cursor(backend_status, page)
+            )
+            if raw is not None:
+                result = _clean_list_payload(raw)
+                _store_page(status or '', page, result)
+                _remember_cursor(backend_status, page, result)
+                return result
+    except Exception as e:
+        logging.warning(f"第 {page} 页自动刷新失败，继续展示缓存数据: {e}")
+        return cached
+
+    # 已确认未变化：续期缓存，供其他标签页在 SHARED_WINDOW 内直接复用
+    _page_cache.set(key, cached)
+    return cached
+
+async def refresh_page_async(page: int = 1, status: str = None) -> Dict[str, Any]:
+    """
+    功能：详情页自动刷新：以最低开销重新确认当前页。
+    入参：page / status：同 get_cleaned_data。
+    出参：同 get_cleaned_data_async（返回副本）。数据未变化时返回与缓存相同的行，
+          页面经 patch_table_rows 比较后不会产生任何更新。
+    说明：
+        - 同一页在 SHARED_WINDOW 秒内已被任一标签页确认过时直接返回缓存，不访问上游；
+        - 'etag' 模式携带 If-None-Match 重新请求本页，未变化时上游只返回 304；
+        - 'total' 模式先以 limit=1 探测总数，总数未变化视为未变化（只能发现增删，发现不了原地修改）；
+        - 与同一页的加载 / 预取 / 其他标签页的刷新合并为一次上游调用；
+        - 本地镜像 / 列式缓存接管读取时也向上游确认（本地数据感知不到改状态），读到的状态写回列式缓存；
+          上游不可用时回退到本地数据。
+    """
+    key = (status or '', page)
+    age = _page_cache.age(key)
+    if age is not None and age < AUTO_REFRESH_CONFIG.get('SHARED_WINDOW', 5):
+        return _copy_page(_page_cache.peek(key))
+
+    result = await _page_flight.do(key, lambda: _revalidate_page(page, status))
+    if not result['rows'] and not result['total']:
+        local = await _local_page_async(*_resolve_page_query(page, status))
+        if local is not None:
+            return local
+    _apply_statuses_to_columnar(result['rows'])
+    return _copy_page(result)
+
+async def get_cleaned_window_async(skip: int, limit: int, status: str = None) -> Dict[str, Any]:
+    """
+    功能：按任意偏移获取一段清洗后的记录，供详情页虚拟滚动模式按需加载。
+    说明：窗口与分页边界不对齐，不经过分页缓存。
+    入参：
+        - skip (int): 起始偏移。
+        - limit (int): 窗口大小。
+        - status (str, 可选): 同 get_cleaned_data。
+    出参：包含 'rows' 和 'total' 的字典。
+    """
+    local = await _local_page_async(skip, limit, _resolve_backend_status(status))
+    if local is not None:
+        return local
+    try:
+        return await _fetch_cleaned_list(skip, limit, _resolve_backend_status(status))
+    except Exception as e:
+        logging.error(f"解析记录窗口加载失败: {e}")
+        return {'rows': [], 'total': 0}
+
+async def prefetch_pages(pages: List[int], status: str = None) -> None:
+    """
+    功能：后台预取指定页码并写入分页缓存，已缓存或越界（< 1）的页码会被跳过。
+    入参：pages (List[int]): 待预取页码；status：同 get_cleaned_data。
+    """
+    if _columnar_records() is not None or _mirror_serving():
+        return
+    for page in pages:
+        if page < 1 or (status or '', page) in _page_cache:
+            continue
+        await _page_flight.do((status or '', page), lambda p=page: _fetch_page(p, status))
+
+async def iter_cleaned_records(status: str = None, chunk_size: int = 1000,
+                               concurrency: int = 4) -> AsyncIterator[Tuple[List[Dict[str, Any]], int]]:
+    """
+    功能：按块遍历状态过滤下的全部记录，逐块清洗后按原始顺序产出。
+    说明：最多 concurrency 个分块同时在途，内存占用与总记录数无关；任一分块失败直接抛出异常，不静默丢数据。
+    入参：
+        - status (str, 可选): 同 get_cleaned_data。
+        - chunk_size (int): 每次请求的记录数。
+        - concurrency (int): 同时在途的分块请求数上限。
+    出参：异步迭代 (rows, total)，total 为首块返回的总记录数。
+    """
+    backend_status = _resolve_backend_status(status)
+
+    async def fetch_chunk(skip: int) -> Dict[str, Any]:
+        local = await _local_page_async(skip, chunk_size, backend_status)
+        if local is not None:
+            return local
+        return await _fetch_cleaned_list(skip, chunk_size, backend_status, site='export')
+
+    first = await fetch_chunk(0)
+    total = first['total']
+    yield first['rows'], total
+
+    pending: deque = deque()
+    try:
+        for skip in range(chunk_size, total, chunk_size):
+            pending.append(asyncio.ensure_future(fetch_chunk(skip)))
+            if len(pending) >= concurrency:
+                yield (await pending.popleft())['rows'], total
+        while pending:
+            yield (await pending.popleft())['rows'], total
+    finally:
+        # 消费方中途退出或出错时，取消尚未完成的分块请求
+        for task in pending:
+            task.cancel()
+
+def _backend_search_enabled() -> bool:
+    mode = BACKEND_CONFIG.get('SEARCH_MODE', 'auto')
+    if mode == 'local':
+        return False
+    return mode == 'backend' or time.monotonic() >= _backend_search_demoted_until
+
+def _record_backend_search(supported: bool, reason: str = None) -> None:
+    """功能：【内部工具】记录一次后端检索的结果；auto 模式下连续多次不支持时限时降级为只查本地索引。"""
+    global _backend_search_strikes, _backend_search_demoted_until
+    if supported:
+        _backend_search_strikes = 0
+        return
+    if BACKEND_CONFIG.get('SEARCH_MODE', 'auto') != 'auto':
+        return
+    _backend_search_strikes += 1
+    if _backend_search_strikes >= BACKEND_CONFIG.get('SEARCH_DEMOTE_AFTER', 3):
+        seconds = BACKEND_CONFIG.get('SEARCH_DEMOTE_SECONDS', 600)
+        logging.warning(f"{reason}，{seconds}s 内改用本地索引检索")
+        _backend_search_strikes = 0
+        _backend_search_demoted_until = time.monotonic() + seconds
+
+async def search_records_async(query: str, status: str = None, limit: int = 50) -> Dict[str, Any]:
+    """
+    功能：按汉字或拼音检索解析记录。
+    说明：本地镜像可用时直接以 SQL 检索镜像；否则先查本地索引，后端支持 search 参数时再合并后端结果（后端结果优先）。
+          auto 模式下若后端连续 SEARCH_DEMOTE_AFTER 次返回 400/404/422，或返回了不含关键字的记录（说明参数被忽略），
+          则在 SEARCH_DEMOTE_SECONDS 秒内只查本地索引，到期后重新尝试后端。
+    入参：
+        - query (str): 检索关键字。
+        - status (str, 可选): 同 get_cleaned_data。
+        - limit (int): 最多返回的记录数。
+    出参：包含 'rows'、'total' 和 'source'（'backend' / 'local' / 'mirror'）的字典。
+    """
+    backend_status = _resolve_backend_status(status)
+    if _mirror_serving():
+        rows = _format_data_items(await asyncio.to_thread(_mirror.search, query, backend_status, limit))
+        return {'rows': rows, 'total': len(rows), 'source': 'mirror'}
+    status_label = STATUS_DISPLAY_MAP.get(backend_status) if backend_status else None
+    local_rows = _search_index.search(query, status_label=status_label, limit=limit)
+    local_result = {'rows': local_rows, 'total': len(local_rows), 'source': 'local'}
+
+    if not query.strip() or not _backend_search_enabled():
+        return local_result
+
+    try:
+        raw = await fetch_resolutions_list_async(skip=0, limit=limit, status=backend_status, search=query.strip(), strict=True)
+    except Exception as e:
+        status_code = getattr(getattr(e, 'response', None), 'status_code', None)
+        if status_code in (400, 404, 422):
+            _record_backend_search(False, f"后端不支持 search 参数 ({status_code})")
+        return local_result
+
+    remote = _clean_list_payload(raw)
+    if not all(_search_index.matches(row, query) for row in remote['rows']):
+        _record_backend_search(False, "后端忽略了 search 参数")
+        local_rows = _search_index.search(query, status_label=status_label, limit=limit)
+        return {'rows': local_rows, 'total': len(local_rows), 'source': 'local'}
+    _record_backend_search(True)
+
+    # 后端结果优先，本地索引中的其余命中补在后面
+    remote_ids = {row['id'] for row in remote['rows']}
+    merged = remote['rows'] + [row for row in local_rows if row['id'] not in remote_ids]
+    return {'rows': merged[:limit], 'total': max(remote['total'], len(merged)), 'source': 'backend'}
@@ -0,0 +1,175 @@
+"""
+文件职责：
+    数据导出模块 (export_service.py)。
+    将 data_service 按块产出的清洗记录流式写入 CSV / XLSX 文件，内存占用与导出总量无关。
+核心功能：
+    - CsvExportWriter：UTF-8 BOM 编码的 CSV，Excel 可直接打开中文。
+    - XlsxExportWriter：基于 zipfile 的流式 XLSX 写入（内联字符串），无需第三方依赖。
+    - export_records：拉取 -> 清洗 -> 写盘的完整导出流程，支持进度回调。
+"""
+
+import asyncio
+import csv
+import logging
+import re
+import tempfile
+import uuid
+import zipfile
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+from xml.sax.saxutils import escape
+
+from app.config.constants import EXPORT_COLUMNS, EXPORT_CONFIG
+from app.services.data_service import iter_cleaned_records
+
+logger = logging.getLogger(__name__)
+
+EXPORT_DIR = Path(tempfile.gettempdir()) / 'shidao_exports'
+
+# XML 1.0 不允许的控制字符，写入 XLSX 前需剔除
+_ILLEGAL_XML_CHARS = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+
+class CsvExportWriter:
+    """逐块追加写入 CSV 文件"""
+    media_type = 'text/csv'
+
+    def __init__(self, path: Path):
+        self._file = open(path, 'w', newline='', encoding='utf-8-sig')
+        self._writer = csv.writer(self._file)
+        self._writer.writerow([label for _, label in EXPORT_COLUMNS])
+
+    def write_rows(self, rows: List[Dict[str, Any]]) -> None:
+        self._writer.writerows([[row.get(field, '') for field, _ in EXPORT_COLUMNS] for row in rows])
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class XlsxExportWriter:
+    """
+    流式 XLSX 写入：工作表 XML 直接写入 zip 成员流，其余固定部件在 close 时补齐。
+    单元格统一使用内联字符串（inlineStr），无需维护共享字符串表，内存占用恒定。
+    """
+    media_type = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+
+    _CONTENT_TYPES = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        '<Override PartName="/xl/worksheets/sheet1.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+        '</Types>'
+    )
+    _ROOT_RELS = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+        'Target="xl/workbook.xml"/>'
+        '</Relationships>'
+    )
+    _WORKBOOK = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+        'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+        '<sheets><sheet name="解析记录" sheetId="1" r:id="rId1"/></sheets>'
+        '</workbook>'
+    )
+    _WORKBOOK_RELS = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+        'Target="worksheets/sheet1.xml"/>'
+        '</Relationships>'
+    )
+
+    def __init__(self, path: Path):
+        self._zip = zipfile.ZipFile(path, 'w', compression=zipfile.ZIP_DEFLATED)
+        self._sheet = self._zip.open('xl/worksheets/sheet1.xml', 'w')
+        self._sheet.write((
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+            '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>'
+        ).encode('utf-8'))
+        self._write_row([label for _, label in EXPORT_COLUMNS])
+
+    @staticmethod
+    def _cell(value: Any) -> str:
+        text = _ILLEGAL_XML_CHARS.sub('', '' if value is None else str(value))
+        return f'<c t="inlineStr"><is><t xml:space="preserve">{escape(text)}</t></is></c>'
+
+    def _write_row(self, values: List[Any]) -> None:
+        self._sheet.write(f"<row>{''.join(self._cell(v) for v in values)}</row>".encode('utf-8'))
+
+    def write_rows(self, rows: List[Dict[str, Any]]) -> None:
+        for row in rows:
+            self._write_row([row.get(field, '') for field, _ in EXPORT_COLUMNS])
+
+    def close(self) -> None:
+        self._sheet.write(b'</sheetData></worksheet>')
+        self._sheet.close()
+        self._zip.writestr('[Content_Types].xml', self._CONTENT_TYPES)
+        self._zip.writestr('_rels/.rels', self._ROOT_RELS)
+        self._zip.writestr('xl/workbook.xml', self._WORKBOOK)
+        self._zip.writestr('xl/_rels/workbook.xml.rels', self._WORKBOOK_RELS)
+        self._zip.close()
+
+
+EXPORT_WRITERS = {
+    'csv': CsvExportWriter,
+    'xlsx': XlsxExportWriter,
+}
+
+
+def build_export_filename(status: Optional[str], fmt: str) -> str:
+    """生成下载文件名，如：解析记录_待审核_20250101_1200.xlsx"""
+    return f"解析记录_{status or '全部'}_{datetime.now():%Y%m%d_%H%M}.{fmt}"
+
+
+def _remove_quietly(path: Path) -> None:
+    path.unlink(missing_ok=True)
+
+
+async def export_records(status: Optional[str] = None, fmt: str = 'xlsx',
+                         on_progress: Optional[Callable[[int, int], None]] = None) -> Path:
+    """
+    功能：导出状态过滤下的全部记录到临时文件。
+    说明：记录按块拉取、清洗后立即写盘，写盘在线程中执行，不阻塞事件循环；
+          文件在 EXPORT_CONFIG['FILE_TTL'] 秒后自动删除。
+    入参：
+        - status (str, 可选): 前端状态标签，同 get_cleaned_data。
+        - fmt (str): 'xlsx' 或 'csv'。
+        - on_progress (Callable, 可选): 每写完一块回调 (已写入条数, 总条数)。
+    出参：导出文件路径。
+    """
+    if fmt not in EXPORT_WRITERS:
+        raise ValueError(f"不支持的导出格式: {fmt}")
+
+    EXPORT_DIR.mkdir(parents=True, exist_ok=True)
+    path = EXPORT_DIR / f'{uuid.uuid4().hex}.{fmt}'
+    writer = EXPORT_WRITERS[fmt](path)
+    written = 0
+    try:
+        async for rows, total in iter_cleaned_records(
+            status=status,
+            chunk_size=EXPORT_CONFIG.get('CHUNK_SIZE', 1000),
+            concurrency=EXPORT_CONFIG.get('CONCURRENCY', 4)
+        ):
+            await asyncio.to_thread(writer.write_rows, rows)
+            written += len(rows)
+            if on_progress:
+                on_progress(written, total)
+    except BaseException:
+        await asyncio.to_thread(writer.close)
+        _remove_quietly(path)
+        raise
+
+    await asyncio.to_thread(writer.close)
+    asyncio.get_running_loop().call_later(EXPORT_CONFIG.get('FILE_TTL', 600), _remove_quietly, path)
+    logger.info(f"导出完成：{written} 条记录 -> {path.name}")
+    return path
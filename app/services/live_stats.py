@@ -0,0 +1,146 @@
+"""
+文件职责：
+    应用级统计聚合与推送模块 (live_stats.py)。
+    由单一后台任务按固定周期拉取首页所需的全部统计数据集并常驻内存，
+    页面只订阅、不直接访问上游，上游请求量与在线客户端数量无关（每个周期 O(1)）。
+核心功能：
+    - StatsHub：单一生产者 + 多订阅者，随 app.on_startup 启动、app.on_shutdown 停止。
+    - 数据集：'status'（状态分布）与 'summary'（按创建人分布），名称与首页视图模式一致。
+    - 状态分布经共享 TTL 缓存读取：新鲜期内不访问上游，过期后先返回旧值并后台刷新，刷新完成后立即补推。
+    - 变化检测：与上一轮结果比较，数据未变化时不推送。
+    - 限速：两轮拉取之间至少间隔 MIN_PUSH_INTERVAL 秒，期间的刷新请求合并为一次；
+      按需刷新（request_refresh）只重新读取被请求的数据集，首页进入统计视图时调用。
+    - 订阅以客户端 id 为键，每个客户端只保留一个回调；客户端销毁时取消订阅，不持有其引用。
+"""
+
+import asyncio
+import copy
+import logging
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Set
+
+from app.config.constants import LIVE_CONFIG
+from app.services.cache import SingleFlight
+from app.services.data_service import (
+    get_status_statistics_async, get_summary_statistics_async, on_status_statistics_refreshed
+)
+
+logger = logging.getLogger(__name__)
+
+# 订阅回调：(数据集名称, 最新数据)，在事件循环内同步调用；数据为共享对象，回调方不得修改
+Subscriber = Callable[[str, Any], None]
+
+
+class StatsHub:
+    """
+    应用级单例统计聚合器。
+    :param loaders: {数据集名称: 拉取最新数据的协程函数}
+    :param interval: 拉取周期（秒）
+    :param min_push_interval: 两轮拉取之间的最小间隔（秒）
+    """
+
+    def __init__(self, loaders: Dict[str, Callable[[], Awaitable[Any]]], interval: float, min_push_interval: float):
+        self.loaders = loaders
+        self.interval = interval
+        self.min_push_interval = min_push_interval
+        self._latest: Dict[str, Any] = {}
+        self._subscribers: Dict[Hashable, Subscriber] = {}
+        self._flight = SingleFlight()
+        self._wakeup = asyncio.Event()
+        self._requested: Set[str] = set()
+        self._task: Optional[asyncio.Task] = None
+
+    def __len__(self) -> int:
+        """当前订阅者数量"""
+        return len(self._subscribers)
+
+    def latest(self, name: str) -> Optional[Any]:
+        """不触发拉取，仅返回数据集当前值的副本；尚未加载时为 None"""
+        data = self._latest.get(name)
+        return copy.deepcopy(data) if data is not None else None
+
+    async def get(self, name: str) -> Optional[Any]:
+        """
+        功能：读取数据集当前值的副本。
+        说明：仅在后台任务尚未完成首轮拉取时才等待加载（与后台拉取合并为一次上游调用）。
+        """
+        if name not in self._latest:
+            await self._refresh(name)
+        return self.latest(name)
+
+    def subscribe(self, key: Hashable, callback: Subscriber) -> Callable[[], None]:
+        """
+        注册订阅回调（同一 key 重复订阅时覆盖旧回调），并确保后台任务已启动。
+        入参：key 通常为 client.id。
+        出参：取消订阅函数（可重复调用），供 client.on_delete 注册。
+        """
+        self._subscribers[key] = callback
+        self.start()
+        return lambda: self.unsubscribe(key)
+
+    def unsubscribe(self, key: Hashable) -> None:
+        self._subscribers.pop(key, None)
+
+    def request_refresh(self, name: str = None) -> None:
+        """请求尽快重新读取数据集 name（None 表示全部）；与限速窗口内的其他请求合并"""
+        self._requested.update(self.loaders if name is None else [name])
+        self._wakeup.set()
+
+    def start(self) -> None:
+        """启动后台拉取任务（幂等），供 app.on_startup 调用"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """停止后台拉取任务，供 app.on_shutdown 调用"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        names = list(self.loaders)
+        while True:
+            await asyncio.gather(*(self._refresh(name) for name in names))
+
+            await asyncio.sleep(self.min_push_interval)
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=max(0, self.interval - self.min_push_interval))
+            except asyncio.TimeoutError:
+                self._requested.update(self.loaders)
+            names = [name for name in self.loaders if name in self._requested]
+            self._requested.clear()
+            self._wakeup.clear()
+
+    async def _refresh(self, name: str) -> None:
+        try:
+            data = await self._flight.do(name, self.loaders[name])
+        except Exception as e:
+            logger.error(f"统计数据集【{name}】拉取失败: {e}")
+            return
+        if data != self._latest.get(name):
+            self._latest[name] = data
+            self._publish(name, data)
+
+    def _publish(self, name: str, data: Any) -> None:
+        for key, callback in list(self._subscribers.items()):
+            try:
+                callback(name, data)
+            except Exception:
+                logger.exception("统计推送失败，已取消该订阅")
+                self.unsubscribe(key)
+
+
+# 全部客户端共享的统计聚合器
+stats_hub = StatsHub(
+    loaders={
+        'status': get_status_statistics_async,
+        'summary': get_summary_statistics_async,
+    },
+    interval=LIVE_CONFIG.get('POLL_INTERVAL', 15),
+    min_push_interval=LIVE_CONFIG.get('MIN_PUSH_INTERVAL', 2)
+)
+# 状态统计缓存过期后由读取触发后台刷新，刷新完成时立即重新读取并推送，不必等到下一个周期
+on_status_statistics_refreshed(lambda: stats_hub.request_refresh('status'))
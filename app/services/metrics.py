@@ -0,0 +1,182 @@
+"""
+文件职责：
+    进程内运行指标 (metrics.py)。
+    以极低开销记录计数器、观测值（次数 / 总和 / 最大值）与直方图，供诊断页面与 /metrics 接口导出。
+核心功能：
+    - inc：累加计数器，如“跳过的表格刷新次数”“后端重试次数”。
+    - observe：记录一次观测值，如“单次表格增量推送的字节数”。
+    - histogram：按固定分桶记录分布，如“后端调用耗时”，可在 Prometheus 中计算分位数。
+    - snapshot：导出当前全部指标的副本。
+    - render_prometheus：按 Prometheus 文本格式（0.0.4）导出全部指标。
+说明：
+    同步线程池与事件循环都会写入，内部加锁；标签以关键字参数传入，按名称排序后作为键。
+"""
+
+import math
+import threading
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+# 指标键：(指标名, ((标签名, 标签值), ...))
+MetricKey = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+# 默认直方图分桶（秒），覆盖从本地缓存命中到上游超时的范围
+LATENCY_BUCKETS: Tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+
+def _key(name: str, labels: Dict[str, Any]) -> MetricKey:
+    return name, tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+class MetricsRegistry:
+    """计数器、观测值与直方图的进程内注册表"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: Dict[MetricKey, float] = {}
+        # 观测值：[次数, 总和, 最大值]
+        self._observations: Dict[MetricKey, List[float]] = {}
+        # 直方图：[各分桶计数（非累计）..., +Inf 计数, 次数, 总和]
+        self._histograms: Dict[MetricKey, List[float]] = {}
+        self._buckets: Dict[str, Tuple[float, ...]] = {}
+
+    def inc(self, name: str, value: float = 1, **labels: Any) -> None:
+        key = _key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(self, name: str, value: float, **labels: Any) -> None:
+        key = _key(name, labels)
+        with self._lock:
+            stats = self._observations.get(key)
+            if stats is None:
+                self._observations[key] = [1, value, value]
+            else:
+                stats[0] += 1
+                stats[1] += value
+                stats[2] = max(stats[2], value)
+
+    def histogram(self, name: str, value: float, buckets: Optional[Sequence[float]] = None, **labels: Any) -> None:
+        """
+        记录一次直方图观测值。
+        :param buckets: 分桶上界（升序）；同名指标以首次记录时的分桶为准，默认 LATENCY_BUCKETS
+        """
+        key = _key(name, labels)
+        with self._lock:
+            bounds = self._buckets.setdefault(name, tuple(buckets or LATENCY_BUCKETS))
+            stats = self._histograms.get(key)
+            if stats is None:
+                stats = self._histograms[key] = [0] * (len(bounds) + 3)
+            index = next((i for i, bound in enumerate(bounds) if value <= bound), len(bounds))
+            stats[index] += 1
+            stats[-2] += 1
+            stats[-1] += value
+
+    def snapshot(self) -> Dict[str, Dict[MetricKey, Any]]:
+        """
+        出参：{'counters': {键: 值}, 'observations': {键: {'count', 'sum', 'max'}},
+               'histograms': {键: {'buckets': [(上界, 累计次数), ...], 'count', 'sum'}}}
+        """
+        with self._lock:
+            return {
+                'counters': dict(self._counters),
+                'observations': {
+                    key: {'count': count, 'sum': total, 'max': peak}
+                    for key, (count, total, peak) in self._observations.items()
+                },
+                'histograms': {
+                    key: self._histogram_view(self._buckets[key[0]], stats)
+                    for key, stats in self._histograms.items()
+                },
+            }
+
+    @staticmethod
+    def _histogram_view(bounds: Tuple[float, ...], stats: List[float]) -> Dict[str, Any]:
+        cumulative, buckets = 0, []
+        for bound, count in zip(bounds + (math.inf,), stats[:-2]):
+            cumulative += count
+            buckets.append((bound, cumulative))
+        return {'buckets': buckets, 'count': stats[-2], 'sum': stats[-1]}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+            self._observations.clear()
+            self._histograms.clear()
+            self._buckets.clear()
+
+
+def _format_labels(labels: Tuple[Tuple[str, str], ...], extra: Tuple[Tuple[str, str], ...] = ()) -> str:
+    pairs = labels + extra
+    if not pairs:
+        return ''
+    escaped = (value.replace('\\', r'\\').replace('"', r'\"').replace('\n', r'\n') for _, value in pairs)
+    return '{' + ','.join(f'{name}="{value}"' for (name, _), value in zip(pairs, escaped)) + '}'
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) and not value.is_integer() else str(int(value))
+
+
+def _group(entries: Dict[MetricKey, Any]) -> Dict[str, List[Tuple[Tuple[Tuple[str, str], ...], Any]]]:
+    families: Dict[str, List[Tuple[Tuple[Tuple[str, str], ...], Any]]] = {}
+    for (name, labels), value in sorted(entries.items()):
+        families.setdefault(name, []).append((labels, value))
+    return families
+
+
+def render_prometheus(registry: 'MetricsRegistry' = None) -> str:
+    """
+    功能：按 Prometheus 文本格式导出全部指标。
+    说明：
+        - 计数器导出为 counter；观测值导出为 summary（_count / _sum）并附带 <name>_max gauge；
+        - 直方图导出为 histogram（_bucket / _sum / _count）；
+        - 由 cache_requests_total{cache, result} 派生 cache_hit_ratio{cache} gauge（stale 视为命中）。
+    """
+    snapshot = (registry or metrics).snapshot()
+    lines: List[str] = []
+
+    for name, samples in _group(snapshot['counters']).items():
+        lines.append(f'# TYPE {name} counter')
+        lines.extend(f'{name}{_format_labels(labels)} {_format_value(value)}' for labels, value in samples)
+
+    for name, samples in _group(snapshot['observations']).items():
+        lines.append(f'# TYPE {name} summary')
+        for labels, stats in samples:
+            lines.append(f"{name}_count{_format_labels(labels)} {_format_value(stats['count'])}")
+            lines.append(f"{name}_sum{_format_labels(labels)} {_format_value(stats['sum'])}")
+        lines.append(f'# TYPE {name}_max gauge')
+        lines.extend(f"{name}_max{_format_labels(labels)} {_format_value(stats['max'])}" for labels, stats in samples)
+
+    for name, samples in _group(snapshot['histograms']).items():
+        lines.append(f'# TYPE {name} histogram')
+        for labels, stats in samples:
+            for bound, count in stats['buckets']:
+                lines.append(f"{name}_bucket{_format_labels(labels, (('le', _format_value(bound)),))} {count}")
+            lines.append(f"{name}_sum{_format_labels(labels)} {_format_value(stats['sum'])}")
+            lines.append(f"{name}_count{_format_labels(labels)} {_format_value(stats['count'])}")
+
+    ratios = _cache_hit_ratios(snapshot['counters'])
+    if ratios:
+        lines.append('# TYPE cache_hit_ratio gauge')
+        lines.extend(f'cache_hit_ratio{{cache="{cache}"}} {ratio:.4f}' for cache, ratio in sorted(ratios.items()))
+
+    return '\n'.join(lines) + '\n'
+
+
+def _cache_hit_ratios(counters: Dict[MetricKey, float]) -> Dict[str, float]:
+    totals: Dict[str, List[float]] = {}
+    for (name, labels), value in counters.items():
+        if name != 'cache_requests_total':
+            continue
+        label_map = dict(labels)
+        hits_total = totals.setdefault(label_map.get('cache', ''), [0, 0])
+        hits_total[1] += value
+        if label_map.get('result') in ('hit', 'stale'):
+            hits_total[0] += value
+    return {cache: hits / total for cache, (hits, total) in totals.items() if total}
+
+
+# 进程级共享注册表
+metrics = MetricsRegistry()
@@ -0,0 +1,406 @@
+"""
+文件职责：
+    解析记录的本地 SQLite 镜像 (mirror.py)。
+    可选（MIRROR_CONFIG['ENABLED']）把上游全部记录同步到本地 SQLite 文件，分页、状态统计、检索与导出
+    直接以 SQL 在本地完成，上游不再处于页面读取的热路径上；镜像文件持久化，离线或上游故障时仍可提供数据。
+核心功能：
+    - RecordMirror：建表与索引（status + created_at、created_at、word），按 id 写入 / 更新，分页、计数、检索查询。
+    - 检索 gram 表：word / 拼音归一化后的单字 + 双字 gram 倒排（与 search_index 规则一致），
+      子串检索先按 gram 主键取候选再以 LIKE 校验，不再扫描整表。
+    - MirrorSync：后台同步任务。首次与定期全量同步（按代号标记并清理上游已删除的记录），
+      其余周期只拉取比高水位更新的记录，并核对各状态计数，发现原地改状态时提前全量同步。
+      多进程部署时只有主导 worker 同步，其余 worker 以跟随模式定期从数据库文件重新读取同步状态与计数。
+说明：
+    - 列表按 (created_at, id) 倒序，与上游默认顺序一致；增量同步依赖该顺序。
+    - 各状态计数在每次写入后用一次 GROUP BY 重新统计并常驻内存，读取分页总数与状态统计不再逐次 COUNT。
+    - 每次成功同步的时间持久化在 meta 表（last_sync），读取方据此判断镜像落后了多久（lag）。
+    - 文件库使用独立的只读连接（WAL 模式下读不被写事务阻塞）；查询方法均为阻塞调用，异步调用方应放到线程池执行。
+    - 仅依赖标准库 sqlite3；路径为 ':memory:' 时为纯内存库（读写共用一个连接），便于测试。
+"""
+
+import asyncio
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+from app.services.search_index import normalize_search_text, query_grams, text_grams
+
+logger = logging.getLogger(__name__)
+
+# 拉取一块原始记录：(skip, limit) -> (原始记录列表, 上游总数)
+ChunkFetcher = Callable[[int, int], Awaitable[Tuple[List[Dict[str, Any]], int]]]
+# 拉取上游各状态的记录数 {status: count}，失败时返回 None
+CountsFetcher = Callable[[], Awaitable[Optional[Dict[str, int]]]]
+
+# 检索 gram 表的版本：与 meta 中记录的不一致（旧镜像文件、gram 规则变化）时由同步任务在后台重建
+_GRAMS_VERSION = '1'
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS records (
+    id TEXT PRIMARY KEY,
+    status TEXT,
+    created_at TEXT NOT NULL DEFAULT '',
+    word TEXT,
+    word_key TEXT,
+    pinyin_key TEXT,
+    payload TEXT NOT NULL,
+    generation INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_records_status_created ON records (status, created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_records_created ON records (created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_records_word ON records (word);
+CREATE TABLE IF NOT EXISTS record_grams (gram TEXT NOT NULL, id TEXT NOT NULL, PRIMARY KEY (gram, id)) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_record_grams_id ON record_grams (id);
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+'''
+
+
+def _row_values(item: Dict[str, Any], generation: int) -> Optional[tuple]:
+    record_id = item.get('id') or item.get('_id')
+    if not record_id:
+        return None
+    pinyin_data = item.get('pronunciation')
+    pinyin = pinyin_data.get('pinyin') if isinstance(pinyin_data, dict) else None
+    return (
+        str(record_id), item.get('status'), str(item.get('created_at') or ''), item.get('word'),
+        normalize_search_text(item.get('word')), normalize_search_text(pinyin),
+        json.dumps(item, ensure_ascii=False), generation
+    )
+
+
+def _gram_rows(record_id: str, word_key: Optional[str], pinyin_key: Optional[str]) -> Iterable[Tuple[str, str]]:
+    """一条记录的 (gram, id) 行：word 与拼音各自切分后合并去重（gram 不跨字段）"""
+    grams = text_grams(word_key or '') | text_grams(pinyin_key or '')
+    return ((gram, record_id) for gram in grams)
+
+
+def _escape_like(text: str) -> str:
+    return text.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+
+class RecordMirror:
+    """
+    SQLite 记录镜像。写入经写连接并由锁串行化，读取经只读连接（内存库与写入共用连接和锁）；
+    各方法均为阻塞调用，由 MirrorSync 与 data_service 放到线程池执行。
+    :param path: 数据库文件路径，':memory:' 为内存库
+    """
+
+    def __init__(self, path: str):
+        if path != ':memory:':
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._lock = threading.Lock()
+        with self._lock:
+            if path != ':memory:':
+                self._conn.execute('PRAGMA journal_mode=WAL')
+                self._conn.execute('PRAGMA synchronous=NORMAL')
+            self._conn.executescript(_SCHEMA)
+        if path == ':memory:':
+            self._reader, self._read_lock = self._conn, self._lock
+        else:
+            self._reader = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+            self._read_lock = threading.Lock()
+        self.counts: Dict[Optional[str], int] = {}
+        self._recount()
+        # 至少完成过一次全量同步（持久化在 meta 表中，重启后仍然有效）
+        self.ready = self.get_meta('last_full_sync') is not None
+        # 最近一次成功同步的时间（time.time()），0 表示从未同步
+        self.synced_at = float(self.get_meta('last_sync') or 0)
+        self.grams_ready = self.get_meta('grams_version') == _GRAMS_VERSION
+        if not self.grams_ready and not self.total:
+            self.set_meta('grams_version', _GRAMS_VERSION)
+            self.grams_ready = True
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts.values())
+
+    def lag(self) -> float:
+        """距最近一次成功同步的秒数；从未同步过时为 inf"""
+        return time.time() - self.synced_at if self.synced_at else float('inf')
+
+    def mark_synced(self) -> None:
+        self.synced_at = time.time()
+        self.set_meta('last_sync', str(self.synced_at))
+
+    def reload(self) -> None:
+        """从数据库文件重新读取同步状态；同步时间有变化时重新统计各状态计数（由其他进程写入时使用）"""
+        synced_at = float(self.get_meta('last_sync') or 0)
+        if synced_at != self.synced_at:
+            self._recount()
+        self.ready = self.get_meta('last_full_sync') is not None
+        self.grams_ready = self.get_meta('grams_version') == _GRAMS_VERSION
+        self.synced_at = synced_at
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+        if self._reader is not self._conn:
+            with self._read_lock:
+                self._reader.close()
+
+    def _read(self, sql: str, params: Iterable[Any] = ()) -> List[tuple]:
+        with self._read_lock:
+            return self._reader.execute(sql, list(params)).fetchall()
+
+    def get_meta(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute('SELECT value FROM meta WHERE key = ?', (key,)).fetchone()
+        return row[0] if row else None
+
+    def set_meta(self, key: str, value: str) -> None:
+        with self._lock:
+            self._conn.execute('INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)', (key, value))
+
+    def upsert(self, items: Iterable[Dict[str, Any]], generation: int) -> int:
+        """按 id 写入或覆盖原始记录，出参为写入条数（缺少 id 的记录被跳过）"""
+        rows = [values for values in (_row_values(item, generation) for item in items) if values]
+        with self._lock:
+            self._conn.execute('BEGIN')
+            try:
+                self._conn.executemany(
+                    'INSERT OR REPLACE INTO records (id, status, created_at, word, word_key, pinyin_key, payload, generation) '
+                    'VALUES (?, ?, ?, ?, ?, ?, ?, ?)', rows
+                )
+                self._conn.executemany('DELETE FROM record_grams WHERE id = ?', [(row[0],) for row in rows])
+                self._conn.executemany(
+                    'INSERT OR IGNORE INTO record_grams (gram, id) VALUES (?, ?)',
+                    (gram_row for row in rows for gram_row in _gram_rows(row[0], row[4], row[5]))
+                )
+                self._conn.execute('COMMIT')
+            except Exception:
+                self._conn.execute('ROLLBACK')
+                raise
+        return len(rows)
+
+    def count_generation(self, generation: int) -> int:
+        with self._lock:
+            return self._conn.execute('SELECT COUNT(*) FROM records WHERE generation >= ?', (generation,)).fetchone()[0]
+
+    def purge_before(self, generation: int) -> int:
+        """删除代号早于 generation 的记录（本轮全量同步未见到，即上游已删除）"""
+        with self._lock:
+            self._conn.execute('BEGIN')
+            try:
+                self._conn.execute('DELETE FROM record_grams WHERE id IN (SELECT id FROM records WHERE generation < ?)',
+                                   (generation,))
+                purged = self._conn.execute('DELETE FROM records WHERE generation < ?', (generation,)).rowcount
+                self._conn.execute('COMMIT')
+            except Exception:
+                self._conn.execute('ROLLBACK')
+                raise
+        return purged
+
+    def build_search_index(self) -> None:
+        """为全部记录重建检索 gram 表（旧版本镜像文件首次启动时执行一次，期间检索回退为整表 LIKE）"""
+        if self.grams_ready:
+            return
+        with self._lock:
+            rows = self._conn.execute('SELECT id, word_key, pinyin_key FROM records').fetchall()
+            self._conn.execute('BEGIN')
+            try:
+                self._conn.execute('DELETE FROM record_grams')
+                self._conn.executemany(
+                    'INSERT OR IGNORE INTO record_grams (gram, id) VALUES (?, ?)',
+                    (gram_row for row in rows for gram_row in _gram_rows(*row))
+                )
+                self._conn.execute('INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)',
+                                   ('grams_version', _GRAMS_VERSION))
+                self._conn.execute('COMMIT')
+            except Exception:
+                self._conn.execute('ROLLBACK')
+                raise
+        self.grams_ready = True
+        logger.info(f"镜像检索 gram 表已重建：{len(rows)} 条记录")
+
+    def refresh_counts(self) -> None:
+        self._recount()
+
+    def high_water(self) -> Optional[Tuple[str, str]]:
+        """本地最新一条记录的 (created_at, id)"""
+        rows = self._read('SELECT created_at, id FROM records ORDER BY created_at DESC, id DESC LIMIT 1')
+        return (rows[0][0], rows[0][1]) if rows else None
+
+    def page(self, skip: int, limit: int, status: Optional[str] = None) -> Tuple[List[Dict[str, Any]], int]:
+        """出参：(原始记录列表, 该状态的总数)，按 (created_at, id) 倒序"""
+        where, params = ('WHERE status = ?', [status]) if status else ('', [])
+        rows = self._read(f'SELECT payload FROM records {where} ORDER BY created_at DESC, id DESC LIMIT ? OFFSET ?',
+                          params + [limit, skip])
+        total = self.counts.get(status, 0) if status else self.total
+        return [json.loads(row[0]) for row in rows], total
+
+    def search(self, query: str, status: Optional[str] = None, limit: int = 50) -> List[Dict[str, Any]]:
+        """
+        word / 拼音（归一化后）包含 query 的原始记录，前缀命中优先。
+        说明：gram 表可用时先取出包含查询全部 gram 的候选 id（走主键索引），再以 LIKE 校验
+              （双字 gram 全部出现不代表连续出现）；gram 表重建完成前回退为整表 LIKE。
+        """
+        needle = normalize_search_text(query)
+        if not needle:
+            return []
+        escaped = _escape_like(needle)
+        contains, prefix = f'%{escaped}%', f'{escaped}%'
+        clauses = ["(word_key LIKE ? ESCAPE '\\' OR pinyin_key LIKE ? ESCAPE '\\')"]
+        params: List[Any] = [contains, contains]
+        if self.grams_ready:
+            grams = sorted(query_grams(needle))
+            clauses.insert(0, f"id IN (SELECT id FROM record_grams WHERE gram IN ({', '.join('?' * len(grams))}) "
+                              "GROUP BY id HAVING COUNT(*) = ?)")
+            params = grams + [len(grams)] + params
+        if status:
+            clauses.append('status = ?')
+            params.append(status)
+        sql = (f"SELECT payload FROM records WHERE {' AND '.join(clauses)}"
+               " ORDER BY (word_key LIKE ? ESCAPE '\\' OR pinyin_key LIKE ? ESCAPE '\\') DESC, created_at DESC, id DESC LIMIT ?")
+        rows = self._read(sql, params + [prefix, prefix, limit])
+        return [json.loads(row[0]) for row in rows]
+
+    def _recount(self) -> None:
+        rows = self._read('SELECT status, COUNT(*) FROM records GROUP BY status')
+        self.counts = {status: count for status, count in rows}
+
+
+class MirrorSync:
+    """
+    镜像后台同步任务，随 app.on_startup 启动、app.on_shutdown 停止。
+    :param mirror: 目标镜像
+    :param fetch_chunk: 从上游拉取一块原始记录的协程函数，失败时抛出异常
+    :param config: MIRROR_CONFIG
+    :param fetch_counts: 可选，拉取上游各状态记录数的协程函数；给定时每轮增量同步后核对本地计数
+    :param leader: 是否由本进程同步；False 时为跟随模式，只定期调用 mirror.reload 读取其他进程写入的结果
+    """
+
+    def __init__(self, mirror: RecordMirror, fetch_chunk: ChunkFetcher, config: Dict[str, Any],
+                 fetch_counts: Optional[CountsFetcher] = None, leader: bool = True):
+        self.mirror = mirror
+        self.fetch_chunk = fetch_chunk
+        self.config = config
+        self.fetch_counts = fetch_counts
+        self.leader = leader
+        self._task: Optional[asyncio.Task] = None
+        # 各状态计数连续与上游不一致的轮数
+        self._mismatches = 0
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    @property
+    def drifted(self) -> bool:
+        """各状态计数连续两轮与上游不一致（只差一轮可能是两次读取之间恰有新增记录）"""
+        return self._mismatches >= 2
+
+    async def sync_once(self) -> None:
+        """
+        执行一轮同步：到期时全量，否则增量。
+        说明：增量同步发现不了原地改状态与删除，计数漂移时距上次全量满 DRIFT_SYNC_DELAY 秒即提前全量同步。
+        """
+        last_full = float(await asyncio.to_thread(self.mirror.get_meta, 'last_full_sync') or 0)
+        since_full = time.time() - last_full
+        if since_full >= self.config.get('FULL_SYNC_INTERVAL', 3600) or (
+                self.drifted and since_full >= self.config.get('DRIFT_SYNC_DELAY', 120)):
+            await self.full_sync()
+        else:
+            await self.incremental_sync()
+            await asyncio.to_thread(self.mirror.mark_synced)
+            await self._check_counts()
+
+    async def _check_counts(self) -> None:
+        if self.fetch_counts is None:
+            return
+        upstream = await self.fetch_counts()
+        if upstream is None:
+            return
+        if all(self.mirror.counts.get(status, 0) == count for status, count in upstream.items()):
+            self._mismatches = 0
+            return
+        self._mismatches += 1
+        if self._mismatches == 2:
+            logger.warning(f"镜像各状态计数与上游不一致（本地 {self.mirror.counts}，上游 {upstream}），将提前全量同步")
+
+    async def full_sync(self) -> None:
+        """
+        按块遍历全部记录并以新代号写入；遍历完成后删除未见到的旧记录。
+        偏移分页在遍历期间遇到上游删除时可能漏读记录，此时本轮写入数少于上游总数，跳过删除步骤以免误删。
+        """
+        chunk_size = self.config.get('CHUNK_SIZE', 1000)
+        started = time.monotonic()
+        generation = int(await asyncio.to_thread(self.mirror.get_meta, 'generation') or 0) + 1
+        skip, total = 0, 0
+        while True:
+            items, total = await self.fetch_chunk(skip, chunk_size)
+            await asyncio.to_thread(self.mirror.upsert, items, generation)
+            if skip == 0:
+                # 首块即最新的记录，写入后镜像至少与一次增量同步一样新，全量遍历期间读取方不会因 lag 回到上游
+                await asyncio.to_thread(self.mirror.mark_synced)
+            skip += len(items)
+            if len(items) < chunk_size or skip >= total:
+                break
+
+        seen = await asyncio.to_thread(self.mirror.count_generation, generation)
+        purged = await asyncio.to_thread(self.mirror.purge_before, generation) if seen >= total else 0
+        if seen < total:
+            logger.warning(f"镜像全量同步写入 {seen} 条，少于上游总数 {total}，本轮不清理旧记录")
+        await asyncio.to_thread(self.mirror.set_meta, 'generation', str(generation))
+        await asyncio.to_thread(self.mirror.set_meta, 'last_full_sync', str(time.time()))
+        await asyncio.to_thread(self.mirror.refresh_counts)
+        self.mirror.ready = True
+        self._mismatches = 0
+        logger.info(f"镜像全量同步完成：{seen} 条记录，删除 {purged} 条，耗时 {time.monotonic() - started:.1f}s")
+
+    async def incremental_sync(self) -> int:
+        """从最新记录开始分块拉取，直到越过本地高水位；出参为写入条数"""
+        size = self.config.get('CATCH_UP_SIZE', 100)
+        generation = int(await asyncio.to_thread(self.mirror.get_meta, 'generation') or 0)
+        high_water = await asyncio.to_thread(self.mirror.high_water)
+        written, skip = 0, 0
+        while True:
+            items, total = await self.fetch_chunk(skip, size)
+            fresh = [item for item in items
+                     if not high_water or (str(item.get('created_at') or ''), str(item.get('id') or '')) > high_water]
+            if fresh:
+                written += await asyncio.to_thread(self.mirror.upsert, fresh, generation)
+            skip += len(items)
+            if len(fresh) < len(items) or len(items) < size or skip >= total:
+                break
+        if written:
+            await asyncio.to_thread(self.mirror.refresh_counts)
+        return written
+
+    async def _run(self) -> None:
+        if not self.leader:
+            await self._follow()
+            return
+        try:
+            await asyncio.to_thread(self.mirror.build_search_index)
+        except Exception as e:
+            logger.error(f"镜像检索 gram 表重建失败，检索回退为整表扫描: {e}")
+        while True:
+            try:
+                await self.sync_once()
+            except Exception as e:
+                # 上游不可用时保留现有镜像继续提供数据（离线模式），下一周期重试
+                logger.error(f"镜像同步失败，继续使用本地数据: {e}")
+            await asyncio.sleep(self.config.get('SYNC_INTERVAL', 30))
+
+    async def _follow(self) -> None:
+        while True:
+            try:
+                await asyncio.to_thread(self.mirror.reload)
+            except Exception as e:
+                logger.error(f"读取镜像同步状态失败: {e}")
+            await asyncio.sleep(self.config.get('SYNC_INTERVAL', 30))
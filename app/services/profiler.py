@@ -0,0 +1,153 @@
+"""
+文件职责：
+    页面渲染性能剖析 (profiler.py)。
+    可选（PROFILING_CONFIG['ENABLED']）记录 NiceGUI 页面的服务端耗时与 websocket 推送字节数，
+    写入滚动的内存样本库，供 /admin/diagnostics 诊断页汇总展示。
+核心功能：
+    - page：包裹页面处理函数，记录页面构建耗时（build_ms），并开始追踪该客户端。
+    - waiting：包裹等待数据的 await，记录等待耗时（data_wait_ms）。
+    - first_update：记录从页面开始构建到首次图表 / 表格更新的耗时（first_update_ms），每个客户端仅一次。
+    - 推送字节：拦截被追踪客户端的 outbox 消息，按元素类型（q-table、echart …）或消息类型记录字节数（ws_bytes）。
+    - summary：按 (页面, 指标, 明细) 汇总次数 / 均值 / p95 / 最大值 / 总量。
+说明：
+    未启用时全部入口为空操作；启用后每条推送消息会额外序列化一次，仅用于排障与压测。
+    所有样本同时写入 metrics 注册表，可经 /metrics 抓取。
+"""
+
+import functools
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Deque, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from nicegui import Client, context
+from nicegui.json import dumps as json_dumps
+
+from app.config.constants import PROFILING_CONFIG
+from app.services.metrics import metrics
+
+
+class Sample(NamedTuple):
+    at: float        # 记录时间（time.time()）
+    page: str        # 页面名称（路由处理函数名）
+    metric: str      # build_ms / data_wait_ms / first_update_ms / ws_bytes
+    detail: str      # 明细：等待点名称、首次更新的元素类型、推送的元素类型或消息类型
+    value: float
+
+
+def _payload_size(payload: Any) -> int:
+    return len(json_dumps(payload).encode('utf-8'))
+
+
+def _percentile(values: List[float], ratio: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * ratio))]
+
+
+class RenderProfiler:
+    """
+    页面渲染耗时与推送字节数的滚动样本库。
+    :param max_samples: 最多保留的样本数，超出后丢弃最旧的样本
+    :param enabled: 是否记录
+    """
+
+    def __init__(self, max_samples: int, enabled: bool):
+        self.enabled = enabled
+        self.samples: Deque[Sample] = deque(maxlen=max_samples)
+        # 被追踪客户端：client.id -> (页面名称, 开始构建时间, 是否已记录首次更新)
+        self._clients: Dict[str, List[Any]] = {}
+
+    def record(self, page: str, metric: str, value: float, detail: str = '') -> None:
+        self.samples.append(Sample(time.time(), page, metric, detail, value))
+        metrics.observe(f'ui_{metric}', value, page=page, detail=detail)
+
+    @contextmanager
+    def page(self, name: str) -> Iterator[None]:
+        """包裹页面处理函数：记录构建耗时，并追踪该客户端的后续更新与推送字节"""
+        if not self.enabled:
+            yield
+            return
+        client = context.client
+        started = time.perf_counter()
+        self._track(client, name, started)
+        try:
+            yield
+        finally:
+            self.record(name, 'build_ms', (time.perf_counter() - started) * 1000)
+
+    @contextmanager
+    def waiting(self, detail: str, client: Optional[Client] = None) -> Iterator[None]:
+        """包裹等待数据的 await，记录等待耗时；client 默认取当前上下文"""
+        page = self._page_of(client)
+        if page is None:
+            yield
+            return
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(page, 'data_wait_ms', (time.perf_counter() - started) * 1000, detail)
+
+    def first_update(self, detail: str, client: Optional[Client] = None) -> None:
+        """记录该客户端首次图表 / 表格更新距页面开始构建的耗时，之后的调用忽略"""
+        page = self._page_of(client)
+        if page is None:
+            return
+        entry = self._clients[(client or context.client).id]
+        if not entry[2]:
+            entry[2] = True
+            self.record(page, 'first_update_ms', (time.perf_counter() - entry[1]) * 1000, detail)
+
+    def summary(self) -> List[Dict[str, Any]]:
+        """出参：按 (页面, 指标, 明细) 汇总的列表，按指标排列、同一指标内按总量降序"""
+        groups: Dict[Tuple[str, str, str], List[float]] = {}
+        for sample in list(self.samples):
+            groups.setdefault((sample.page, sample.metric, sample.detail), []).append(sample.value)
+        rows = [
+            {
+                'page': page, 'metric': metric, 'detail': detail, 'count': len(values),
+                'avg': round(sum(values) / len(values), 2), 'p95': round(_percentile(values, 0.95), 2),
+                'max': round(max(values), 2), 'total': round(sum(values), 2),
+            }
+            for (page, metric, detail), values in groups.items()
+        ]
+        return sorted(rows, key=lambda row: (row['metric'], -row['total']))
+
+    def clear(self) -> None:
+        self.samples.clear()
+
+    def _page_of(self, client: Optional[Client]) -> Optional[str]:
+        if not self.enabled:
+            return None
+        entry = self._clients.get((client or context.client).id)
+        return entry[0] if entry else None
+
+    def _track(self, client: Client, name: str, started: float) -> None:
+        client_id = client.id
+        self._clients[client_id] = [name, started, False]
+        client.on_delete(lambda: self._clients.pop(client_id, None))
+
+        outbox = client.outbox
+        emit = outbox._emit  # pylint: disable=protected-access
+
+        @functools.wraps(emit)
+        async def measured_emit(message) -> None:
+            _, message_type, data = message
+            if message_type == 'update':
+                for key, element in data.items():
+                    if key == '_id':  # 重发（rewind）的消息已带有消息序号
+                        continue
+                    tag = element.get('tag', '') if element else 'deleted'
+                    self.record(name, 'ws_bytes', _payload_size(element), tag)
+            else:
+                self.record(name, 'ws_bytes', _payload_size(data), message_type)
+            await emit(message)
+
+        outbox._emit = measured_emit  # pylint: disable=protected-access
+
+
+# 进程级共享剖析器
+profiler = RenderProfiler(
+    max_samples=PROFILING_CONFIG.get('MAX_SAMPLES', 5000),
+    enabled=PROFILING_CONFIG.get('ENABLED', False)
+)
@@ -0,0 +1,130 @@
+"""
+文件职责：
+    后端调用容错工具 (resilience.py)。
+    为 backend_api 提供与具体接口无关的熔断、对冲请求与耗时预算原语。
+核心功能：
+    - CircuitBreaker：连续失败达到阈值后熔断，熔断期间直接失败（不再访问上游），
+      冷却结束后放行单个探测请求，成功则恢复。
+    - hedged：首个请求超过 delay 仍未返回时再发一个相同请求，取先成功者，削减长尾延迟。
+    - BackendUnavailableError：熔断 / 超出耗时预算时抛出，调用方据此回退到最近一次成功的数据。
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from typing import Any, Awaitable, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class BackendUnavailableError(Exception):
+    """后端暂不可用（熔断或超出耗时预算），调用方应回退到缓存数据"""
+
+
+class CircuitOpenError(BackendUnavailableError):
+    """熔断器处于打开状态，请求未发出"""
+
+
+class LatencyBudgetExceeded(BackendUnavailableError):
+    """调用（含重试与退避）超出该调用点的耗时预算"""
+
+
+class CircuitBreaker:
+    """
+    三态熔断器：closed（正常）-> open（熔断，快速失败）-> half_open（放行单个探测请求）。
+    同步线程池与事件循环都会调用，状态变更加锁保护。
+    :param failure_threshold: 连续失败多少次后熔断
+    :param recovery_timeout: 熔断后多久（秒）放行探测请求
+    :param name: 日志中的名称
+    """
+
+    CLOSED, OPEN, HALF_OPEN = 'closed', 'open', 'half_open'
+
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 30, name: str = 'backend'):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.name = name
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_started_at: Optional[float] = None
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._state == self.OPEN and self._cooled_down():
+                return self.HALF_OPEN
+            return self._state
+
+    def allow(self) -> bool:
+        """是否允许发出请求；half_open 状态下同一时间只放行一个探测请求"""
+        with self._lock:
+            if self._state == self.CLOSED:
+                return True
+            now = time.monotonic()
+            if self._state == self.OPEN:
+                if not self._cooled_down():
+                    return False
+                self._state = self.HALF_OPEN
+            # 探测请求迟迟未回报结果时，超过冷却期允许再放行一个
+            if self._probe_started_at is not None and now - self._probe_started_at < self.recovery_timeout:
+                return False
+            self._probe_started_at = now
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self._state != self.CLOSED:
+                logger.info(f"熔断器【{self.name}】探测成功，恢复正常")
+            self._state = self.CLOSED
+            self._failures = 0
+            self._probe_started_at = None
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state != self.OPEN:
+                    logger.warning(f"熔断器【{self.name}】打开：连续失败 {self._failures} 次，"
+                                   f"{self.recovery_timeout}s 内直接使用缓存数据")
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+                self._probe_started_at = None
+
+    def _cooled_down(self) -> bool:
+        return time.monotonic() - self._opened_at >= self.recovery_timeout
+
+
+async def hedged(call: Callable[[], Awaitable[Any]], delay: Optional[float]) -> Any:
+    """
+    对冲请求：先发起 call()，delay 秒内未完成则再发起一次，返回先成功的结果并取消另一个。
+    两个请求都失败时抛出最后一个异常（被取消的请求视为以 CancelledError 失败）；
+    delay 为 None 时等同于直接 await call()。仅用于幂等的只读请求。
+    """
+    if delay is None:
+        return await call()
+
+    pending = {asyncio.ensure_future(call())}
+    done, pending = await asyncio.wait(pending, timeout=delay)
+    if not done:
+        pending.add(asyncio.ensure_future(call()))
+
+    error: Optional[BaseException] = None
+    try:
+        while True:
+            for task in done:
+                # 已取消的任务调用 exception() 会直接抛出 CancelledError，需先判断
+                if task.cancelled():
+                    error = error or asyncio.CancelledError()
+                elif task.exception() is None:
+                    return task.result()
+                else:
+                    error = task.exception()
+            if not pending:
+                raise error
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        for task in pending:
+            task.cancel()
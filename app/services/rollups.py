@@ -0,0 +1,145 @@
+"""
+文件职责：
+    趋势统计的预分桶汇总存储 (rollups.py)。
+    记录计入时即按 小时 / 天 / 周 三种粒度把 created_at、reviewed_at 归入时间桶并按状态计数，
+    查询时只需遍历桶（数量与记录数无关），再经 LTTB 降采样，长时间范围的折线也只输出有限个点。
+核心功能：
+    - TrendRollup.add：把一条原始记录计入各粒度的时间桶。
+    - TrendRollup.series：按 (事件, 粒度) 输出各状态的 [[桶起点毫秒时间戳, 计数], ...]，空档两端补 0。
+    - lttb：Largest-Triangle-Three-Buckets 降采样，保留折线的形状特征（峰谷）。
+说明：
+    时间戳统一换算到 UTC 分桶（带时区偏移的按偏移换算，不带时区的按 UTC 解释），周桶以周一为起点；图表需设置 useUTC。
+"""
+
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+HOUR_MS = 3600 * 1000
+GRANULARITY_MS = {'hour': HOUR_MS, 'day': 24 * HOUR_MS, 'week': 7 * 24 * HOUR_MS}
+EVENT_FIELDS = {'created': 'created_at', 'reviewed': 'reviewed_at'}
+
+Point = Tuple[int, int]
+
+
+def _hour_buckets(hour_prefix: str) -> Optional[Tuple[int, int, int]]:
+    """'YYYY-MM-DDTHH' -> (小时桶, 天桶, 周桶) 的起点毫秒时间戳；无法解析时返回 None"""
+    try:
+        hour = datetime.strptime(hour_prefix.replace(' ', 'T'), '%Y-%m-%dT%H').replace(tzinfo=timezone.utc)
+    except ValueError:
+        return None
+    day = hour.replace(hour=0)
+    week = day - timedelta(days=day.weekday())
+    return int(hour.timestamp() * 1000), int(day.timestamp() * 1000), int(week.timestamp() * 1000)
+
+
+def _utc_hour_prefix(value: str) -> Optional[str]:
+    """ISO 时间字符串 -> UTC 的 'YYYY-MM-DDTHH'；带时区偏移的经 datetime.fromisoformat 换算，无法解析时返回 None"""
+    if '+' not in value[10:] and '-' not in value[10:]:
+        return value[:13]  # 不带偏移（或以 Z 结尾）：前 13 位即 UTC 小时，无需解析
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc)
+    return parsed.strftime('%Y-%m-%dT%H')
+
+
+class TrendRollup:
+    """
+    按 (事件, 粒度, 后端状态) 分组的时间桶计数。
+    :param fields: {事件名: 原始记录中的时间字段名}
+    """
+
+    def __init__(self, fields: Optional[Dict[str, str]] = None):
+        self.fields = fields or EVENT_FIELDS
+        self.buckets: Dict[Tuple[str, str, str], Counter] = {}
+        # 小时前缀 -> 三种粒度的桶；不同小时数远小于记录数，避免逐条解析时间
+        self._bucket_memo: Dict[str, Optional[Tuple[int, int, int]]] = {}
+
+    def add(self, item: Dict[str, Any]) -> None:
+        status = str(item.get('status') or 'unknown')
+        for event, field in self.fields.items():
+            value = item.get(field)
+            if not value or not isinstance(value, str) or len(value) < 13:
+                continue
+            prefix = _utc_hour_prefix(value)
+            if prefix is None:
+                continue
+            bucket = self._bucket_memo.get(prefix)
+            if bucket is None:
+                if prefix in self._bucket_memo:
+                    continue
+                bucket = self._bucket_memo[prefix] = _hour_buckets(prefix)
+                if bucket is None:
+                    continue
+            for granularity, start in zip(('hour', 'day', 'week'), bucket):
+                key = (event, granularity, status)
+                counter = self.buckets.get(key)
+                if counter is None:
+                    counter = self.buckets[key] = Counter()
+                counter[start] += 1
+
+    def series(self, event: str, granularity: str, since_ms: Optional[int] = None) -> Dict[str, List[Point]]:
+        """
+        出参：{后端状态: [[桶起点毫秒时间戳, 计数], ...]}，各状态共用同一时间轴，空桶补 0。
+        入参：since_ms 只保留包含该时间及之后的桶。
+        说明：时间轴只由有数据的桶及其两侧的空桶组成（连续空桶只保留首尾两个 0 点，折线形状不变），
+              点数与有数据的桶数成正比；个别时间戳异常久远的记录不会让输出膨胀为上百万个空桶。
+        """
+        step = GRANULARITY_MS[granularity]
+        groups = {status: counter for (ev, gran, status), counter in self.buckets.items()
+                  if ev == event and gran == granularity and counter}
+        if not groups:
+            return {}
+        keys = sorted(set().union(*groups.values()))
+        start = None
+        if since_ms is not None and since_ms > keys[0]:
+            # 同一粒度的桶起点两两相差 step 的整数倍（周桶以周一为起点，与纪元不对齐），取包含 since_ms 的桶
+            start = keys[0] + (since_ms - keys[0]) // step * step
+            keys = [key for key in keys if key >= start]
+            if not keys:
+                return {}
+        axis = set(keys)
+        previous = start - step if start is not None else keys[0]
+        if start is not None:
+            axis.add(start)
+        for key in keys:
+            if key - previous > step:
+                axis.update((previous + step, key - step))
+            previous = key
+        starts = sorted(axis)
+        return {status: [[start, counter.get(start, 0)] for start in starts] for status, counter in sorted(groups.items())}
+
+def lttb(points: Sequence[Sequence[float]], threshold: int) -> List[Sequence[float]]:
+    """
+    功能：Largest-Triangle-Three-Buckets 降采样。
+    说明：首尾点保留；中间点均分为 threshold - 2 个桶，每桶选出与前一选中点、下一桶均值构成三角形面积最大的点。
+    入参：points 按 x 升序的 [x, y] 序列；threshold 目标点数（小于 3 或不少于原点数时原样返回）。
+    """
+    length = len(points)
+    if threshold < 3 or threshold >= length:
+        return list(points)
+    sampled = [points[0]]
+    every = (length - 2) / (threshold - 2)
+    a = 0
+    for i in range(threshold - 2):
+        # 下一桶的均值点
+        avg_start = int((i + 1) * every) + 1
+        avg_end = min(int((i + 2) * every) + 1, length)
+        avg_range = points[avg_start:avg_end] or [points[-1]]
+        avg_x = sum(p[0] for p in avg_range) / len(avg_range)
+        avg_y = sum(p[1] for p in avg_range) / len(avg_range)
+
+        ax, ay = points[a]
+        best, best_area = None, -1.0
+        for j in range(int(i * every) + 1, int((i + 1) * every) + 1):
+            px, py = points[j]
+            area = abs((ax - avg_x) * (py - ay) - (ax - px) * (avg_y - ay))
+            if area > best_area:
+                best, best_area = j, area
+        sampled.append(points[best])
+        a = best
+    sampled.append(points[-1])
+    return sampled
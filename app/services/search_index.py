@@ -0,0 +1,119 @@
+"""
+文件职责：
+    词条检索索引 (search_index.py)。
+    在进程内维护已拉取过的解析记录的 n-gram 倒排索引，支持按汉字或拼音做子串/前缀检索。
+核心功能：
+    - 增量维护：分页、窗口、导出等任意路径拉取到的清洗后记录都会写入索引。
+    - 拼音归一化：忽略大小写、声调与空格（ü 统一为 v），输入 "han" 可命中 "hàn"。
+    - 容量上限：超过 max_records 时按写入顺序淘汰最旧记录，内存占用可控。
+"""
+
+import unicodedata
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+# 单条记录参与检索的字段
+SEARCH_FIELDS = ('word', 'pinyin')
+
+
+def normalize_search_text(text: Any) -> str:
+    """统一检索文本：小写、去声调、去空白，ü -> v"""
+    if not text or text == '-':
+        return ''
+    text = str(text).lower().replace('ü', 'v')
+    decomposed = unicodedata.normalize('NFD', text)
+    return ''.join(ch for ch in decomposed if not unicodedata.combining(ch) and not ch.isspace())
+
+
+def text_grams(text: str) -> Set[str]:
+    """单字 + 双字 gram：单字用于 1 个字符的查询，双字用于更长查询的候选过滤"""
+    grams = set(text)
+    grams.update(text[i:i + 2] for i in range(len(text) - 1))
+    return grams
+
+
+def query_grams(needle: str) -> Set[str]:
+    """归一化后的查询词需要全部命中的 gram：单字查询为其本身，否则为全部相邻双字"""
+    return {needle} if len(needle) == 1 else {needle[i:i + 2] for i in range(len(needle) - 1)}
+
+
+class RecordSearchIndex:
+    """
+    基于 n-gram 倒排表的记录检索索引。
+    :param max_records: 最多保留的记录数，超出后淘汰最早写入的记录
+    """
+
+    def __init__(self, max_records: int = 50000):
+        self.max_records = max_records
+        self._records: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._keys: Dict[str, List[str]] = {}
+        self._postings: Dict[str, Set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def add_rows(self, rows: Iterable[Dict[str, Any]]) -> None:
+        """写入或更新清洗后的记录（以 id 去重）"""
+        for row in rows:
+            record_id = row.get('id')
+            if not record_id or record_id == '-':
+                continue
+            if record_id in self._records:
+                self._remove(record_id)
+            keys = [normalize_search_text(row.get(field)) for field in SEARCH_FIELDS]
+            self._records[record_id] = dict(row)
+            self._keys[record_id] = keys
+            for gram in set().union(*(text_grams(key) for key in keys)):
+                self._postings.setdefault(gram, set()).add(record_id)
+
+        while len(self._records) > self.max_records:
+            self._remove(next(iter(self._records)))
+
+    def search(self, query: str, status_label: Optional[str] = None, limit: int = 50) -> List[Dict[str, Any]]:
+        """
+        检索 word / pinyin 中包含 query 的记录，前缀命中优先。
+        :param status_label: 可选，仅返回该中文状态（如“待审核”）的记录
+        """
+        needle = normalize_search_text(query)
+        if not needle:
+            return []
+
+        candidates = self._candidates(needle)
+        prefix_hits, other_hits = [], []
+        for record_id in candidates:
+            row = self._records[record_id]
+            if status_label and row.get('status') != status_label:
+                continue
+            keys = self._keys[record_id]
+            if any(key.startswith(needle) for key in keys):
+                prefix_hits.append(row)
+            elif any(needle in key for key in keys):
+                other_hits.append(row)
+
+        return [dict(row) for row in (prefix_hits + other_hits)[:limit]]
+
+    def matches(self, row: Dict[str, Any], query: str) -> bool:
+        """判断单条记录是否命中 query，用于校验后端检索结果"""
+        needle = normalize_search_text(query)
+        return bool(needle) and any(needle in normalize_search_text(row.get(field)) for field in SEARCH_FIELDS)
+
+    def clear(self) -> None:
+        self._records.clear()
+        self._keys.clear()
+        self._postings.clear()
+
+    def _candidates(self, needle: str) -> Set[str]:
+        postings = sorted((self._postings.get(gram, set()) for gram in query_grams(needle)), key=len)
+        if not postings or not postings[0]:
+            return set()
+        return set.intersection(*postings)
+
+    def _remove(self, record_id: str) -> None:
+        self._records.pop(record_id, None)
+        for key in self._keys.pop(record_id, []):
+            for gram in text_grams(key):
+                posting = self._postings.get(gram)
+                if posting is not None:
+                    posting.discard(record_id)
+                    if not posting:
+                        del self._postings[gram]
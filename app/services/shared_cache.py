@@ -0,0 +1,173 @@
+"""
+文件职责：
+    跨进程共享缓存 (shared_cache.py)。
+    多进程部署（multiworker.py）时由主进程在 Unix socket 上运行一个小型键值缓存服务，
+    各 worker 的状态统计与分页缓存在本进程未命中时先查询共享缓存，再访问上游，
+    上游请求量与 worker 数量基本无关。
+核心功能：
+    - SharedCacheServer：按 (命名空间, 键) 保存 JSON 值，带 TTL 与 LRU 容量上限。
+    - SharedCacheClient：worker 侧客户端，单连接串行请求；服务不可用时视为未命中，不影响页面。
+    - shared_load：“先查共享缓存、未命中再加载并回写”的通用封装。
+说明：
+    协议为按行分隔的 JSON（请求一行、响应一行）；值必须可 JSON 序列化（元组会变为列表）。
+"""
+
+import asyncio
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 单行消息上限（字节），足以容纳一页清洗后的记录
+_LINE_LIMIT = 4 * 1024 * 1024
+
+
+class SharedCacheServer:
+    """
+    Unix socket 键值缓存服务，运行在多进程部署的主进程中。
+    :param path: socket 文件路径
+    :param max_entries: 最多保留的条目数，超出后淘汰最久未访问的条目
+    """
+
+    def __init__(self, path: str, max_entries: int = 5000):
+        self.path = path
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[float, Any]]" = OrderedDict()
+        self._server: Optional[asyncio.AbstractServer] = None
+        # 当前打开的客户端连接；Server.wait_closed 会等待全部连接关闭，停止时需主动断开
+        self._writers: Set[asyncio.StreamWriter] = set()
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_unix_server(self._handle, path=self.path, limit=_LINE_LIMIT)
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            for writer in list(self._writers):
+                writer.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    def execute(self, request: dict) -> Any:
+        """执行单个请求：get 返回值或 None，set / delete 返回 True"""
+        key = (request.get('ns', ''), request.get('key', ''))
+        op = request.get('op')
+        if op == 'get':
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+        if op == 'set':
+            self._entries[key] = (time.monotonic() + float(request.get('ttl', 60)), request.get('value'))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            return True
+        if op == 'delete':
+            self._entries.pop(key, None)
+            return True
+        raise ValueError(f'未知操作: {op}')
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self._writers.add(writer)
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    response = {'value': self.execute(json.loads(line))}
+                except Exception as e:
+                    response = {'error': str(e)}
+                writer.write(json.dumps(response, ensure_ascii=False).encode('utf-8') + b'\n')
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self._writers.discard(writer)
+            writer.close()
+
+
+class SharedCacheClient:
+    """
+    worker 侧客户端。连接在首次使用时建立并复用，请求经锁串行化；
+    连接失败后 retry_after 秒内直接视为未命中，避免服务不可用时拖慢每个请求。
+    :param path: 服务端 socket 文件路径
+    :param timeout: 单次请求超时（秒）
+    """
+
+    def __init__(self, path: str, timeout: float = 1.0, retry_after: float = 5.0):
+        self.path = path
+        self.timeout = timeout
+        self.retry_after = retry_after
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._lock: Optional[asyncio.Lock] = None
+        self._down_until = 0.0
+
+    async def get(self, namespace: str, key: str) -> Optional[Any]:
+        return await self._request({'op': 'get', 'ns': namespace, 'key': key})
+
+    async def set(self, namespace: str, key: str, value: Any, ttl: float) -> None:
+        await self._request({'op': 'set', 'ns': namespace, 'key': key, 'value': value, 'ttl': ttl})
+
+    async def delete(self, namespace: str, key: str) -> None:
+        await self._request({'op': 'delete', 'ns': namespace, 'key': key})
+
+    async def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+        self._reader = self._writer = None
+
+    async def _request(self, request: dict) -> Optional[Any]:
+        if time.monotonic() < self._down_until:
+            return None
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            try:
+                if self._writer is None:
+                    self._reader, self._writer = await asyncio.wait_for(
+                        asyncio.open_unix_connection(self.path, limit=_LINE_LIMIT), self.timeout
+                    )
+                self._writer.write(json.dumps(request, ensure_ascii=False).encode('utf-8') + b'\n')
+                await self._writer.drain()
+                response = json.loads(await asyncio.wait_for(self._reader.readline(), self.timeout) or b'{}')
+            except Exception as e:
+                logger.warning(f"共享缓存不可用，{self.retry_after:.0f}s 内改为直接访问上游: {e!r}")
+                self._down_until = time.monotonic() + self.retry_after
+                await self.close()
+                return None
+        if 'error' in response:
+            logger.warning(f"共享缓存请求失败: {response['error']}")
+            return None
+        return response.get('value')
+
+
+async def shared_load(client: Optional[SharedCacheClient], namespace: str, key: str,
+                      loader: Callable[[], Awaitable[Any]], ttl: float,
+                      validator: Optional[Callable[[Any], bool]] = None, refresh: bool = False) -> Any:
+    """
+    功能：先查共享缓存，未命中时调用 loader 并把结果回写共享缓存。
+    入参：
+        - validator：返回 False 的结果（降级占位等）不回写。
+        - refresh：为 True 时跳过读取、直接加载并覆盖共享缓存（调用方已确认共享值可能过期）。
+        - client 为 None（单进程模式）时直接调用 loader。
+    """
+    if client is None:
+        return await loader()
+    if not refresh:
+        cached = await client.get(namespace, key)
+        if cached is not None:
+            return cached
+    value = await loader()
+    if value is not None and (validator is None or validator(value)):
+        await client.set(namespace, key, value, ttl)
+    return value
@@ -0,0 +1,251 @@
+"""
+文件职责：
+    系统日志（汇总）统计的增量聚合引擎 (summary_stats.py)。
+    首次全量遍历一遍解析记录，计算按创建人的计数与按时间预分桶的趋势；此后只拉取比高水位
+    （已聚合的最新记录的 (created_at, id)）更新的记录并累加，每轮刷新的上游开销与总记录数无关。
+核心功能：
+    - refresh：需要时在后台启动全量重建，否则增量追平到最新记录。
+    - 全量重建：按块顺序遍历，重建期间新增的记录留给下一轮增量；完成后整体替换，读方不会看到半成品。
+    - 漂移检测：增量后的记录数与上游总数不一致（删除、乱序写入等），或总数一致而各状态计数不同（改状态）时，
+      延迟触发一次全量重建。
+    - creator_distribution：首页“系统日志”卡片的按创建人分布 [{'name', 'value'}]（前 TOP_CREATORS 人，其余合并）。
+    - trend_series：由预分桶汇总 (rollups.TrendRollup) 输出按 小时 / 天 / 周 的新增与审核趋势，经 LTTB 降采样。
+    - records：可选的列式记录缓存 (columnar.ColumnarRecords)，与各项计数共用同一次遍历与增量追平。
+说明：
+    增量追平依赖后端列表默认按创建时间倒序返回（与游标翻页的假设一致）；记录的改状态、删除
+    由漂移检测触发的全量重建（距上次重建至少 DRIFT_REBUILD_DELAY 秒）纠正；同理，旧记录在计入之后才被审核时，
+    其 reviewed_at 也要到下一次全量重建才会进入审核趋势。
+"""
+
+import asyncio
+import logging
+import time
+from collections import Counter
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+from app.services.columnar import ColumnarRecords
+from app.services.rollups import TrendRollup, lttb
+
+logger = logging.getLogger(__name__)
+
+# 拉取一块原始记录：(skip, limit) -> (原始记录列表, 上游总数)
+ChunkFetcher = Callable[[int, int], Awaitable[Tuple[List[Dict[str, Any]], int]]]
+# 读取上游各状态的记录数 {status: count}，不可用时返回 None
+CountsFetcher = Callable[[], Awaitable[Optional[Dict[str, int]]]]
+
+
+def _record_key(item: Dict[str, Any]) -> Optional[Tuple[str, str]]:
+    """原始记录的排序键 (created_at, id)，任一字段缺失时返回 None"""
+    created_at, record_id = item.get('created_at'), item.get('id')
+    return (str(created_at), str(record_id)) if created_at and record_id else None
+
+
+class SummaryTables:
+    """一份完整的聚合结果；全量重建时新建一份，完成后整体替换"""
+
+    def __init__(self, trend_fields: Optional[Dict[str, str]] = None, columnar: bool = False):
+        self.trends = TrendRollup(trend_fields)
+        self.records: Optional[ColumnarRecords] = ColumnarRecords() if columnar else None
+        self.creators: Counter = Counter()  # 完整创建人 id（缺失为 None） -> 记录数
+        self.statuses: Counter = Counter()  # 计入时的后端状态 -> 记录数，用于发现改状态
+        self.count = 0
+
+    def add(self, item: Dict[str, Any]) -> None:
+        self.creators[str(item['creator_id']) if item.get('creator_id') else None] += 1
+        self.statuses[item.get('status')] += 1
+        self.trends.add(item)
+        if self.records is not None:
+            self.records.add(item)
+        self.count += 1
+
+    def seal(self) -> None:
+        """全量遍历结束：列式缓存由新到旧的装载顺序翻转为时间升序，此后的增量记录须按从旧到新的顺序计入"""
+        if self.records is not None:
+            self.records.seal()
+
+
+class SummaryAggregator:
+    """
+    增量聚合器（进程级单例，由 data_service 创建）。
+    :param fetch_chunk: 拉取一块原始记录的协程函数，失败时抛出异常
+    :param config: SUMMARY_CONFIG
+    :param trend_fields: 趋势事件 -> 原始记录中的时间字段（TREND_CONFIG['EVENT_FIELDS']）
+    :param columnar: 是否同时维护列式记录缓存（COLUMNAR_CONFIG['ENABLED']）
+    :param fetch_counts: 可选，读取上游各状态记录数的协程函数；给定时每轮增量后核对，发现改状态
+    """
+
+    def __init__(self, fetch_chunk: ChunkFetcher, config: Dict[str, Any], trend_fields: Optional[Dict[str, str]] = None,
+                 columnar: bool = False, fetch_counts: Optional[CountsFetcher] = None):
+        self.fetch_chunk = fetch_chunk
+        self.fetch_counts = fetch_counts
+        self.config = config
+        self.trend_fields = trend_fields
+        self.columnar = columnar
+        self.tables = self._new_tables()
+        self.high_water: Optional[Tuple[str, str]] = None
+        self.built_at: Optional[float] = None
+        self._drift = False
+        self._lock = asyncio.Lock()
+        self._rebuild_task: Optional[asyncio.Task] = None
+
+    @property
+    def ready(self) -> bool:
+        return self.built_at is not None
+
+    @property
+    def rebuilding(self) -> bool:
+        return self._rebuild_task is not None and not self._rebuild_task.done()
+
+    async def refresh(self) -> bool:
+        """
+        功能：把聚合结果推进到最新。
+        说明：需要全量重建时只在后台启动重建任务并立即返回（首页不等待全量遍历）；
+              否则增量拉取高水位之后的新记录。上游失败时保留现有结果。
+        出参：本轮是否有新记录计入。
+        """
+        if self._rebuild_due():
+            self._start_rebuild()
+        if not self.ready or self.rebuilding:
+            return False
+        try:
+            async with self._lock:
+                fresh = await self._catch_up()
+            await self._check_status_counts()
+            return fresh
+        except Exception as e:
+            logger.error(f"汇总统计增量更新失败: {e}")
+            return False
+
+    def _new_tables(self) -> SummaryTables:
+        return SummaryTables(self.trend_fields, self.columnar)
+
+    def _rebuild_due(self) -> bool:
+        if not self.ready:
+            return True
+        age = time.monotonic() - self.built_at
+        if self._drift and age >= self.config.get('DRIFT_REBUILD_DELAY', 300):
+            return True
+        return age >= self.config.get('REBUILD_INTERVAL', 6 * 3600)
+
+    def _start_rebuild(self) -> None:
+        if self.rebuilding:
+            return
+        self._rebuild_task = asyncio.ensure_future(self._rebuild())
+        self._rebuild_task.add_done_callback(self._on_rebuild_done)
+
+    @staticmethod
+    def _on_rebuild_done(task: asyncio.Task) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"汇总统计全量重建失败，沿用上一次结果: {task.exception()}")
+
+    async def _rebuild(self) -> None:
+        """
+        按块顺序遍历全部记录。偏移分页在遍历期间遇到新增记录时，已读过的记录会整体后移：
+        首块之前的新记录按高水位跳过，跨块重复的记录按上一块的 id 去重。
+        """
+        chunk_size = self.config.get('CHUNK_SIZE', 1000)
+        started = time.monotonic()
+        tables = self._new_tables()
+        high_water: Optional[Tuple[str, str]] = None
+        previous_ids: Set[Any] = set()
+        skip = 0
+        while True:
+            items, total = await self.fetch_chunk(skip, chunk_size)
+            if skip == 0 and items:
+                high_water = _record_key(items[0])
+            chunk_ids: Set[Any] = set()
+            for item in items:
+                key = _record_key(item)
+                if high_water is not None and key is not None and key > high_water:
+                    continue
+                record_id = item.get('id')
+                if record_id is not None:
+                    if record_id in previous_ids:
+                        continue
+                    chunk_ids.add(record_id)
+                tables.add(item)
+            previous_ids = chunk_ids
+            skip += len(items)
+            if len(items) < chunk_size or skip >= total:
+                break
+        tables.seal()
+
+        async with self._lock:
+            self.tables, self.high_water = tables, high_water
+            self.built_at, self._drift = time.monotonic(), False
+        logger.info(f"汇总统计全量重建完成：{tables.count} 条记录，耗时 {time.monotonic() - started:.1f}s")
+
+    async def _catch_up(self) -> bool:
+        """从最新记录开始分块拉取，直到越过高水位；只把新记录计入当前结果"""
+        size = self.config.get('CATCH_UP_SIZE', 100)
+        fresh: List[Dict[str, Any]] = []
+        upstream_total: Optional[int] = None
+        skip = 0
+        while True:
+            items, total = await self.fetch_chunk(skip, size)
+            if upstream_total is None:
+                upstream_total = total
+            reached = False
+            for item in items:
+                key = _record_key(item)
+                if key is None:
+                    continue
+                if self.high_water is not None and key <= self.high_water:
+                    reached = True
+                    break
+                fresh.append(item)
+            skip += len(items)
+            if reached or len(items) < size or skip >= total:
+                break
+
+        # fresh 为新到旧顺序，按从旧到新计入，列式缓存保持时间升序
+        for item in reversed(fresh):
+            self.tables.add(item)
+        if fresh:
+            self.high_water = max(self.high_water, _record_key(fresh[0])) if self.high_water else _record_key(fresh[0])
+        if upstream_total is not None and upstream_total != self.tables.count and not self._drift:
+            logger.warning(f"汇总统计记录数 {self.tables.count} 与上游总数 {upstream_total} 不一致，将安排全量重建")
+            self._drift = True
+        return bool(fresh)
+
+    async def _check_status_counts(self) -> None:
+        """
+        改状态不改变记录总数，增量追平感知不到：总数与上游一致而各状态计数不同时安排全量重建。
+        总数不一致（有增删或上游计数尚未更新）时不在此判断，交给 _catch_up 的总数比较。
+        """
+        if self.fetch_counts is None or self._drift:
+            return
+        upstream = await self.fetch_counts()
+        if not upstream or sum(upstream.values()) != self.tables.count:
+            return
+        if any(self.tables.statuses.get(status, 0) != count for status, count in upstream.items()):
+            logger.warning("汇总统计各状态计数与上游不一致（改状态），将安排全量重建")
+            self._drift = True
+
+    def creator_distribution(self, top: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        记录数最多的 top 个创建人（名称与详情表一致：id 前 8 位，缺失为 'system'），其余合并为一项。
+        计数相同时按 id 排序，保证相邻两轮输出顺序稳定、不产生多余推送。
+        """
+        if not self.ready:
+            return [{'value': 0, 'name': '统计中'}]
+        if not self.tables.count:
+            return [{'value': 0, 'name': '暂无数据'}]
+        top = top or self.config.get('TOP_CREATORS', 10)
+        ranked = sorted(self.tables.creators.items(), key=lambda kv: (-kv[1], kv[0] or ''))
+        result = [{'value': value, 'name': creator[:8] if creator else 'system'} for creator, value in ranked[:top]]
+        rest = sum(value for _, value in ranked[top:])
+        if rest:
+            result.append({'value': rest, 'name': self.config.get('OTHER_CREATORS_NAME', '其他')})
+        return result
+
+    def creator_ids(self) -> List[str]:
+        """已计入的全部创建人 id（按记录数降序），供按创建人筛选的下拉选项使用"""
+        ranked = sorted(self.tables.creators.items(), key=lambda kv: (-kv[1], kv[0] or ''))
+        return [creator for creator, _ in ranked if creator]
+
+    def trend_series(self, event: str, granularity: str, since_ms: Optional[int] = None,
+                     max_points: int = 300) -> Dict[str, List[List[int]]]:
+        """各后端状态的 [[桶起点毫秒时间戳, 计数], ...]，每条折线经 LTTB 降采样到至多 max_points 个点"""
+        series = self.tables.trends.series(event, granularity, since_ms)
+        return {status: lttb(points, max_points) for status, points in series.items()}
@@ -1,12 +1,19 @@
-from nicegui import ui
-import asyncio
 import logging
-# 1. 导入配置、服务和工具
-from app.config.constants import BODY_STYLE, DETAILS_HEAD_HTML, TABLE_COLUMNS, LAYOUT_CONFIG
-from app.services.data_service import get_cleaned_data
-
 import math
-from nicegui import ui
+import time
+from datetime import date, timedelta
+
+from nicegui import background_tasks, ui
+from nicegui.json import dumps as json_dumps  # 与 NiceGUI 消息通道一致：优先 orjson，缺失时回退标准库
+# 1. 导入配置、服务和工具
+from app.config.constants import BODY_STYLE, DETAILS_HEAD_HTML, TABLE_COLUMNS, LAYOUT_CONFIG, CACHE_CONFIG, AUTO_REFRESH_CONFIG
+from app.services.data_service import (
+    filter_records, get_cleaned_data_async, get_cleaned_window_async, get_filter_options, prefetch_pages,
+    refresh_page_async, search_records_async
+)
+from app.services.export_service import EXPORT_WRITERS, build_export_filename, export_records
+from app.services.metrics import metrics
+from app.services.profiler import profiler
 
 # --- 直接定义类，不要在当前文件 import 自己 ---
 
@@ -23,6 +30,142 @@ class AsyncDataLoader:
     def release(self):
         self.is_loading = False
 
+class VirtualRowWindow:
+    """
+    虚拟滚动模式的行窗口：table.rows 只保存全量数据中 [offset, offset + len(rows)) 这一段，
+    超过 max_rows 时丢弃远离视口的一端，保证单个客户端的内存有上限。
+    """
+    def __init__(self, window_size: int, max_rows: int):
+        self.window_size = window_size
+        self.max_rows = max(max_rows, window_size * 2)
+        self.offset = 0
+        self.total = None
+
+    def loaded_end(self, loaded_count: int) -> int:
+        return self.offset + loaded_count
+
+    def has_more(self, loaded_count: int) -> bool:
+        return self.total is None or self.loaded_end(loaded_count) < self.total
+
+def _run_client_js(element: ui.element, code: str) -> int:
+    """向元素所在客户端发送一段 JS，返回负载字节数"""
+    element.client.run_javascript(code)
+    return len(code.encode('utf-8'))
+
+def set_client_prop(element: ui.element, name: str, value) -> None:
+    """
+    只向浏览器发送单个 prop 的变更。
+    element.props('xxx') 会触发整个元素重新序列化（表格会连同全部行一起重发），表格等大元素改用此函数。
+    """
+    with element.props.suspend_updates():
+        element.props[name] = value
+    _run_client_js(element, f'mounted_app.elements[{element.id}].props[{json_dumps(name)}] = {json_dumps(value)}')
+
+def push_table_rows(table: ui.table, rows: list, prepend: bool = False) -> None:
+    """
+    只把增量行发送到浏览器：服务端静默修改 table.rows（保证之后整表刷新或重连时状态一致），
+    客户端直接在已有 rows 上 push/unshift，不重新序列化整张表。
+    增量行用 orjson 序列化为 JS 字面量（不转义中文），比 json.dumps 更快且字节更少。
+    注意：NiceGUI 的 props 是可观察对象，修改 table.rows 必须暂停自动更新，否则仍会整表重发。
+    """
+    if not rows:
+        return
+    with table.props.suspend_updates():
+        if prepend:
+            table.rows[:0] = rows
+        else:
+            table.rows.extend(rows)
+    method = 'unshift' if prepend else 'push'
+    nbytes = _run_client_js(table, f'mounted_app.elements[{table.id}].props.rows.{method}(...{json_dumps(rows)})')
+    metrics.observe('ui_table_payload_bytes', nbytes, mode=method)
+
+def drop_table_rows(table: ui.table, count: int, from_start: bool = True) -> None:
+    """从表格头部或尾部丢弃 count 行，同样只向浏览器发送 splice 指令"""
+    if count <= 0:
+        return
+    with table.props.suspend_updates():
+        if from_start:
+            del table.rows[:count]
+        else:
+            del table.rows[-count:]
+    splice = f'0, {count}' if from_start else f'-{count}'
+    _run_client_js(table, f'mounted_app.elements[{table.id}].props.rows.splice({splice})')
+
+def patch_table_rows(table: ui.table, rows: list, index_field: str = None, index_base: int = 1) -> int:
+    """
+    功能：按 row_key 对比表格新旧行，只向浏览器发送新增 / 变化的行和新的行顺序；被移除的行由顺序隐式删除。
+    说明：
+        - 数据与当前完全一致时不发送任何内容；
+        - index_field 为序号列时不参与对比，由浏览器按 index_base + 位置重新编号，
+          这样列表头部插入新记录时其余行不会因为序号变化而整行重发；
+        - 主键缺失或重复时无法按键对比，回退为整表刷新。
+    入参：
+        - table (ui.table): 目标表格。
+        - rows (list): 新的完整行列表（服务端 table.rows 会被静默替换为该列表）。
+        - index_field (str, 可选): 序号列字段名。
+        - index_base (int): 第一行的序号。
+    出参：本次发送的负载字节数，0 表示数据未变化、已跳过。
+    """
+    key = table.row_key
+    old_rows = {row.get(key): row for row in table.rows}
+    order = [row.get(key) for row in rows]
+    if None in order or len(set(order)) != len(order) or len(old_rows) != len(table.rows):
+        table.rows[:] = rows  # 可观察对象触发整表更新
+        nbytes = len(json_dumps(rows).encode('utf-8'))
+        metrics.observe('ui_table_payload_bytes', nbytes, mode='full')
+        return nbytes
+
+    def same(old: dict, new: dict) -> bool:
+        if index_field is None:
+            return old == new
+        return len(old) == len(new) and all(old.get(k) == v for k, v in new.items() if k != index_field)
+
+    changed = {row[key]: row for row in rows if row[key] not in old_rows or not same(old_rows[row[key]], row)}
+    old_order = [row.get(key) for row in table.rows]
+    old_base = table.rows[0].get(index_field) if index_field and table.rows else index_base
+    if not changed and old_order == order and old_base == index_base:
+        metrics.inc('ui_table_patch_skipped_total')
+        return 0
+
+    with table.props.suspend_updates():
+        table.rows[:] = rows
+    renumber = (f'next.forEach((row, i) => {{ row[{json_dumps(index_field)}] = {int(index_base)} + i; }});'
+                if index_field else '')
+    code = (
+        f'(() => {{ const rows = mounted_app.elements[{table.id}].props.rows;'
+        f' const old = new Map(rows.map((row) => [row[{json_dumps(key)}], row]));'
+        f' const changed = new Map({json_dumps(list(changed.items()))});'
+        f' const next = {json_dumps(order)}.map((k) => changed.get(k) || old.get(k));'
+        f' {renumber} rows.splice(0, rows.length, ...next); }})()'
+    )
+    nbytes = _run_client_js(table, code)
+    metrics.observe('ui_table_payload_bytes', nbytes, mode='delta')
+    return nbytes
+
+def _merge_chart_options(target: dict, patch: dict) -> None:
+    """按 ECharts setOption 的合并语义合并：字典递归合并，series 按下标合并，其余值整体替换"""
+    for key, value in patch.items():
+        current = target.get(key)
+        if isinstance(value, dict) and isinstance(current, dict):
+            _merge_chart_options(current, value)
+        elif key == 'series' and isinstance(value, list) and isinstance(current, list):
+            for index, item in enumerate(value):
+                if index < len(current) and isinstance(current[index], dict):
+                    _merge_chart_options(current[index], item)
+                else:
+                    current.append(item)
+        else:
+            target[key] = value
+
+def patch_chart_options(chart: ui.echart, patch: dict) -> None:
+    """
+    只向浏览器发送图表的增量配置：服务端静默合并进 chart.options（保证之后整图刷新或重连时状态一致），
+    客户端调用 setOption 合并更新，不重新发送整份图表配置。
+    """
+    with chart.props.suspend_updates():
+        _merge_chart_options(chart.options, patch)
+    chart.run_chart_method('setOption', patch)
+
 def calculate_max_page(total_records: int, page_size: int) -> int:
     if total_records <= 0:
         return 1
@@ -40,8 +183,12 @@ def format_datetime(dt_str: str) -> str:
     if not dt_str or dt_str == "string":
         return "-"
     return str(dt_str).replace('T', ' ')[:16]
-async def render_details_content(status: str = None):
-    """渲染详情页：已使用 utils 工具类优化逻辑处理"""
+async def render_details_content(status: str = None, view: str = 'paged'):
+    """
+    渲染详情页：已使用 utils 工具类优化逻辑处理
+    :param view: 'paged' 分页模式；'virtual' 虚拟滚动模式（按需加载窗口，适合连续浏览大量记录）
+    """
+    is_virtual = view == 'virtual'
     ui.query('body').style(BODY_STYLE)
     ui.add_head_html(DETAILS_HEAD_HTML)
 
@@ -60,7 +207,19 @@ async def render_details_content(status: str = None):
                 
                 with ui.row().classes('gap-3 items-center'):
                     search_input = ui.input(placeholder='检索词条...').props('rounded outlined dense').classes('w-80')
-                    ui.button('导出 Excel', icon='download').props('elevated').classes('bg-blue-600 text-white px-6')
+                    with ui.button('筛选', icon='filter_list').props('flat').classes('text-blue-600') as filter_button:
+                        filter_menu = ui.menu()
+                    ui.button(
+                        '分页浏览' if is_virtual else '滚动浏览', icon='view_list' if is_virtual else 'swap_vert',
+                        on_click=lambda: ui.navigate.to(f"?view={'paged' if is_virtual else 'virtual'}")
+                    ).props('flat').classes('text-blue-600')
+                    with ui.button('导出 Excel', icon='download').props('elevated').classes('bg-blue-600 text-white px-6') as export_button:
+                        export_menu = ui.menu()
+
+            # 导出进度条：仅在导出进行中显示
+            export_progress = ui.linear_progress(value=0, show_value=False).props('rounded color=blue-6').classes('w-full -mt-6 mb-2')
+            export_progress.set_visibility(False)
+            bind_export(export_button, export_menu, export_progress, status)
 
             # --- 表格区域 ---
             table = ui.table(columns=TABLE_COLUMNS, rows=[], row_key='id').classes('w-full border-none shadow-none').props('flat no-data-label=" 暂无数据..." loading-label="正在努力加载中..." ')
@@ -69,8 +228,24 @@ async def render_details_content(status: str = None):
             table.add_slot('body-cell-status', '''<q-td :props="props" class="text-center"><span :style="{'background-color': props.value?.includes('发布') ? '#ecfdf5' : props.value?.includes('拒绝') ? '#fef2f2' : props.value?.includes('审核') ? '#fff7ed' : '#f1f5f9', 'color': props.value?.includes('发布') ? '#059669' : props.value?.includes('拒绝') ? '#dc2626' : props.value?.includes('审核') ? '#d97706' : '#64748b', 'border': '1px solid currentColor', 'padding': '4px 12px', 'border-radius': '8px', 'font-weight': 'bold', 'display': 'inline-block', 'font-size': '12px', 'min-width': '80px'}">{{ props.value }}</span></q-td>''')
             table.add_slot('body-cell-actions', '''<q-td :props="props" class="text-center"><q-btn flat round color="blue-6" icon="manage_search" @click="$parent.$emit('view_details', props.row)"><q-tooltip class="bg-blue-800 text-white">查看解析详情</q-tooltip></q-btn></q-td>''')
 
+            if is_virtual:
+                # 虚拟滚动：固定高度容器内只渲染可视行，滚动到窗口边缘时再按需加载
+                table.props(f"virtual-scroll virtual-scroll-item-size={LAYOUT_CONFIG.get('VIRTUAL_ROW_HEIGHT', 48)}")
+                table.classes(LAYOUT_CONFIG.get('VIRTUAL_TABLE_HEIGHT', 'h-[70vh]'))
+                with ui.row().classes('w-full justify-end mt-8 items-center gap-4 px-4'):
+                    window_label = ui.label('').classes('text-sm text-slate-500')
+                search_input.disable()
+                search_input.tooltip('检索仅在分页浏览模式下可用')
+                filter_button.set_visibility(False)
+                bind_virtual_scroll(table, total_label, window_label, status)
+                return
+
             # --- 分页控制区域 ---
-            with ui.row().classes('w-full justify-end mt-8 items-center gap-4 px-4'):
+            with ui.row().classes('w-full justify-end mt-8 items-center gap-4 px-4') as pager_row:
+                refresh_select = ui.select(
+                    {sec: f'每 {sec} 秒自动刷新' if sec else '自动刷新：关闭' for sec in AUTO_REFRESH_CONFIG.get('INTERVALS', [0])},
+                    value=0
+                ).props('outlined dense options-dense').classes('w-44 mr-auto')
                 pagination = ui.pagination(min=1, max=1, direction_links=True).props('flat color=blue-7 size=md active-design=outline max-pages=5')
                 with ui.row().classes('items-center gap-2 text-slate-500'):
                     ui.label('跳至').classes('text-sm')
@@ -78,50 +253,307 @@ async def render_details_content(status: str = None):
                     ui.label('页').classes('text-sm')
 
     # --- 数据加载逻辑 (核心修改点) ---
-    async def load_data(page: int = 1):
+    def apply_page(result: dict, target_page: int) -> None:
+        """把一页数据写入表格与分页器；与当前展示一致时不产生任何更新"""
+        page_size = LAYOUT_CONFIG.get('PAGE_SIZE', 15)
+        
+        # 3. 处理索引序号
+        index_base = (target_page - 1) * page_size + 1
+        for i, row in enumerate(result['rows']):
+            row['index_id'] = index_base + i
+        
+        # 4. 更新 UI：按 id 对比，只发送新增 / 变化的行，数据未变化时不发送
+        patch_table_rows(table, result['rows'], index_field='index_id', index_base=index_base)
+        total_label.text = f"DATABASE TOTAL: {result['total']} RECORDS"
+        
+        # 5. 使用 utils 里的计算函数，计算最大页码（未变化时不赋值，避免重发分页器）
+        max_page = calculate_max_page(result['total'], page_size)
+        if pagination.max != max_page:
+            pagination.max = max_page
+
+    async def load_data(page: int = 1, jump: bool = False):
         # 1. 使用 utils 里的锁，取代 nonlocal loading_lock
         if not loader.try_lock():
             return
 
         try:
             target_page = int(page)
-            table.props('loading')
-            
-            # 2. 异步获取数据
-            result = await asyncio.get_event_loop().run_in_executor(
-                None, lambda: get_cleaned_data(page=target_page, status=status)
-            )
+            set_client_prop(table, 'loading', True)
             
-            page_size = LAYOUT_CONFIG.get('PAGE_SIZE', 15)
+            # 2. 异步获取数据（原生 async I/O，无线程切换）
+            # 翻页优先复用已记住的页面游标（游标模式下开销与页码无关）；页码跳转固定走偏移分页
+            # 有筛选条件时在列式内存缓存上过滤，不访问上游
+            with profiler.waiting('page_data', table.client):
+                if any(filters.values()):
+                    result = filter_records(page=target_page, status=status, **filters)
+                else:
+                    result = await get_cleaned_data_async(page=target_page, status=status, use_cursor=not jump)
             
-            # 3. 处理索引序号
-            for i, row in enumerate(result['rows']):
-                row['index_id'] = (target_page - 1) * page_size + i + 1
-            
-            # 4. 更新 UI
-            table.rows[:] = result['rows']
-            total_label.text = f"DATABASE TOTAL: {result['total']} RECORDS"
-            
-            # 5. 使用 utils 里的计算函数，计算最大页码
-            pagination.max = calculate_max_page(result['total'], page_size)
+            apply_page(result, target_page)
+            profiler.first_update('q-table', table.client)
             
             if pagination.value != target_page:
                 pagination.value = target_page 
-            
-            table.update()
+
+            # 6. 后台预取相邻页（N+1 / N-1），翻页时直接命中分页缓存
+            if CACHE_CONFIG.get('PREFETCH_PAGES', True) and not any(filters.values()):
+                neighbours = [p for p in (target_page + 1, target_page - 1) if 1 <= p <= pagination.max]
+                background_tasks.create(prefetch_pages(neighbours, status=status), name='prefetch_pages')
         except Exception as e:
             logging.error(f"Load data error: {e}")
             ui.notify('数据加载失败', type='negative')
         finally: 
-            table.props(remove='loading')
-            # 6. 使用 utils 释放锁
+            set_client_prop(table, 'loading', False)
+            # 7. 使用 utils 释放锁
             loader.release()
 
     # --- 事件绑定 ---
+    filters = bind_filters(filter_button, filter_menu, on_change=lambda: load_data(page=1))
     pagination.on('update:modelValue', lambda e: load_data(page=e.args))
+    bind_search(search_input, table, total_label, pager_row, status, on_clear=lambda: load_data(page=pagination.value))
     
     # 优化跳转逻辑：回车触发跳转
-    jump_input.on('keydown.enter', lambda: load_data(page=int(jump_input.value)))
+    jump_input.on('keydown.enter', lambda: load_data(page=int(jump_input.value), jump=True))
     
+    async def refresh_current_page():
+        # 检索结果展示期间（分页器隐藏）或正在加载时跳过本轮
+        if not pager_row.visible or not loader.try_lock():
+            return
+        try:
+            page = pagination.value
+            if any(filters.values()):
+                apply_page(filter_records(page=page, status=status, **filters), page)
+            else:
+                apply_page(await refresh_page_async(page=page, status=status), page)
+        except Exception as e:
+            logging.error(f"Auto refresh error: {e}")
+        finally:
+            loader.release()
+
+    bind_auto_refresh(refresh_select, refresh_current_page)
+
     # 初始加载
-    ui.timer(0.1, lambda: load_data(page=1), once=True)
\ No newline at end of file
+    ui.timer(0.1, lambda: load_data(page=1), once=True)
+
+def bind_filters(filter_button: ui.button, filter_menu: ui.menu, on_change) -> dict:
+    """
+    为“筛选”按钮绑定按创建日期范围与创建人过滤的面板；过滤在列式内存缓存上完成，缓存不可用时隐藏按钮。
+    出参：当前筛选条件 {'start', 'end', 'creator'}（filter_records 的关键字参数，结束日期已换算为次日零点）；
+          条件变化时调用 on_change 重新加载第 1 页。
+    """
+    filters = {'start': None, 'end': None, 'creator': None}
+    options = get_filter_options()
+    filter_button.set_visibility(options['available'])
+    if not options['available']:
+        return filters
+
+    async def apply() -> None:
+        filters['start'] = start_input.value or None
+        filters['end'] = (date.fromisoformat(end_input.value) + timedelta(days=1)).isoformat() if end_input.value else None
+        filters['creator'] = creator_select.value or None
+        filter_button.text = '筛选（已启用）' if any(filters.values()) else '筛选'
+        await on_change()
+
+    async def clear() -> None:
+        start_input.value = end_input.value = creator_select.value = None
+        await apply()
+
+    with filter_menu, ui.column().classes('p-4 gap-3 w-72'):
+        start_input = ui.input('创建日期（起）').props('type=date outlined dense stack-label').classes('w-full')
+        end_input = ui.input('创建日期（止）').props('type=date outlined dense stack-label').classes('w-full')
+        creator_select = ui.select(options['creators'], label='创建人', with_input=True, clearable=True) \
+            .props('outlined dense options-dense').classes('w-full')
+        with ui.row().classes('w-full justify-end gap-2'):
+            ui.button('清除', on_click=clear).props('flat').classes('text-slate-500')
+            ui.button('应用', on_click=apply).props('unelevated').classes('bg-blue-600 text-white')
+    return filters
+
+def bind_auto_refresh(refresh_select: ui.select, refresh) -> None:
+    """
+    为详情页绑定可选的自动刷新（默认关闭）：
+    - 按所选周期调用 refresh 重新确认当前页，数据未变化时页面不产生任何更新；
+    - 标签页处于后台时每轮刷新后周期乘以 HIDDEN_BACKOFF（上限 MAX_HIDDEN_INTERVAL），
+      回到前台时恢复原周期，已到期则在 1 秒内刷新。
+    """
+    backoff = AUTO_REFRESH_CONFIG.get('HIDDEN_BACKOFF', 2)
+    max_hidden = AUTO_REFRESH_CONFIG.get('MAX_HIDDEN_INTERVAL', 600)
+    state = {'interval': 0, 'delay': 0, 'hidden': False, 'last': time.monotonic()}
+
+    async def tick() -> None:
+        if not state['interval'] or time.monotonic() - state['last'] < state['delay']:
+            return
+        state['last'] = time.monotonic()
+        if state['hidden']:
+            state['delay'] = min(state['delay'] * backoff, max(max_hidden, state['interval']))
+        await refresh()
+
+    def on_interval_change(e) -> None:
+        state['interval'] = state['delay'] = e.value or 0
+        state['last'] = time.monotonic()
+        timer.active = bool(state['interval'])
+
+    def on_visibility(e) -> None:
+        state['hidden'] = bool(e.args)
+        if not state['hidden']:
+            state['delay'] = state['interval']
+
+    # 固定 1 秒的轻量检查：周期变更与前后台切换立即生效；关闭时计时器不运行
+    timer = ui.timer(1.0, tick, active=False)
+    refresh_select.on_value_change(on_interval_change)
+    ui.add_head_html("<script>document.addEventListener('visibilitychange', "
+                     "() => emitEvent('details_visibility', document.hidden));</script>")
+    ui.on('details_visibility', on_visibility)
+
+def bind_virtual_scroll(table: ui.table, total_label: ui.label, window_label: ui.label, status: str = None) -> None:
+    """
+    为虚拟滚动模式绑定按需加载逻辑：
+    - 向下滚动接近已加载末尾时，通过 get_cleaned_window_async(skip, limit) 追加下一窗口；
+    - 窗口超过上限时丢弃头部，向上滚回头部时再补回前一窗口；
+    - 所有行变更都以增量方式推送到浏览器。
+    """
+    loader = AsyncDataLoader()
+    window = VirtualRowWindow(
+        window_size=LAYOUT_CONFIG.get('VIRTUAL_WINDOW', 100),
+        max_rows=LAYOUT_CONFIG.get('VIRTUAL_MAX_ROWS', 1000)
+    )
+    threshold = window.window_size // 4
+
+    async def fetch_window(skip: int, limit: int) -> list:
+        result = await get_cleaned_window_async(skip=skip, limit=limit, status=status)
+        window.total = result['total']
+        for i, row in enumerate(result['rows']):
+            row['index_id'] = skip + i + 1
+        total_label.text = f"DATABASE TOTAL: {result['total']} RECORDS"
+        return result['rows']
+
+    def refresh_window_label() -> None:
+        if window.total:
+            window_label.text = f"已加载 {window.offset + 1} - {window.loaded_end(len(table.rows))} / {window.total} 条"
+
+    async def load_forward(view_index: int = 0) -> None:
+        rows = await fetch_window(window.loaded_end(len(table.rows)), window.window_size)
+        push_table_rows(table, rows)
+        overflow = len(table.rows) - window.max_rows
+        if overflow > 0:
+            drop_table_rows(table, overflow, from_start=True)
+            window.offset += overflow
+            # 头部被丢弃后重新定位视口，避免可视内容跳动
+            table.run_method('scrollTo', max(0, view_index - overflow))
+
+    async def load_backward(view_index: int = 0) -> None:
+        count = min(window.window_size, window.offset)
+        rows = await fetch_window(window.offset - count, count)
+        push_table_rows(table, rows, prepend=True)
+        window.offset -= len(rows)
+        overflow = len(table.rows) - window.max_rows
+        if overflow > 0:
+            drop_table_rows(table, overflow, from_start=False)
+        table.run_method('scrollTo', view_index + len(rows))
+
+    async def on_virtual_scroll(e) -> None:
+        if not loader.try_lock():
+            return
+        try:
+            index, to = e.args.get('index', 0), e.args.get('to', 0)
+            if e.args.get('direction') == 'increase':
+                if to >= len(table.rows) - threshold and window.has_more(len(table.rows)):
+                    await load_forward(index)
+            elif index <= threshold and window.offset > 0:
+                await load_backward(index)
+            refresh_window_label()
+        except Exception as ex:
+            logging.error(f"Virtual scroll load error: {ex}")
+            ui.notify('数据加载失败', type='negative')
+        finally:
+            loader.release()
+
+    async def load_initial() -> None:
+        if not loader.try_lock():
+            return
+        try:
+            # 首屏直接整表下发一次，此后只推送增量
+            table.rows[:] = await fetch_window(0, window.window_size)
+            table.update()
+            refresh_window_label()
+        except Exception as ex:
+            logging.error(f"Load data error: {ex}")
+            ui.notify('数据加载失败', type='negative')
+        finally:
+            loader.release()
+
+    table.on('virtual-scroll', on_virtual_scroll, args=['index', 'to', 'direction'], throttle=0.2)
+    ui.timer(0.1, load_initial, once=True)
+
+
+def bind_export(export_button: ui.button, export_menu: ui.menu, export_progress: ui.linear_progress, status: str = None) -> None:
+    """
+    为“导出 Excel”按钮绑定导出菜单：导出当前状态过滤下的全部记录（XLSX / CSV），
+    导出过程中显示进度，完成后触发浏览器下载。
+    """
+    exporter = AsyncDataLoader()
+
+    async def handle_export(fmt: str) -> None:
+        if not exporter.try_lock():
+            ui.notify('导出任务进行中，请稍候', type='warning')
+            return
+
+        def on_progress(written: int, total: int) -> None:
+            export_progress.value = round(written / total, 3) if total else 1
+            export_button.text = f'导出中 {written}/{total}'
+
+        export_progress.value = 0
+        export_progress.set_visibility(True)
+        export_button.disable()
+        try:
+            path = await export_records(status=status, fmt=fmt, on_progress=on_progress)
+            ui.download.file(path, build_export_filename(status, fmt), EXPORT_WRITERS[fmt].media_type)
+        except Exception as e:
+            logging.error(f"Export error: {e}")
+            ui.notify('导出失败，请稍后重试', type='negative')
+        finally:
+            export_progress.set_visibility(False)
+            export_button.text = '导出 Excel'
+            export_button.enable()
+            exporter.release()
+
+    with export_menu:
+        ui.menu_item('Excel 文件 (.xlsx)', lambda: handle_export('xlsx'))
+        ui.menu_item('CSV 文件 (.csv)', lambda: handle_export('csv'))
+
+
+def bind_search(search_input: ui.input, table: ui.table, total_label: ui.label, pager_row: ui.row,
+                status: str = None, on_clear=None) -> None:
+    """
+    为“检索词条”输入框绑定边输边搜：输入经客户端防抖后触发检索，结果直接替换表格行；
+    清空输入时恢复分页并调用 on_clear 重新加载当前页。过期的检索结果会被丢弃。
+    """
+    search_input.props(f"debounce={LAYOUT_CONFIG.get('SEARCH_DEBOUNCE_MS', 300)} clearable")
+    state = {'seq': 0}
+
+    async def run_search(e) -> None:
+        query = (e.value or '').strip()
+        state['seq'] += 1
+        seq = state['seq']
+
+        if not query:
+            pager_row.set_visibility(True)
+            if on_clear:
+                await on_clear()
+            return
+
+        try:
+            result = await search_records_async(query, status=status, limit=LAYOUT_CONFIG.get('SEARCH_LIMIT', 50))
+        except Exception as ex:
+            logging.error(f"Search error: {ex}")
+            ui.notify('检索失败', type='negative')
+            return
+        if seq != state['seq']:
+            return  # 已有更新的输入，丢弃过期结果
+
+        for i, row in enumerate(result['rows']):
+            row['index_id'] = i + 1
+        patch_table_rows(table, result['rows'], index_field='index_id')
+        pager_row.set_visibility(False)
+        total_label.text = f"SEARCH RESULTS: {result['total']} RECORDS"
+
+    search_input.on_value_change(run_search)
@@ -0,0 +1,229 @@
+"""
+数据路径基准：在本地桩后端上测量统计、分页、导出在不同并发度下的吞吐与延迟，并输出机器可读的 JSON 报告。
+
+场景：
+    - stats_sync        fetch_resolutions_stats（线程池并发，对应同步脚本路径）
+    - stats_async       fetch_resolutions_stats_async（协程并发，对应页面路径）
+    - paging_sync       get_cleaned_data 随机翻页
+    - paging_async      get_cleaned_data_async 随机翻页（绕过分页缓存，测上游 + 清洗）
+    - paging_cached     get_cleaned_data_async 随机翻页（启用分页缓存与请求合并）
+    - export            export_records 导出全部记录为 CSV，并发度即分块并发数 EXPORT_CONFIG['CONCURRENCY']
+
+运行方式（仓库根目录）：
+    python -m benchmarks.bench_data_path --size 20000 --latency-ms 20 --error-rate 0 \
+        --concurrency 1,8,32 --requests 200 --output bench_report.json
+
+说明：
+    - 错误率大于 0 时会触发 backend_api 的指数退避重试（1s, 2s, 4s），延迟分位数会明显上升，这正是需要观察的行为。
+    - 默认桩后端与被测代码同进程（共享 GIL），高并发下会抬高被测延迟；对比版本间差异时可先在另一个终端运行
+      python -m benchmarks.stub_backend，再以 --backend-url 指向它（此时报告中不含上游请求计数）。
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List
+
+from app.config.constants import BACKEND_CONFIG, EXPORT_CONFIG, LAYOUT_CONFIG
+from app.services import backend_api, data_service
+from app.services.export_service import export_records
+from app.services.resilience import CircuitBreaker
+from benchmarks.stub_backend import StubBackend
+
+SCENARIOS = ('stats_sync', 'stats_async', 'paging_sync', 'paging_async', 'paging_cached', 'export')
+
+
+def _reset_state() -> None:
+    """每个场景前清空进程内缓存与熔断状态，避免场景之间互相影响"""
+    data_service._stats_cache.invalidate()
+    data_service._page_cache.invalidate()
+    data_service._page_totals.clear()
+    backend_api._grouped_counts_supported = None
+    backend_api._breaker = CircuitBreaker(
+        failure_threshold=BACKEND_CONFIG.get('BREAKER_FAILURE_THRESHOLD', 5),
+        recovery_timeout=BACKEND_CONFIG.get('BREAKER_RECOVERY_TIMEOUT', 30)
+    )
+
+
+def _summarize(latencies: List[float], wall: float, units: int) -> Dict[str, Any]:
+    ordered = sorted(latencies)
+
+    def pct(ratio: float) -> float:
+        return round(ordered[min(len(ordered) - 1, int(len(ordered) * ratio))] * 1000, 3)
+
+    return {
+        'operations': len(latencies),
+        'wall_s': round(wall, 4),
+        'throughput_ops_s': round(len(latencies) / wall, 2) if wall else None,
+        'throughput_units_s': round(units / wall, 2) if wall else None,
+        'latency_ms': {
+            'mean': round(statistics.fmean(ordered) * 1000, 3),
+            'p50': pct(0.50), 'p95': pct(0.95), 'p99': pct(0.99),
+            'max': round(ordered[-1] * 1000, 3),
+        },
+    }
+
+
+def _run_sync(call: Callable[[], int], concurrency: int, requests: int) -> Dict[str, Any]:
+    latencies: List[float] = []
+
+    def timed() -> int:
+        started = time.perf_counter()
+        units = call()
+        latencies.append(time.perf_counter() - started)
+        return units
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        units = sum(executor.map(lambda _: timed(), range(requests)))
+    return _summarize(latencies, time.perf_counter() - started, units)
+
+
+def _run_async(call: Callable[[], Awaitable[int]], concurrency: int, requests: int) -> Dict[str, Any]:
+    async def main() -> Dict[str, Any]:
+        latencies: List[float] = []
+        queue = iter(range(requests))
+        units = 0
+
+        async def worker() -> None:
+            nonlocal units
+            for _ in queue:
+                started = time.perf_counter()
+                count = await call()
+                units += count
+                latencies.append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        try:
+            await asyncio.gather(*(worker() for _ in range(concurrency)))
+        finally:
+            # 共享 AsyncClient 绑定在当前事件循环上，场景结束时关闭
+            await backend_api.close_async_client()
+        return _summarize(latencies, time.perf_counter() - started, units)
+
+    return asyncio.run(main())
+
+
+def run_scenario(name: str, concurrency: int, requests: int, max_page: int, rng: random.Random) -> Dict[str, Any]:
+    """运行单个场景，返回 _summarize 的结果；units 为记录数（分页 / 导出）或状态数（统计）"""
+    def random_page() -> int:
+        return rng.randint(1, max_page)
+
+    if name == 'stats_sync':
+        return _run_sync(lambda: len(backend_api.fetch_resolutions_stats()), concurrency, requests)
+    if name == 'stats_async':
+        async def stats() -> int:
+            return len(await backend_api.fetch_resolutions_stats_async())
+        return _run_async(stats, concurrency, requests)
+    if name == 'paging_sync':
+        return _run_sync(lambda: len(data_service.get_cleaned_data(page=random_page())['rows']), concurrency, requests)
+    if name in ('paging_async', 'paging_cached'):
+        use_cache = name == 'paging_cached'
+
+        async def page() -> int:
+            result = await data_service.get_cleaned_data_async(page=random_page(), use_cache=use_cache)
+            return len(result['rows'])
+        return _run_async(page, concurrency, requests)
+    if name == 'export':
+        EXPORT_CONFIG['CONCURRENCY'] = concurrency
+
+        async def export() -> int:
+            path = await export_records(fmt='csv')
+            with open(path, encoding='utf-8-sig') as f:
+                rows = sum(1 for _ in f) - 1
+            path.unlink(missing_ok=True)
+            return rows
+        # 导出本身就是批处理，每个并发度只跑少量完整导出
+        return _run_async(export, 1, max(1, min(requests, 3)))
+    raise ValueError(f'未知场景: {name}')
+
+
+def _git_revision() -> str:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except Exception:
+        return 'unknown'
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='数据路径基准（本地桩后端）')
+    parser.add_argument('--size', type=int, default=20_000, help='桩后端记录数（使用 --backend-url 时用于确定随机页码范围）')
+    parser.add_argument('--latency-ms', type=float, default=20, help='每个上游请求的固定延迟（毫秒）')
+    parser.add_argument('--jitter-ms', type=float, default=0, help='叠加的随机延迟上限（毫秒）')
+    parser.add_argument('--error-rate', type=float, default=0, help='上游返回 503 的概率')
+    parser.add_argument('--concurrency', default='1,8,32', help='逗号分隔的并发度')
+    parser.add_argument('--requests', type=int, default=200, help='每个 (场景, 并发度) 的操作次数')
+    parser.add_argument('--scenarios', default=','.join(SCENARIOS), help='逗号分隔的场景名')
+    parser.add_argument('--backend-url', default='', help='使用已运行的外部桩后端（完整的 resolutions 地址）')
+    parser.add_argument('--output', default='bench_report.json', help='JSON 报告路径')
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.WARNING)
+    levels = [int(level) for level in args.concurrency.split(',')]
+    scenarios = [name for name in args.scenarios.split(',') if name]
+    stub = None if args.backend_url else StubBackend(args.size, args.latency_ms, args.jitter_ms, args.error_rate,
+                                                     seed=args.seed).start()
+    backend_api.API_BASE = args.backend_url or stub.base_url
+    backend_api.close_http_session()
+    max_page = max(1, -(-args.size // LAYOUT_CONFIG.get('PAGE_SIZE', 15)))
+    rng = random.Random(args.seed)
+
+    results = []
+    print(f"{'scenario':<14} | {'conc':>4} | {'ops/s':>9} | {'units/s':>10} | {'p50 ms':>8} | "
+          f"{'p95 ms':>8} | {'p99 ms':>8} | {'upstream':>8} | {'5xx':>5}")
+    print('-' * 100)
+    try:
+        for name in scenarios:
+            for level in levels:
+                _reset_state()
+                before = stub.counters() if stub else None
+                summary = run_scenario(name, level, args.requests, max_page, rng)
+                after = stub.counters() if stub else None
+                summary.update({
+                    'scenario': name, 'concurrency': level,
+                    'upstream_requests': after['requests'] - before['requests'] if stub else None,
+                    'upstream_errors': after['errors'] - before['errors'] if stub else None,
+                })
+                results.append(summary)
+                lat = summary['latency_ms']
+                print(f"{name:<14} | {level:>4} | {summary['throughput_ops_s']:>9} | {summary['throughput_units_s']:>10} | "
+                      f"{lat['p50']:>8} | {lat['p95']:>8} | {lat['p99']:>8} | "
+                      f"{str(summary['upstream_requests']):>8} | {str(summary['upstream_errors']):>5}")
+    finally:
+        backend_api.close_http_session()
+        if stub:
+            stub.stop()
+
+    report = {
+        'meta': {
+            'created_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'git_revision': _git_revision(),
+            'python': sys.version.split()[0],
+            'platform': platform.platform(),
+            'backend_url': args.backend_url or 'in-process stub',
+            'stub': {'size': args.size, 'latency_ms': args.latency_ms, 'jitter_ms': args.jitter_ms,
+                     'error_rate': args.error_rate},
+            'requests_per_level': args.requests,
+            'page_size': LAYOUT_CONFIG.get('PAGE_SIZE', 15),
+            'backend_config': {key: BACKEND_CONFIG.get(key) for key in ('POOL_SIZE', 'STATS_MODE', 'PAGINATION_MODE', 'HEDGE_ENABLED')},
+        },
+        'results': results,
+    }
+    Path(args.output).write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding='utf-8')
+    print(f'\nreport written to {args.output}')
+
+
+if __name__ == '__main__':
+    main()
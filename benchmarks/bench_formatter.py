@@ -0,0 +1,55 @@
+"""
+微基准：对比逐条格式化 (_format_data_item) 与批量格式化 (_format_data_items)。
+
+运行方式（仓库根目录）：
+    python -m benchmarks.bench_formatter
+"""
+
+import random
+import timeit
+
+from app.services.data_service import _format_data_item, _format_data_items
+
+SIZES = (15, 1_000, 100_000)
+REPEAT = 9
+STATUSES = ('published', 'draft', 'pending_review', 'rejected', 'unknown', None)
+
+
+def make_raw_items(count: int, seed: int = 42) -> list:
+    """生成贴近真实接口返回结构的原始记录，覆盖空值与异常取值分支"""
+    rng = random.Random(seed)
+    items = []
+    for i in range(count):
+        items.append({
+            'id': f'{rng.getrandbits(128):032x}' if i % 50 else None,
+            '_id': f'legacy-{i}',
+            'word': chr(0x4E00 + rng.randrange(20_000)),
+            'pronunciation': {'pinyin': f'py{i % 400}'} if i % 30 else (None if i % 60 else 'bad'),
+            'status': rng.choice(STATUSES),
+            'creator_id': f'{rng.getrandbits(64):016x}' if i % 20 else None,
+            'created_at': f'2025-{1 + i % 12:02d}-{1 + i % 28:02d}T{i % 24:02d}:{i % 60:02d}:00.123456' if i % 40 else None,
+            'review_comment': rng.choice(['string', None, '', '释义需补充', '已核对']),
+        })
+    return items
+
+
+def run() -> None:
+    print(f"{'rows':>8} | {'per-item (ms)':>14} | {'batch (ms)':>11} | {'speedup':>7}")
+    print('-' * 50)
+    for size in SIZES:
+        items = make_raw_items(size)
+        # 先校验行为完全一致
+        assert _format_data_items(items) == [_format_data_item(item) for item in items]
+
+        # 两种实现交替计时、取最小值，降低机器负载波动的影响
+        number = max(1, 200_000 // size)
+        per_item_runs, batch_runs = [], []
+        for _ in range(REPEAT):
+            per_item_runs.append(timeit.timeit(lambda: [_format_data_item(item) for item in items], number=number))
+            batch_runs.append(timeit.timeit(lambda: _format_data_items(items), number=number))
+        per_item, batch = min(per_item_runs) / number, min(batch_runs) / number
+        print(f'{size:>8} | {per_item * 1000:>14.3f} | {batch * 1000:>11.3f} | {per_item / batch:>6.2f}x')
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,51 @@
+"""
+微基准：对比标准库 json 与 orjson 在列表接口解码、表格增量行序列化两条路径上的耗时与字节数。
+
+运行方式（仓库根目录）：
+    python -m benchmarks.bench_json
+"""
+
+import json
+import timeit
+
+import orjson
+
+from app.services.data_service import _format_data_items
+from benchmarks.bench_formatter import make_raw_items
+
+SIZES = (15, 1_000, 10_000)
+REPEAT = 9
+
+
+def _best(stmt, number: int) -> float:
+    return min(timeit.timeit(stmt, number=number) for _ in range(REPEAT)) / number
+
+
+def run() -> None:
+    print(f"{'rows':>7} | {'stage':<9} | {'json (ms)':>10} | {'orjson (ms)':>11} | {'speedup':>7} | {'json KB':>8} | {'orjson KB':>9}")
+    print('-' * 80)
+    for size in SIZES:
+        raw = {'items': make_raw_items(size), 'total': size}
+        # 模拟后端响应体：标准库默认 ensure_ascii，中文以 \uXXXX 形式出现
+        body = json.dumps(raw).encode('utf-8')
+        assert orjson.loads(body) == json.loads(body)
+        number = max(1, 20_000 // size)
+
+        # 解码：response.json() 等价于 bytes -> str -> json.loads；_decode_json 直接 orjson.loads(bytes)
+        std = _best(lambda: json.loads(body.decode('utf-8')), number)
+        fast = _best(lambda: orjson.loads(body), number)
+        print(f"{size:>7} | {'decode':<9} | {std * 1000:>10.3f} | {fast * 1000:>11.3f} | {std / fast:>6.2f}x | "
+              f"{len(body) / 1024:>8.1f} | {len(body) / 1024:>9.1f}")
+
+        # 序列化：push_table_rows 把清洗后的行拼进 JS 指令
+        rows = _format_data_items(raw['items'])
+        std_text, fast_text = json.dumps(rows), orjson.dumps(rows).decode('utf-8')
+        assert json.loads(fast_text) == rows
+        std = _best(lambda: json.dumps(rows), number)
+        fast = _best(lambda: orjson.dumps(rows).decode('utf-8'), number)
+        print(f"{size:>7} | {'serialize':<9} | {std * 1000:>10.3f} | {fast * 1000:>11.3f} | {std / fast:>6.2f}x | "
+              f"{len(std_text.encode()) / 1024:>8.1f} | {len(fast_text.encode()) / 1024:>9.1f}")
+
+
+if __name__ == '__main__':
+    run()
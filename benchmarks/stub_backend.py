@@ -0,0 +1,202 @@
+"""
+本地桩后端：模拟 /api/v1/admin/dashboard/resolutions 列表接口与 /counts 分组计数接口，
+可配置数据量、固定延迟 / 抖动与错误率，供基准测试与 tests/ 下的用例在无外部依赖的情况下复现上游行为。
+
+单独运行（仓库根目录），例如把 backend_api.API_BASE 指向 http://127.0.0.1:6001/api/v1/admin/dashboard/resolutions：
+    python -m benchmarks.stub_backend --port 6001 --size 20000 --latency-ms 30 --error-rate 0.01
+"""
+
+import argparse
+import json
+import random
+import sys
+import threading
+import time
+import zlib
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+from urllib.parse import parse_qs, urlparse
+
+from benchmarks.bench_formatter import make_raw_items
+
+API_PATH = '/api/v1/admin/dashboard/resolutions'
+STATUSES = ('published', 'draft', 'pending_review', 'rejected')
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 256  # 默认 backlog 为 5，高并发建连时会丢 SYN 并触发 1s 重传
+
+    def handle_error(self, request, client_address) -> None:
+        # 客户端提前断开（如对冲请求取消了较慢的一次）属于正常情况，不打印堆栈
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)
+
+
+class StubBackend:
+    """
+    在后台线程中运行的桩后端。
+    :param size: 记录总数
+    :param latency_ms: 每个请求的固定延迟（毫秒）
+    :param jitter_ms: 在固定延迟之上叠加的随机延迟上限（毫秒）
+    :param error_rate: 返回 503 的概率（0~1）
+    :param port: 监听端口，0 表示随机分配
+    :param counts_status: /counts 的响应状态码：200 返回分组计数；404 模拟没有该路由；
+                          400/422 模拟 /resolutions/{id} 之类的路由把 counts 当作 id 解析失败
+    :param etag: 列表响应是否携带 ETag，并对匹配的 If-None-Match 返回 304
+    :param slow_every / slow_ms: 每 slow_every 个请求中的第一个额外延迟 slow_ms 毫秒（模拟长尾）
+    以上参数均为普通属性，运行中可直接修改；history 记录最近的请求 (path, query)。
+    """
+
+    def __init__(self, size: int = 10_000, latency_ms: float = 0, jitter_ms: float = 0,
+                 error_rate: float = 0, port: int = 0, seed: int = 42, counts_status: int = 200,
+                 etag: bool = False, slow_every: int = 0, slow_ms: float = 0):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.port = port
+        self.counts_status = counts_status
+        self.etag = etag
+        self.slow_every = slow_every
+        self.slow_ms = slow_ms
+        self.requests = 0
+        self.errors = 0
+        self.not_modified = 0
+        self.history = deque(maxlen=10_000)
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+
+        items = make_raw_items(size, seed=seed)
+        # 桩数据的状态只取业务定义的四种，保证按状态过滤与分组计数可复现
+        for i, item in enumerate(items):
+            item['status'] = STATUSES[i % len(STATUSES)]
+        # 与真实接口的默认顺序一致：按创建时间倒序，缺失创建时间的脏数据排在最后
+        items.sort(key=lambda item: item.get('created_at') or '', reverse=True)
+        self.items = items
+        self.by_status = {status: [item for item in items if item['status'] == status] for status in STATUSES}
+
+    @property
+    def base_url(self) -> str:
+        return f'http://127.0.0.1:{self.port}{API_PATH}'
+
+    def start(self) -> 'StubBackend':
+        self._server = _Server(('127.0.0.1', self.port), self._handler_class())
+        self.port = self._server.server_port
+        threading.Thread(target=self._server.serve_forever, name='stub-backend', daemon=True).start()
+        return self
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def counters(self) -> dict:
+        with self._lock:
+            return {'requests': self.requests, 'errors': self.errors, 'not_modified': self.not_modified}
+
+    def reset_counters(self) -> None:
+        with self._lock:
+            self.requests = self.errors = self.not_modified = 0
+            self.history.clear()
+
+    def insert(self, item: dict) -> None:
+        """在列表最前面插入一条记录（模拟新增）"""
+        self.items.insert(0, item)
+        self.by_status[item['status']].insert(0, item)
+
+    def remove(self, record_id: str) -> None:
+        self.items[:] = [item for item in self.items if item['id'] != record_id]
+        for items in self.by_status.values():
+            items[:] = [item for item in items if item['id'] != record_id]
+
+    def set_status(self, record_id: str, status: str) -> None:
+        """原地修改一条记录的状态（模拟审核）：全部列表中的位置不变，在新状态列表中按创建时间归位"""
+        item = next(item for item in self.items if item['id'] == record_id)
+        self.by_status[item['status']].remove(item)
+        item['status'] = status
+        self.by_status[status][:] = [other for other in self.items if other['status'] == status]
+
+    def _plan(self, path: str, query: dict) -> tuple:
+        """为单个请求抽取 (延迟秒数, 是否返回错误)，随机数生成器在线程间共享需加锁"""
+        with self._lock:
+            self.requests += 1
+            self.history.append((path, query))
+            delay = (self.latency_ms + self._rng.random() * self.jitter_ms) / 1000
+            if self.slow_every and (self.requests - 1) % self.slow_every == 0:
+                delay += self.slow_ms / 1000
+            failed = self._rng.random() < self.error_rate
+            if failed:
+                self.errors += 1
+        return delay, failed
+
+    def _respond(self, path: str, query: dict) -> tuple:
+        """返回 (状态码, 响应体)"""
+        if path.rstrip('/') == f'{API_PATH}/counts':
+            if self.counts_status != 200:
+                return self.counts_status, {'detail': 'counts is not a valid resolution id'}
+            return 200, {status: len(items) for status, items in self.by_status.items()}
+        if path.rstrip('/') != API_PATH:
+            return 404, None
+        items = self.by_status.get(query.get('status'), self.items)
+        search = query.get('search')
+        if search:
+            items = [item for item in items if search in item['word'] or search in str(item['pronunciation'])]
+        skip, limit = int(query.get('skip', 0)), int(query.get('limit', 15))
+        return 200, {'items': items[skip:skip + limit], 'total': len(items)}
+
+    def _handler_class(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'  # 支持 keep-alive，与真实后端一致复用连接
+            disable_nagle_algorithm = True  # 响应头与响应体分两次写出，避免 Nagle + 延迟确认带来的 40ms 停顿
+
+            def log_message(self, *args) -> None:
+                pass
+
+            def do_GET(self) -> None:
+                url = urlparse(self.path)
+                query = {k: v[0] for k, v in parse_qs(url.query).items()}
+                delay, failed = stub._plan(url.path, query)
+                if delay:
+                    time.sleep(delay)
+                status, body = (503, None) if failed else stub._respond(url.path, query)
+                payload = json.dumps(body).encode('utf-8') if body is not None else b''
+                etag = f'"{zlib.crc32(payload):08x}"' if stub.etag and status == 200 else None
+                if etag is not None and self.headers.get('If-None-Match') == etag:
+                    with stub._lock:
+                        stub.not_modified += 1
+                    status, payload = 304, b''
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                if etag is not None:
+                    self.send_header('ETag', etag)
+                self.send_header('Content-Length', str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+        return Handler
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='本地桩后端')
+    parser.add_argument('--port', type=int, default=6001)
+    parser.add_argument('--size', type=int, default=10_000)
+    parser.add_argument('--latency-ms', type=float, default=0)
+    parser.add_argument('--jitter-ms', type=float, default=0)
+    parser.add_argument('--error-rate', type=float, default=0)
+    args = parser.parse_args()
+
+    stub = StubBackend(args.size, args.latency_ms, args.jitter_ms, args.error_rate, args.port).start()
+    print(f'stub backend listening on {stub.base_url} ({args.size} records)')
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        stub.stop()
+
+
+if __name__ == '__main__':
+    main()
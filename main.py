@@ -1,12 +1,38 @@
-from nicegui import ui
+from nicegui import app, ui
+from app.config.constants import MULTIWORKER_CONFIG
 from app.routes.main import init_routes
+from app.services.backend_api import close_http_session, close_async_client
+from app.services.live_stats import stats_hub
+from app.services.data_service import start_mirror_sync, stop_mirror_sync, close_shared_cache
 
 # 1. 注册路由
 init_routes()
 
-# 2. 启动服务（确保不要在 ui.run 里乱填图标名）
-ui.run(
-    title='师道汉韵管理后台',
-    port=8080,
-    show=True
-)
\ No newline at end of file
+# 2. 注册生命周期钩子：启动应用级统计聚合器与本地镜像同步；退出时停止后台任务并释放共享连接池
+app.on_startup(stats_hub.start)
+app.on_startup(start_mirror_sync)
+app.on_shutdown(stats_hub.stop)
+app.on_shutdown(stop_mirror_sync)
+app.on_shutdown(close_http_session)
+app.on_shutdown(close_async_client)
+app.on_shutdown(close_shared_cache)
+
+# 3. 启动服务（确保不要在 ui.run 里乱填图标名）
+worker_port = MULTIWORKER_CONFIG['WORKER_PORT']
+if worker_port:
+    # 由 multiworker.py 启动的 worker：只监听本机端口，由主进程代理对外流量
+    from multiworker import install_worker_cookie
+    install_worker_cookie(MULTIWORKER_CONFIG['WORKER_INDEX'])
+    ui.run(
+        title='师道汉韵管理后台',
+        host='127.0.0.1',
+        port=worker_port,
+        show=False,
+        reload=False
+    )
+else:
+    ui.run(
+        title='师道汉韵管理后台',
+        port=8080,
+        show=True
+    )
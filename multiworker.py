@@ -0,0 +1,220 @@
+"""
+文件职责：
+    多进程部署启动器 (multiworker.py)。
+    在同一个对外端口后运行多个 NiceGUI / uvicorn worker 进程，每个 worker 绑定一个 CPU 核，
+    并由主进程提供粘性会话代理与跨进程共享缓存。
+核心功能：
+    - 启动 SharedCacheServer（Unix socket），各 worker 的状态统计、分页缓存与主导 worker 发布的汇总结果经它共享。
+    - 以子进程方式运行 main.py：worker i 监听 127.0.0.1:(WORKER_BASE_PORT + i)，启动后绑定到第 i 个可用核；
+      worker 异常退出时自动重启。
+    - 粘性会话代理：读取每个连接的首个请求头，按 STICKY_COOKIE 转发到对应 worker，
+      无 Cookie 时按客户端 IP 哈希选择；之后该连接（含 websocket 升级）原样双向转发。
+    - install_worker_cookie：worker 侧中间件，把本 worker 编号写入 Cookie，保证同一浏览器的页面请求、
+      socket.io 轮询与 websocket 始终落在创建该页面的 worker 上（NiceGUI 的页面状态只存在于该进程内）。
+运行方式（仓库根目录）：
+    python multiworker.py --workers 4 --port 8080
+说明：
+    - 汇总统计的全量遍历与增量追平、列式缓存与镜像同步只在编号 0 的 worker（主导 worker）上运行，
+      按创建人分布与趋势折线经共享缓存发布给其余 worker；列式缓存只在主导 worker 内存中，其余 worker 不提供筛选面板。
+    - 启用镜像时各 worker 共用同一个 SQLite 文件（WAL 模式支持多进程读）：主导 worker 写入，其余 worker 只读并定期重新读取同步状态。
+    - 代理按 TCP 连接粘性转发，不解析同一连接上的后续请求；浏览器在首个响应后即携带 Cookie，两者选择的 worker 一致。
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import shutil
+import signal
+import sys
+import tempfile
+import zlib
+from http.cookies import SimpleCookie
+from pathlib import Path
+from typing import List, Optional
+
+from app.config.constants import MULTIWORKER_CONFIG
+from app.services.shared_cache import SharedCacheServer
+
+logger = logging.getLogger('multiworker')
+
+# 首个请求头的长度上限（字节）
+_HEAD_LIMIT = 64 * 1024
+_UNAVAILABLE = (b'HTTP/1.1 503 Service Unavailable\r\nContent-Type: text/plain; charset=utf-8\r\n'
+                b'Content-Length: 22\r\nConnection: close\r\n\r\nworker is starting up\n')
+
+
+def install_worker_cookie(index: str) -> None:
+    """
+    功能：在 worker 进程中注册 HTTP 中间件，请求未携带本 worker 编号的 Cookie 时在响应中写入。
+    说明：由 main.py 在多进程模式下调用；nicegui 在此处才导入，启动器本身不加载 UI 框架。
+    """
+    from nicegui import app
+
+    cookie_name = MULTIWORKER_CONFIG['STICKY_COOKIE']
+
+    @app.middleware('http')
+    async def sticky_worker_cookie(request, call_next):
+        response = await call_next(request)
+        if request.cookies.get(cookie_name) != index:
+            response.set_cookie(cookie_name, index, httponly=True, samesite='lax')
+        return response
+
+
+def _sticky_index(head: bytes, peer: Optional[tuple], workers: int) -> int:
+    """从请求头的 Cookie 取 worker 编号；缺失或越界时按客户端 IP 哈希"""
+    cookie_name = MULTIWORKER_CONFIG['STICKY_COOKIE']
+    for line in head.split(b'\r\n')[1:]:
+        name, _, value = line.partition(b':')
+        if name.strip().lower() != b'cookie':
+            continue
+        try:
+            morsel = SimpleCookie(value.decode('latin-1')).get(cookie_name)
+        except Exception:
+            morsel = None
+        if morsel is not None and morsel.value.isdigit() and int(morsel.value) < workers:
+            return int(morsel.value)
+    host = peer[0] if peer else ''
+    return zlib.crc32(host.encode('utf-8')) % workers
+
+
+async def _pipe(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    try:
+        while True:
+            data = await reader.read(64 * 1024)
+            if not data:
+                break
+            writer.write(data)
+            await writer.drain()
+    except (ConnectionError, asyncio.CancelledError):
+        pass
+    finally:
+        try:
+            writer.close()
+        except Exception:
+            pass
+
+
+class Launcher:
+    """
+    主进程：共享缓存服务 + worker 进程监管 + 粘性会话代理。
+    :param workers: worker 数量
+    :param host / port: 对外监听地址与端口
+    """
+
+    def __init__(self, workers: int, host: str, port: int):
+        self.workers = workers
+        self.host = host
+        self.port = port
+        self.base_port = MULTIWORKER_CONFIG['WORKER_BASE_PORT']
+        self.cores = self._available_cores()
+        self.socket_dir = tempfile.mkdtemp(prefix='dashboard-')
+        self.cache = SharedCacheServer(str(Path(self.socket_dir) / 'shared_cache.sock'),
+                                       MULTIWORKER_CONFIG['SHARED_CACHE_SIZE'])
+        self._processes: List[Optional[asyncio.subprocess.Process]] = [None] * workers
+        self._stopping = asyncio.Event()
+
+    @staticmethod
+    def _available_cores() -> List[int]:
+        if not MULTIWORKER_CONFIG['PIN_CORES'] or not hasattr(os, 'sched_setaffinity'):
+            return []
+        return sorted(os.sched_getaffinity(0))
+
+    async def run(self) -> None:
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, self._stopping.set)
+
+        await self.cache.start()
+        proxy = await asyncio.start_server(self._handle, self.host, self.port, limit=_HEAD_LIMIT)
+        supervisors = [asyncio.create_task(self._supervise(i)) for i in range(self.workers)]
+        logger.info(f"多进程模式：{self.workers} 个 worker，对外地址 http://{self.host}:{self.port}")
+        try:
+            await self._stopping.wait()
+        finally:
+            proxy.close()
+            for task in supervisors:
+                task.cancel()
+            await asyncio.gather(*supervisors, return_exceptions=True)
+            await self._terminate_all()
+            await self.cache.stop()
+            shutil.rmtree(self.socket_dir, ignore_errors=True)
+
+    async def _spawn(self, index: int) -> asyncio.subprocess.Process:
+        env = dict(os.environ,
+                   DASHBOARD_WORKER_INDEX=str(index),
+                   DASHBOARD_WORKER_PORT=str(self.base_port + index),
+                   DASHBOARD_SHARED_CACHE=self.cache.path)
+        main_py = str(Path(__file__).resolve().parent / 'main.py')
+        process = await asyncio.create_subprocess_exec(sys.executable, main_py, env=env)
+        if self.cores:
+            core = self.cores[index % len(self.cores)]
+            try:
+                os.sched_setaffinity(process.pid, {core})
+            except OSError as e:
+                logger.warning(f"worker {index} 绑定 CPU {core} 失败: {e}")
+        logger.info(f"worker {index} 已启动：pid={process.pid}, port={self.base_port + index}")
+        return process
+
+    async def _supervise(self, index: int) -> None:
+        """运行 worker 并在其退出后重启（启动即失败时退避，避免空转）"""
+        delay = 1.0
+        while not self._stopping.is_set():
+            started = asyncio.get_running_loop().time()
+            self._processes[index] = await self._spawn(index)
+            code = await self._processes[index].wait()
+            if self._stopping.is_set():
+                break
+            delay = 1.0 if asyncio.get_running_loop().time() - started > 30 else min(delay * 2, 30.0)
+            logger.error(f"worker {index} 退出（code={code}），{delay:.0f}s 后重启")
+            await asyncio.sleep(delay)
+
+    async def _terminate_all(self) -> None:
+        running = [p for p in self._processes if p is not None and p.returncode is None]
+        for process in running:
+            process.terminate()
+        try:
+            await asyncio.wait_for(asyncio.gather(*(p.wait() for p in running)), 10)
+        except asyncio.TimeoutError:
+            for process in running:
+                if process.returncode is None:
+                    process.kill()
+
+    async def _handle(self, client_reader: asyncio.StreamReader, client_writer: asyncio.StreamWriter) -> None:
+        try:
+            head = await client_reader.readuntil(b'\r\n\r\n')
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+            client_writer.close()
+            return
+
+        index = _sticky_index(head, client_writer.get_extra_info('peername'), self.workers)
+        try:
+            upstream_reader, upstream_writer = await asyncio.open_connection('127.0.0.1', self.base_port + index)
+        except OSError:
+            client_writer.write(_UNAVAILABLE)
+            try:
+                await client_writer.drain()
+            finally:
+                client_writer.close()
+            return
+
+        upstream_writer.write(head)
+        await asyncio.gather(_pipe(client_reader, upstream_writer), _pipe(upstream_reader, client_writer))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='以多进程模式运行管理后台')
+    parser.add_argument('--workers', type=int, default=MULTIWORKER_CONFIG['WORKERS'],
+                        help='worker 进程数，0 表示等于可用 CPU 核数')
+    parser.add_argument('--host', default=MULTIWORKER_CONFIG['HOST'])
+    parser.add_argument('--port', type=int, default=MULTIWORKER_CONFIG['PORT'])
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(name)s %(levelname)s %(message)s')
+    cpu_count = len(os.sched_getaffinity(0)) if hasattr(os, 'sched_getaffinity') else (os.cpu_count() or 1)
+    workers = args.workers if args.workers > 0 else cpu_count
+    asyncio.run(Launcher(workers, args.host, args.port).run())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,109 @@
+"""
+测试公共夹具：在本地桩后端 (benchmarks/stub_backend.py) 上运行各服务模块，
+每个用例开始前复位熔断器、能力探测结果与各级缓存，结束后还原桩后端的故障注入参数。
+"""
+
+import json
+import shutil
+import subprocess
+
+import pytest
+
+from app.config.constants import BACKEND_CONFIG, SUMMARY_CONFIG, TREND_CONFIG
+from app.services import backend_api, data_service
+from app.services.resilience import CircuitBreaker
+from app.services.summary_stats import SummaryAggregator
+from benchmarks.stub_backend import StubBackend
+
+# 用例可以修改的桩后端参数，结束后统一还原
+_STUB_SETTINGS = ('latency_ms', 'jitter_ms', 'error_rate', 'counts_status', 'etag', 'slow_every', 'slow_ms')
+
+
+@pytest.fixture(scope='session')
+def stub_server():
+    server = StubBackend(size=600).start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+async def stub(stub_server, monkeypatch):
+    settings = {name: getattr(stub_server, name) for name in _STUB_SETTINGS}
+    stub_server.reset_counters()
+
+    monkeypatch.setattr(backend_api, 'API_BASE', stub_server.base_url)
+    monkeypatch.setattr(backend_api, 'RETRY_BACKOFF_FACTOR', 0.01)
+    monkeypatch.setattr(backend_api, '_breaker', CircuitBreaker(
+        failure_threshold=BACKEND_CONFIG.get('BREAKER_FAILURE_THRESHOLD', 5),
+        recovery_timeout=BACKEND_CONFIG.get('BREAKER_RECOVERY_TIMEOUT', 30)
+    ))
+    monkeypatch.setattr(backend_api, '_grouped_counts_supported', None)
+    monkeypatch.setattr(backend_api, '_etag_supported', None)
+    monkeypatch.setattr(backend_api, '_async_client', None)
+    monkeypatch.setattr(data_service, '_backend_search_strikes', 0)
+    monkeypatch.setattr(data_service, '_backend_search_demoted_until', 0.0)
+    backend_api._list_etags.invalidate()
+    data_service._stats_cache.invalidate()
+    data_service._page_cache.invalidate()
+    data_service._page_cursors.invalidate()
+    data_service._page_totals.clear()
+    data_service._search_index.clear()
+
+    yield stub_server
+
+    await backend_api.close_async_client()
+    for name, value in settings.items():
+        setattr(stub_server, name, value)
+
+
+class TableJSRecorder:
+    """
+    记录发往浏览器、修改某张表格 rows 的 JS（push / splice / 增量 patch），并在 node 中对快照重放，
+    得到浏览器端执行这些指令后的 rows，用来与服务端整表下发（table.update()）的结果比较。
+    """
+
+    def __init__(self, client, table):
+        self.table = table
+        self.snapshot = self.server_rows()
+        self.scripts = []
+        original = client.run_javascript
+
+        def run_javascript(code, *args, **kwargs):
+            if f'mounted_app.elements[{table.id}].props.rows' in code:
+                self.scripts.append(code)
+            return original(code, *args, **kwargs)
+
+        client.run_javascript = run_javascript
+
+    def server_rows(self) -> list:
+        """服务端当前 rows 经 JSON 往返后的结果，即整表刷新时浏览器会收到的数据"""
+        return json.loads(json.dumps(self.table.rows))
+
+    def client_rows(self) -> list:
+        node = shutil.which('node')
+        if node is None:
+            pytest.skip('重放客户端 JS 需要 node')
+        program = (
+            f'const mounted_app = {{elements: {{{self.table.id}: {{props: {{rows: {json.dumps(self.snapshot)}}}}}}}}};\n'
+            + ';\n'.join(self.scripts)
+            + f';\nprocess.stdout.write(JSON.stringify(mounted_app.elements[{self.table.id}].props.rows));\n'
+        )
+        result = subprocess.run([node], input=program, capture_output=True, text=True, check=True)
+        return json.loads(result.stdout)
+
+
+@pytest.fixture
+async def columnar(stub, monkeypatch):
+    """换上一个已完成全量装载、带列式缓存的汇总聚合器，本地分页 / 筛选由它接管"""
+    aggregator = SummaryAggregator(data_service._fetch_summary_chunk, SUMMARY_CONFIG, TREND_CONFIG['EVENT_FIELDS'],
+                                   columnar=True, fetch_counts=data_service._cached_status_counts)
+    await aggregator.refresh()
+    await aggregator._rebuild_task
+    monkeypatch.setattr(data_service, '_summary_aggregator', aggregator)
+    stub.reset_counters()
+    return aggregator
+
+
+@pytest.fixture
+def record_table_js():
+    return TableJSRecorder
@@ -0,0 +1,51 @@
+"""详情页自动刷新：ETag 条件请求与 limit=1 总数探测。"""
+
+import pytest
+
+from app.config.constants import AUTO_REFRESH_CONFIG, LAYOUT_CONFIG
+from app.services import backend_api, data_service
+
+
+@pytest.fixture
+def fresh_record(stub):
+    record = dict(stub.by_status['pending_review'][1], id='fresh-record')
+    yield record
+    stub.remove(record['id'])
+
+
+@pytest.fixture(autouse=True)
+def no_shared_window(monkeypatch):
+    # 每次刷新都要真正确认上游，不复用其他标签页刚确认过的结果
+    monkeypatch.setitem(AUTO_REFRESH_CONFIG, 'SHARED_WINDOW', 0)
+
+
+async def test_etag_refresh_returns_cached_rows_on_304(stub, fresh_record):
+    stub.etag = True
+    first = await data_service.get_cleaned_data_async(1, '待审核')
+    assert backend_api.conditional_requests_supported() is True
+
+    stub.reset_counters()
+    again = await data_service.refresh_page_async(1, '待审核')
+    assert again == first
+    assert stub.counters() == {'requests': 1, 'errors': 0, 'not_modified': 1}
+
+    stub.insert(fresh_record)
+    changed = await data_service.refresh_page_async(1, '待审核')
+    assert changed['rows'][0]['id'] == 'fresh-record'
+    assert changed['total'] == first['total'] + 1
+
+
+async def test_total_probe_skips_full_fetch_when_unchanged(stub, fresh_record):
+    first = await data_service.get_cleaned_data_async(1, '待审核')
+    assert backend_api.conditional_requests_supported() is False
+
+    stub.reset_counters()
+    again = await data_service.refresh_page_async(1, '待审核')
+    assert again == first
+    assert [query['limit'] for _, query in stub.history] == ['1']
+
+    stub.insert(fresh_record)
+    stub.reset_counters()
+    changed = await data_service.refresh_page_async(1, '待审核')
+    assert changed['rows'][0]['id'] == 'fresh-record'
+    assert [query['limit'] for _, query in stub.history] == ['1', str(LAYOUT_CONFIG['PAGE_SIZE'])]
@@ -0,0 +1,48 @@
+"""状态统计：分组计数接口与逐状态回退两条路径。"""
+
+import pytest
+
+from app.services import backend_api
+
+
+def _expected(stub):
+    return [{'name': name, 'value': len(stub.by_status[key])} for key, name in backend_api.STATUS_NAME_MAP.items()]
+
+
+def _paths(stub):
+    return [path.rsplit('/', 1)[-1] for path, _ in stub.history]
+
+
+async def test_grouped_counts_use_single_request(stub):
+    assert await backend_api.fetch_resolutions_stats_async() == _expected(stub)
+    assert _paths(stub) == ['counts']
+    assert backend_api._grouped_counts_supported is True
+
+
+@pytest.mark.parametrize('status_code', [404, 400, 422])
+async def test_missing_counts_route_falls_back_to_per_status(stub, status_code):
+    stub.counts_status = status_code
+
+    assert await backend_api.fetch_resolutions_stats_async() == _expected(stub)
+    assert backend_api._grouped_counts_supported is False
+
+    # 探测结果被记住：之后只发逐状态的 limit=1 请求
+    stub.reset_counters()
+    assert await backend_api.fetch_resolutions_stats_async() == _expected(stub)
+    assert 'counts' not in _paths(stub)
+    assert sorted(query['status'] for _, query in stub.history) == sorted(backend_api.STATUS_NAME_MAP)
+
+
+async def test_auth_failure_is_not_treated_as_missing_route(stub):
+    stub.counts_status = 401
+
+    await backend_api.fetch_resolutions_stats_async()
+    assert backend_api._grouped_counts_supported is None
+
+
+@pytest.mark.parametrize('status_code', [200, 422])
+async def test_sync_client_follows_same_probe(stub, status_code):
+    stub.counts_status = status_code
+
+    assert backend_api.fetch_resolutions_stats() == _expected(stub)
+    assert backend_api._grouped_counts_supported is (status_code == 200)
@@ -0,0 +1,88 @@
+"""列式缓存接管读取时：自动刷新仍向上游确认并写回状态，改状态触发全量重建，按日期 / 创建人筛选；时间缺失与带时区偏移的记录。"""
+
+from collections import Counter
+from datetime import date, timedelta
+
+from app.services import data_service
+from app.services.columnar import ColumnarRecords, parse_timestamp
+
+
+def _other_status(status: str) -> str:
+    return 'published' if status != 'published' else 'rejected'
+
+
+async def test_refresh_reaches_upstream_and_writes_status_back(stub, columnar):
+    page = await data_service.get_cleaned_data_async(1)
+    assert page['rows'][0]['id'] == stub.items[0]['id']
+    assert not stub.history  # 分页直接读列式缓存
+
+    item = stub.items[0]
+    old_status, new_status = item['status'], _other_status(item['status'])
+    stub.set_status(item['id'], new_status)
+    try:
+        refreshed = await data_service.refresh_page_async(1)
+        assert stub.history
+        label = data_service.STATUS_DISPLAY_MAP[new_status]
+        assert refreshed['rows'][0]['status'] == label
+        # 写回后，本地分页与按状态过滤立即反映新状态
+        assert (await data_service.get_cleaned_data_async(1))['rows'][0]['status'] == label
+        assert any(row['id'] == item['id'] for row in data_service.filter_records(status=label)['rows'])
+    finally:
+        stub.set_status(item['id'], old_status)
+
+
+async def test_refresh_falls_back_to_local_when_upstream_fails(stub, columnar):
+    stub.error_rate = 1.0
+    result = await data_service.refresh_page_async(1)
+    assert result['rows'][0]['id'] == stub.items[0]['id']
+
+
+async def test_status_change_schedules_rebuild(stub, columnar):
+    item = stub.items[-1]  # 不在任何一页的刷新范围内，只能由计数核对发现
+    old_status = item['status']
+    stub.set_status(item['id'], _other_status(old_status))
+    try:
+        await columnar.refresh()
+        assert columnar._drift
+    finally:
+        stub.set_status(item['id'], old_status)
+
+
+async def test_filter_records_by_creator_and_date(stub, columnar):
+    creator = columnar.creator_ids()[0]
+    expected = [item for item in stub.items if str(item.get('creator_id')) == creator]
+    result = data_service.filter_records(creator=creator)
+    assert result['available'] and result['total'] == len(expected)
+
+    day = stub.items[10]['created_at'][:10]
+    next_day = (date.fromisoformat(day) + timedelta(days=1)).isoformat()
+    days = Counter(item['created_at'][:10] for item in stub.items if item.get('created_at'))
+    assert data_service.filter_records(start=day, end=next_day)['total'] == days[day]
+    assert data_service.filter_records(start=day)['total'] == sum(n for d, n in days.items() if d >= day)
+    options = data_service.get_filter_options()
+    assert options['available'] and options['creators'][creator] == creator[:8]
+
+
+def _records(*created):
+    records = ColumnarRecords()
+    for i, value in enumerate(created):  # 按上游顺序（新到旧）装载
+        records.add({'id': f'r{i}', 'status': 'pending_review', 'created_at': value})
+    records.seal()
+    return records
+
+
+def test_set_status_finds_rows_around_a_missing_created_at():
+    records = _records('2024-05-03T00:00:00', None, '2024-05-02T00:00:00', 'not a date', '2024-05-01T00:00:00')
+    for record_id in ('r0', 'r1', 'r2', 'r3', 'r4'):
+        assert records.set_status(record_id, 'published')
+    assert not records.set_status('r2', 'published') and not records.set_status('missing', 'published')
+    assert records.page(0, 10, 'published')['total'] == 5
+    assert records.page(0, 10, start=parse_timestamp('2024-05-02'))['total'] == 2
+
+
+def test_offset_timestamps_filter_in_utc_and_keep_wall_time():
+    records = _records('2024-05-02T07:30:00+08:00', '2024-05-01T23:30:00Z')
+    assert parse_timestamp('2024-05-02T07:30:00+08:00') == parse_timestamp('2024-05-01T23:30:00')
+    utc_day = records.page(0, 10, start=parse_timestamp('2024-05-01'), end=parse_timestamp('2024-05-02'))
+    assert utc_day['total'] == 2
+    assert [row['created_at'] for row in utc_day['rows']] == ['2024-05-02 07:30', '2024-05-01 23:30']
@@ -0,0 +1,102 @@
+"""详情页表格：增量推送到浏览器的行与服务端整表刷新（table.update()）的结果一致。"""
+
+import asyncio
+
+from nicegui import events, ui
+from nicegui.testing import User
+
+from app.config.constants import LAYOUT_CONFIG
+from app.services import data_service
+
+
+def _emit(user: User, element: ui.element, event: str, args) -> None:
+    """模拟浏览器发出带参数的事件（User.trigger 只能发出无参数的事件）"""
+    for listener in list(element._event_listeners.values()):
+        if listener.type == event:
+            events.handle_event(listener.handler, events.GenericEventArguments(sender=element, client=user.client, args=args))
+
+
+async def _open_details(user: User, path: str) -> ui.table:
+    await user.open(path)
+    await asyncio.sleep(0.3)  # 等待首屏加载计时器
+    return user.find(ui.table).elements.pop()
+
+
+async def _goto_page(user: User, page: int) -> None:
+    _emit(user, user.find(ui.pagination).elements.pop(), 'update:modelValue', page)
+    await asyncio.sleep(0.1)
+
+
+async def test_paged_patch_matches_full_update(stub, user: User, record_table_js):
+    table = await _open_details(user, '/details/待审核')
+    assert [row['index_id'] for row in table.rows] == list(range(1, 16))
+    recorder = record_table_js(user.client, table)
+
+    await _goto_page(user, 2)
+    assert table.rows[0]['index_id'] == 16
+    await _goto_page(user, 1)
+    assert recorder.client_rows() == recorder.server_rows()
+
+    # 再次加载同一页且数据未变化：不发送任何内容
+    sent = len(recorder.scripts)
+    await _goto_page(user, 1)
+    assert len(recorder.scripts) == sent
+
+    # 头部插入一条新记录、原地修改一条：只发送这两行与新的行顺序
+    edited = stub.by_status['pending_review'][2]
+    word = edited['word']
+    stub.insert(dict(stub.by_status['pending_review'][0], id='fresh-record'))
+    edited['word'] = '改'
+    try:
+        data_service._page_cache.invalidate()
+        await _goto_page(user, 1)
+        assert table.rows[0]['id'] == 'fresh-record'
+        assert len(recorder.scripts) == sent + 1
+        assert recorder.client_rows() == recorder.server_rows()
+    finally:
+        stub.remove('fresh-record')
+        edited['word'] = word
+
+
+async def test_virtual_scroll_renders_and_pages(stub, user: User, record_table_js, monkeypatch):
+    monkeypatch.setitem(LAYOUT_CONFIG, 'VIRTUAL_WINDOW', 50)
+    monkeypatch.setitem(LAYOUT_CONFIG, 'VIRTUAL_MAX_ROWS', 120)
+    table = await _open_details(user, '/details?view=virtual')
+    assert [row['index_id'] for row in table.rows] == list(range(1, 51))
+    assert table.rows[1]['word'] == stub.items[1]['word']
+    recorder = record_table_js(user.client, table)
+
+    async def scroll(index: int, to: int, direction: str) -> None:
+        _emit(user, table, 'virtualScroll', {'index': index, 'to': to, 'direction': direction})
+        await asyncio.sleep(0.1)
+
+    # 向下滚动：逐窗追加，超过上限后丢弃头部，始终是连续的一段
+    for _ in range(4):
+        await scroll(len(table.rows) - 20, len(table.rows) - 1, 'increase')
+    first = table.rows[0]['index_id']
+    assert len(table.rows) == 120 and first == 131
+    assert [row['index_id'] for row in table.rows] == list(range(first, first + 120))
+    await user.should_see(f'已加载 131 - 250 / {len(stub.items)} 条')
+
+    # 滚回头部：补回前一窗口并丢弃尾部
+    await scroll(0, 20, 'decrease')
+    assert [row['index_id'] for row in table.rows] == list(range(81, 201))
+    assert recorder.client_rows() == recorder.server_rows()
+
+
+async def test_filter_panel_filters_by_creator(stub, columnar, user: User):
+    table = await _open_details(user, '/details')
+    creator = columnar.creator_ids()[0]
+    expected = sum(1 for item in stub.items if str(item.get('creator_id')) == creator)
+
+    select = next(element for element in user.find(ui.select).elements if element.props.get('label') == '创建人')
+    assert creator in select.options
+    select.value = creator
+    user.find('应用').click()
+    await asyncio.sleep(0.1)
+    assert table.rows and all(row['creator_id'] == creator[:8] for row in table.rows)
+    await user.should_see(f'DATABASE TOTAL: {expected} RECORDS')
+
+    user.find('清除').click()
+    await asyncio.sleep(0.1)
+    await user.should_see(f'DATABASE TOTAL: {len(stub.items)} RECORDS')
@@ -0,0 +1,73 @@
+"""应用级统计聚合器：状态统计经共享 TTL 缓存读取。"""
+
+import asyncio
+
+from app.services import data_service
+from app.services.live_stats import StatsHub
+
+
+def _value(data, name):
+    return next(item['value'] for item in data if item['name'] == name)
+
+
+async def test_hub_reads_status_through_ttl_cache(stub, monkeypatch):
+    monkeypatch.setattr(data_service._stats_cache, 'ttl', 0.5)
+    monkeypatch.setattr(data_service._stats_cache, 'on_refresh', None)
+    reads = []
+
+    async def load_status():
+        reads.append(None)
+        return await data_service.get_status_statistics_async()
+
+    hub = StatsHub({'status': load_status}, interval=0.1, min_push_interval=0.02)
+    data_service.on_status_statistics_refreshed(hub.request_refresh)
+    pushed = []
+    hub.subscribe('client', lambda name, data: pushed.append(data))
+    record = dict(stub.by_status['draft'][0], id='fresh-draft')
+
+    async def wait_for_push(count: int) -> None:
+        for _ in range(100):
+            if len(pushed) >= count:
+                return
+            await asyncio.sleep(0.01)
+
+    try:
+        await wait_for_push(1)
+        await asyncio.sleep(0.25)
+        # 新鲜期内的多轮读取都命中缓存
+        assert len(reads) >= 3 and stub.counters()['requests'] == 1
+        assert len(pushed) == 1
+
+        # 过期后先返回旧值并后台刷新，刷新完成后立即补推，不等下一个周期
+        stub.insert(record)
+        await wait_for_push(2)
+        assert _value(pushed[-1], '草稿箱') == _value(pushed[0], '草稿箱') + 1
+        assert stub.counters()['requests'] == 2
+    finally:
+        await hub.stop()
+        stub.remove(record['id'])
+
+
+async def test_request_refresh_reloads_only_requested_dataset():
+    calls = {'status': 0, 'summary': 0}
+
+    def loader(name):
+        async def load():
+            calls[name] += 1
+            return calls[name]
+        return load
+
+    hub = StatsHub({name: loader(name) for name in calls}, interval=60, min_push_interval=0.02)
+    hub.start()
+    try:
+        await asyncio.sleep(0.05)
+        assert calls == {'status': 1, 'summary': 1}
+
+        # 限速窗口内的多次请求合并为一次
+        for _ in range(3):
+            hub.request_refresh('summary')
+        await asyncio.sleep(0.05)
+        assert calls == {'status': 1, 'summary': 2}
+        assert await hub.get('summary') == 2
+    finally:
+        await hub.stop()
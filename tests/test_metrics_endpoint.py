@@ -0,0 +1,26 @@
+"""/metrics 抓取接口与诊断页共用管理员口令。"""
+
+import pytest
+from nicegui.testing import User
+
+from app.config.constants import PROFILING_CONFIG
+
+
+@pytest.mark.parametrize('token, headers, status_code', [
+    ('', {}, 403),
+    ('', {'Authorization': 'Bearer wrong'}, 403),
+    ('', {'Authorization': 'Bearer secret'}, 200),
+    ('secret', {}, 200),
+])
+async def test_metrics_requires_admin_token(stub, user: User, monkeypatch, token, headers, status_code):
+    monkeypatch.setitem(PROFILING_CONFIG, 'ADMIN_TOKEN', 'secret')
+    response = await user.http_client.get('/metrics', params={'token': token} if token else None, headers=headers)
+    assert response.status_code == status_code
+    if status_code == 200:
+        assert '# TYPE' in response.text or response.text == ''
+
+
+async def test_metrics_closed_without_configured_token(stub, user: User, monkeypatch):
+    monkeypatch.setitem(PROFILING_CONFIG, 'ADMIN_TOKEN', '')
+    response = await user.http_client.get('/metrics', params={'token': ''})
+    assert response.status_code == 403
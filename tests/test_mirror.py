@@ -0,0 +1,98 @@
+"""本地 SQLite 镜像：gram 检索、计数漂移触发的提前全量同步与读取前的新鲜度判断。"""
+
+import time
+
+import pytest
+
+from app.config.constants import MIRROR_CONFIG
+from app.services import backend_api, data_service
+from app.services.mirror import MirrorSync, RecordMirror
+
+
+def _item(record_id: str, word: str, pinyin: str, created_at: str, status: str = 'published') -> dict:
+    return {'id': record_id, 'word': word, 'pronunciation': {'pinyin': pinyin},
+            'created_at': created_at, 'status': status}
+
+
+@pytest.fixture
+def mirror():
+    mirror = RecordMirror(':memory:')
+    mirror.upsert([
+        _item('a', '汉字', 'hàn zì', '2024-05-01T00:00:00'),
+        _item('b', '字汉', 'zì hàn', '2024-05-02T00:00:00', status='draft'),
+        _item('c', '汉语字', 'hàn yǔ zì', '2024-05-03T00:00:00'),
+    ], generation=1)
+    yield mirror
+    mirror.close()
+
+
+def _ids(items) -> list:
+    return [item['id'] for item in items]
+
+
+@pytest.mark.parametrize('grams_ready', [True, False])
+def test_search_matches_substrings_prefix_first(mirror, grams_ready):
+    mirror.grams_ready = grams_ready
+    assert _ids(mirror.search('汉字')) == ['a']
+    assert _ids(mirror.search('汉')) == ['c', 'a', 'b']
+    assert _ids(mirror.search('han')) == ['c', 'a', 'b']
+    assert _ids(mirror.search('汉', status='draft')) == ['b']
+    assert mirror.search('语汉') == []
+
+
+def test_gram_index_follows_upserts_and_purges(mirror):
+    mirror.upsert([_item('a', '词语', 'cí yǔ', '2024-05-01T00:00:00')], generation=2)
+    assert mirror.search('汉字') == []
+    assert _ids(mirror.search('词')) == ['a']
+
+    mirror.purge_before(2)
+    assert {row[0] for row in mirror._read('SELECT DISTINCT id FROM record_grams')} == {'a'}
+
+    mirror._read('DELETE FROM record_grams')
+    mirror.grams_ready = False
+    mirror.build_search_index()
+    assert _ids(mirror.search('ciyu')) == ['a']
+
+
+async def test_status_drift_triggers_early_full_sync(stub):
+    mirror = RecordMirror(':memory:')
+    sync = MirrorSync(mirror, data_service._fetch_upstream_chunk, {**MIRROR_CONFIG, 'DRIFT_SYNC_DELAY': 0},
+                      backend_api.fetch_status_counts_async)
+    upstream = lambda: {status: len(items) for status, items in stub.by_status.items()}
+
+    await sync.sync_once()
+    assert mirror.ready and mirror.lag() < 5
+    assert mirror.counts == upstream()
+
+    item = stub.by_status['pending_review'][0]
+    stub.set_status(item['id'], 'published')
+    try:
+        # 原地改状态不产生新记录：增量同步看不到，连续两轮计数不一致后才判定为漂移
+        await sync.sync_once()
+        assert not sync.drifted
+        await sync.sync_once()
+        assert sync.drifted and mirror.counts != upstream()
+
+        await sync.sync_once()
+        assert not sync.drifted
+        assert mirror.counts == upstream()
+    finally:
+        stub.set_status(item['id'], 'pending_review')
+        mirror.close()
+
+
+def test_stale_mirror_is_served_only_while_backend_is_down(monkeypatch):
+    mirror = RecordMirror(':memory:')
+    mirror.ready = True
+    monkeypatch.setattr(data_service, '_mirror', mirror)
+    monkeypatch.setattr(data_service, 'backend_circuit_open', lambda: False)
+
+    assert not data_service._mirror_serving()  # 从未同步（如重启后第一次同步尚未完成）
+    mirror.mark_synced()
+    assert data_service._mirror_serving()
+
+    mirror.synced_at = time.time() - MIRROR_CONFIG['MAX_LAG'] - 1
+    assert not data_service._mirror_serving()
+    monkeypatch.setattr(data_service, 'backend_circuit_open', lambda: True)
+    assert data_service._mirror_serving()
+    mirror.close()
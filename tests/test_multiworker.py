@@ -0,0 +1,69 @@
+"""多进程部署：汇总统计只在主导 worker 上推进，其余 worker 读取共享缓存；镜像跟随模式只读取同步状态。"""
+
+import asyncio
+import json
+
+import pytest
+
+from app.config.constants import MIRROR_CONFIG, SUMMARY_CONFIG
+from app.services import data_service
+from app.services.mirror import MirrorSync, RecordMirror
+from app.services.shared_cache import SharedCacheClient, SharedCacheServer
+from app.services.summary_stats import SummaryAggregator
+
+
+@pytest.fixture
+async def shared_cache(tmp_path, monkeypatch):
+    server = SharedCacheServer(str(tmp_path / 'cache.sock'))
+    await server.start()
+    client = SharedCacheClient(server.path)
+    monkeypatch.setattr(data_service, '_shared_cache', client)
+    monkeypatch.setattr(data_service, '_summary_published', (None, 0.0))
+    monkeypatch.setattr(data_service, '_shared_summary', {})
+    yield server
+    await client.close()
+    await server.stop()
+
+
+async def test_followers_read_summary_published_by_leader(stub, columnar, shared_cache, monkeypatch):
+    creators = await data_service.get_summary_statistics_async()
+    trend = json.loads(json.dumps(data_service._trend_series('created', 'day', 7)))
+
+    monkeypatch.setattr(data_service, '_background_leader', False)
+    stub.reset_counters()
+    assert await data_service.get_summary_statistics_async() == creators
+    assert await data_service.get_trend_series_async('created', 'day', 7) == trend
+    assert not stub.history  # 非主导 worker 不遍历上游
+
+    # 共享缓存停止后沿用上次读到的结果
+    await data_service._shared_cache.close()
+    await shared_cache.stop()
+    assert await data_service.get_summary_statistics_async() == creators
+
+
+async def test_follower_without_published_summary_reports_not_ready(shared_cache, monkeypatch):
+    monkeypatch.setattr(data_service, '_background_leader', False)
+    monkeypatch.setattr(data_service, '_summary_aggregator',
+                        SummaryAggregator(data_service._fetch_summary_chunk, SUMMARY_CONFIG))  # 非主导 worker 上从不推进
+    assert (await data_service.get_trend_series_async('reviewed', 'hour', 30))['ready'] is False
+    assert (await data_service.get_summary_statistics_async())[0]['name'] == '统计中'
+
+
+async def test_mirror_follower_reloads_state_written_by_leader(stub, tmp_path):
+    path = str(tmp_path / 'mirror.sqlite3')
+    leader, follower = RecordMirror(path), RecordMirror(path)
+    try:
+        await MirrorSync(leader, data_service._fetch_upstream_chunk, MIRROR_CONFIG).sync_once()
+        assert not follower.ready and follower.total == 0
+
+        follower.reload()
+        assert follower.ready and follower.counts == leader.counts
+        assert follower.synced_at == leader.synced_at
+    finally:
+        leader.close()
+        follower.close()
+
+
+async def test_server_stop_disconnects_open_clients(shared_cache):
+    await data_service._shared_cache.set('stats', '', [1], ttl=10)
+    await asyncio.wait_for(shared_cache.stop(), timeout=5)
@@ -0,0 +1,66 @@
+"""熔断、对冲请求与耗时预算。"""
+
+import asyncio
+import time
+
+import pytest
+
+from app.config.constants import BACKEND_CONFIG
+from app.services import backend_api, data_service
+from app.services.resilience import CircuitBreaker, LatencyBudgetExceeded, hedged
+
+
+async def test_breaker_opens_and_serves_last_good_page(stub, monkeypatch):
+    monkeypatch.setattr(backend_api, '_breaker', CircuitBreaker(failure_threshold=3, recovery_timeout=60))
+    good = await data_service.get_cleaned_data_async(1, '待审核')
+    assert good['rows']
+
+    stub.error_rate = 1
+    stale = await data_service.get_cleaned_data_async(1, '待审核', use_cache=False)
+    assert stale['rows'] == good['rows']
+    assert backend_api._breaker.state == CircuitBreaker.OPEN
+
+    # 熔断期间不再访问上游，直接返回最近一次成功的分页
+    requests = stub.counters()['requests']
+    started = time.perf_counter()
+    again = await data_service.get_cleaned_data_async(1, '待审核', use_cache=False)
+    assert again['rows'] == good['rows']
+    assert stub.counters()['requests'] == requests
+    assert time.perf_counter() - started < 0.1
+
+
+async def test_hedged_request_beats_slow_first_attempt(stub, monkeypatch):
+    monkeypatch.setitem(BACKEND_CONFIG, 'HEDGE_ENABLED', True)
+    monkeypatch.setitem(BACKEND_CONFIG, 'HEDGE_DELAY', 0.05)
+    stub.slow_every, stub.slow_ms = 2, 2000
+
+    started = time.perf_counter()
+    raw = await backend_api.fetch_resolutions_list_async(0, 15)
+    assert raw['items']
+    assert time.perf_counter() - started < 1
+    assert stub.counters()['requests'] == 2
+
+
+async def test_latency_budget_exceeded(stub, monkeypatch):
+    monkeypatch.setitem(BACKEND_CONFIG, 'LATENCY_BUDGETS', {'list': 0.2})
+    stub.latency_ms = 1000
+
+    started = time.perf_counter()
+    with pytest.raises(LatencyBudgetExceeded):
+        await backend_api._async_get(backend_api._list_params(0, 15), site='list')
+    assert time.perf_counter() - started < 0.5
+
+
+async def test_hedged_skips_cancelled_attempt():
+    calls = []
+
+    async def call():
+        calls.append(None)
+        if len(calls) == 1:
+            await asyncio.sleep(0.05)
+            raise asyncio.CancelledError  # 首个请求在对冲请求完成前被取消
+        await asyncio.sleep(0.1)
+        return 'ok'
+
+    assert await hedged(call, delay=0.01) == 'ok'
+    assert len(calls) == 2
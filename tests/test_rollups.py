@@ -0,0 +1,45 @@
+"""趋势预分桶：时间轴只随有数据的桶增长，带时区偏移的时间换算到 UTC 后分桶。"""
+
+from app.services.rollups import GRANULARITY_MS, TrendRollup
+
+HOUR = GRANULARITY_MS['hour']
+
+
+def _rollup(*timestamps):
+    rollup = TrendRollup()
+    for value in timestamps:
+        rollup.add({'status': 'approved', 'created_at': value})
+    return rollup
+
+
+def test_series_fills_gaps_with_edge_zeros():
+    rollup = _rollup('2024-05-01T00:10:00', '2024-05-01T01:20:00', '2024-05-01T06:00:00')
+    points = rollup.series('created', 'hour')['approved']
+    start = points[0][0]
+    assert points == [[start, 1], [start + HOUR, 1], [start + 2 * HOUR, 0], [start + 5 * HOUR, 0],
+                      [start + 6 * HOUR, 1]]
+
+
+def test_series_ignores_empty_span_from_outliers():
+    rollup = _rollup('1970-01-02T00:00:00', '2024-05-01T00:00:00', '2099-12-31T23:00:00')
+    points = rollup.series('created', 'hour')['approved']
+    assert len(points) <= 3 * 3
+    assert sum(count for _, count in points) == 3
+
+
+def test_series_since_starts_at_aligned_bucket():
+    rollup = _rollup('2024-04-01T00:00:00', '2024-05-01T12:00:00')
+    first = rollup.series('created', 'hour')['approved'][0][0]
+    since = first + 100 * HOUR + 1234
+    points = rollup.series('created', 'hour', since)['approved']
+    assert points[0] == [first + 100 * HOUR, 0]
+    assert points[-1][1] == 1
+    assert len(points) == 3
+    assert rollup.series('created', 'hour', points[-1][0] + HOUR) == {}
+
+
+def test_offset_timestamps_are_bucketed_in_utc():
+    rollup = _rollup('2024-05-01T07:30:00+08:00', '2024-04-30T23:10:00Z', '2024-04-30T18:40:00.123-05:00')
+    points = rollup.series('created', 'hour')['approved']
+    assert points == [[points[0][0], 3]]
+    assert rollup.series('created', 'day')['approved'] == [[points[0][0] - 23 * HOUR, 3]]
@@ -0,0 +1,50 @@
+"""词条检索：本地索引的写入范围与后端 search 参数的降级。"""
+
+from app.config.constants import BACKEND_CONFIG
+from app.services import data_service
+
+
+async def test_export_reads_do_not_fill_search_index(stub):
+    rows = []
+    async for chunk, _ in data_service.iter_cleaned_records(chunk_size=200):
+        rows.extend(chunk)
+    assert len(rows) == len(stub.items)
+    assert len(data_service._search_index) == 0
+
+    page = await data_service.get_cleaned_data_async(1)
+    assert len(data_service._search_index) == len(page['rows'])
+
+
+async def test_ignored_search_param_demotes_for_a_while(stub, monkeypatch):
+    word = stub.items[1]['word']
+    ignored = {'flag': True}
+    original = stub._respond
+
+    def respond(path, query):
+        # 模拟忽略 search 参数的后端：原样返回未过滤的列表
+        if ignored['flag']:
+            query = {k: v for k, v in query.items() if k != 'search'}
+        return original(path, query)
+
+    monkeypatch.setattr(stub, '_respond', respond)
+    await data_service.get_cleaned_data_async(1)
+
+    def searched() -> int:
+        return sum(1 for _, query in stub.history if 'search' in query)
+
+    # 未达到阈值前每次都会再次尝试后端
+    for _ in range(BACKEND_CONFIG['SEARCH_DEMOTE_AFTER']):
+        result = await data_service.search_records_async(word)
+        assert result['source'] == 'local' and result['rows']
+    assert searched() == BACKEND_CONFIG['SEARCH_DEMOTE_AFTER']
+
+    # 降级期内只查本地索引
+    await data_service.search_records_async(word)
+    assert searched() == BACKEND_CONFIG['SEARCH_DEMOTE_AFTER']
+
+    # 降级到期后重新尝试后端，后端恢复正常时继续使用后端结果
+    ignored['flag'] = False
+    monkeypatch.setattr(data_service, '_backend_search_demoted_until', 0.0)
+    result = await data_service.search_records_async(word)
+    assert result['source'] == 'backend'
+    assert searched() == BACKEND_CONFIG['SEARCH_DEMOTE_AFTER'] + 1
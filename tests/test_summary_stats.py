@@ -0,0 +1,22 @@
+"""系统日志卡片：按创建人的汇总统计。"""
+
+from collections import Counter
+
+from app.config.constants import SUMMARY_CONFIG
+from app.services import data_service
+from app.services.summary_stats import SummaryAggregator
+
+
+async def test_creator_distribution_matches_records(stub):
+    aggregator = SummaryAggregator(data_service._fetch_upstream_chunk, {**SUMMARY_CONFIG, 'TOP_CREATORS': 3})
+    assert aggregator.creator_distribution() == [{'value': 0, 'name': '统计中'}]
+    await aggregator.refresh()
+    await aggregator._rebuild_task
+
+    expected = Counter(str(item['creator_id'])[:8] if item.get('creator_id') else 'system' for item in stub.items)
+    distribution = aggregator.creator_distribution()
+    top = distribution[:3]
+    assert [item['value'] for item in top] == sorted(expected.values(), reverse=True)[:3]
+    assert all(expected[item['name']] == item['value'] for item in top)
+    assert distribution[3] == {'value': len(stub.items) - sum(item['value'] for item in top), 'name': '其他'}
+    assert [creator[:8] for creator in aggregator.creator_ids()[:2]] == [item['name'] for item in top[1:]]